@@ -1,24 +1,63 @@
+# Blocklist Imports
+from brutils.blocklist import Blocklist
+
 # CEP Imports
 from brutils.cep import (
+    CEPCache,
+    ViaCEPClient,
+    aget_address_from_cep,
+    aget_cep_information_from_address,
     format_cep,
     get_address_from_cep,
+    get_addresses_from_ceps,
     get_cep_information_from_address,
+    get_uf,
+    get_uf_many,
 )
 from brutils.cep import generate as generate_cep
 from brutils.cep import is_valid as is_valid_cep
 from brutils.cep import remove_symbols as remove_symbols_cep
 
 # CNPJ Imports
-from brutils.cnpj import format_cnpj
+from brutils.cnpj import (
+    CNPJIndex,
+    format_cnpj,
+    mask_cnpj,
+    mask_cnpj_many,
+    parse_cnpj,
+    read_establishments,
+)
 from brutils.cnpj import generate as generate_cnpj
+from brutils.cnpj import generate_branches as generate_branches_cnpj
 from brutils.cnpj import is_valid as is_valid_cnpj
+from brutils.cnpj import is_valid_int_many as is_valid_int_many_cnpj
+from brutils.cnpj import is_valid_many as is_valid_many_cnpj
+from brutils.cnpj import normalize_int_many as normalize_int_many_cnpj
 from brutils.cnpj import remove_symbols as remove_symbols_cnpj
+from brutils.cnpj import suggest_corrections as suggest_corrections_cnpj
 
 # CPF Imports
-from brutils.cpf import format_cpf
+from brutils.cpf import (
+    CPFArray,
+    format_cpf,
+    mask_cpf,
+    mask_cpf_many,
+    parse_cpf,
+)
+from brutils.cpf import count_by_fiscal_region as count_by_fiscal_region_cpf
 from brutils.cpf import generate as generate_cpf
+from brutils.cpf import generate_many as generate_many_cpf
+from brutils.cpf import get_fiscal_region as get_fiscal_region_cpf
 from brutils.cpf import is_valid as is_valid_cpf
+from brutils.cpf import is_valid_int_many as is_valid_int_many_cpf
+from brutils.cpf import is_valid_many as is_valid_many_cpf
+from brutils.cpf import iter_valid as iter_valid_cpf
+from brutils.cpf import normalize_int_many as normalize_int_many_cpf
+from brutils.cpf import pseudonymize as pseudonymize_cpf
+from brutils.cpf import pseudonymize_many as pseudonymize_many_cpf
 from brutils.cpf import remove_symbols as remove_symbols_cpf
+from brutils.cpf import shard_bases as shard_bases_cpf
+from brutils.cpf import suggest_corrections as suggest_corrections_cpf
 
 # Currency
 from brutils.currency import convert_real_to_text, format_currency
@@ -26,6 +65,9 @@ from brutils.currency import convert_real_to_text, format_currency
 # Date Utils Import
 from brutils.date_utils import convert_date_to_text, is_holiday
 
+# Document Imports
+from brutils.document import classify_document, classify_document_many
+
 # Email Import
 from brutils.email import is_valid as is_valid_email
 
@@ -71,6 +113,9 @@ from brutils.pis import generate as generate_pis
 from brutils.pis import is_valid as is_valid_pis
 from brutils.pis import remove_symbols as remove_symbols_pis
 
+# Stream Imports
+from brutils.stream import clean_column
+
 # Voter ID Imports
 from brutils.voter_id import format_voter_id
 from brutils.voter_id import generate as generate_voter_id
@@ -79,22 +124,56 @@ from brutils.voter_id import is_valid as is_valid_voter_id
 # Defining __all__ to expose the public methods
 __all__ = [
     # CEP
+    "CEPCache",
+    "ViaCEPClient",
     "format_cep",
     "get_address_from_cep",
     "get_cep_information_from_address",
+    "aget_address_from_cep",
+    "aget_cep_information_from_address",
+    "get_addresses_from_ceps",
+    "get_uf",
+    "get_uf_many",
     "generate_cep",
     "is_valid_cep",
     "remove_symbols_cep",
+    # Blocklist
+    "Blocklist",
     # CNPJ
+    "CNPJIndex",
     "format_cnpj",
     "generate_cnpj",
+    "generate_branches_cnpj",
     "is_valid_cnpj",
+    "is_valid_int_many_cnpj",
+    "is_valid_many_cnpj",
+    "normalize_int_many_cnpj",
+    "mask_cnpj",
+    "mask_cnpj_many",
+    "parse_cnpj",
+    "read_establishments",
     "remove_symbols_cnpj",
+    "suggest_corrections_cnpj",
     # CPF
+    "CPFArray",
     "format_cpf",
     "generate_cpf",
+    "generate_many_cpf",
+    "iter_valid_cpf",
+    "is_valid_int_many_cpf",
+    "normalize_int_many_cpf",
+    "shard_bases_cpf",
+    "get_fiscal_region_cpf",
+    "count_by_fiscal_region_cpf",
     "is_valid_cpf",
+    "is_valid_many_cpf",
+    "mask_cpf",
+    "mask_cpf_many",
+    "parse_cpf",
+    "pseudonymize_cpf",
+    "pseudonymize_many_cpf",
     "remove_symbols_cpf",
+    "suggest_corrections_cpf",
     # Email
     "is_valid_email",
     # Legal Process
@@ -120,6 +199,8 @@ __all__ = [
     "generate_pis",
     "is_valid_pis",
     "remove_symbols_pis",
+    # Stream
+    "clean_column",
     # Voter ID
     "format_voter_id",
     "generate_voter_id",
@@ -136,4 +217,7 @@ __all__ = [
     # Currency
     "format_currency",
     "convert_real_to_text",
+    # Document
+    "classify_document",
+    "classify_document_many",
 ]
@@ -0,0 +1,158 @@
+from operator import mul
+
+# Maps each ASCII byte to its numeric value, so that b"0".."9" become 0..9.
+# Any other byte maps to 0; callers must make sure the input only holds
+# digits before computing check digits.
+DIGIT_VALUES = bytes(
+    byte - 48 if 48 <= byte <= 57 else 0 for byte in range(256)
+)
+
+# Maps each ASCII byte to its value in alphanumeric documents, the ASCII code
+# minus 48, so that b"0".."9" become 0..9 and b"A".."Z" become 17..42. Any
+# other byte maps to 0.
+ALPHANUMERIC_VALUES = bytes(
+    byte - 48 if 48 <= byte <= 57 or 65 <= byte <= 90 else 0
+    for byte in range(256)
+)
+
+# Maps the remainder of a weighted sum divided by 11 to its check digit.
+CHECK_DIGITS = bytes(
+    0 if remainder < 2 else 11 - remainder for remainder in range(11)
+)
+
+# The 10 possible endings of a document whose last base digit weighs 2 for
+# the first check digit and 3 for the second one, like CPF and CNPJ: that
+# digit followed by both check digits. They are indexed by the weighted sums
+# of the preceding base characters, modulo 11, with the pair (first, second)
+# at index 11 * first + second.
+ENDINGS = tuple(
+    tuple(
+        f"{digit}{check}"
+        f"{CHECK_DIGITS[(second + 3 * digit + 2 * check) % 11]}"
+        for digit in range(10)
+        for check in (CHECK_DIGITS[(first + 2 * digit) % 11],)
+    )
+    for first in range(11)
+    for second in range(11)
+)
+
+# Pairs of digits next to each other on a numeric keypad, which are easily
+# hit by mistake when typing.
+_KEYPAD_NEIGHBORS = (
+    (7, 8), (8, 9), (4, 5), (5, 6), (1, 2), (2, 3),
+    (7, 4), (4, 1), (8, 5), (5, 2), (9, 6), (6, 3), (1, 0), (2, 0),
+)  # fmt: skip
+
+# Pairs of characters that look alike when handwritten or misheard, by their
+# values: digits, then digits and the letters of alphanumeric documents that
+# resemble them (O, I, Z, S, G and B).
+_LOOKALIKE_CHARACTERS = (
+    (1, 7), (3, 8), (5, 6), (6, 8), (0, 8), (4, 9), (6, 9),
+    (0, 31), (1, 25), (2, 42), (5, 35), (6, 23), (8, 18),
+)  # fmt: skip
+
+# How likely it is to type one character instead of another, lower being more
+# likely, by the unordered pair of their values, to rank typo-repair
+# suggestions: 1 for keypad neighbors and 2 for lookalike characters. Any
+# other substitution costs 3, and swapped characters cost 0.
+SUBSTITUTION_COSTS = {
+    frozenset(pair): cost
+    for cost, pairs in ((2, _LOOKALIKE_CHARACTERS), (1, _KEYPAD_NEIGHBORS))
+    for pair in pairs
+}
+
+
+class Mod11:
+    """
+    Weighted modulo 11 check digit scheme, shared by CPF, CNPJ and PIS.
+
+    Each check digit is the weighted sum of the digits before it, modulo 11,
+    where a remainder lower than 2 becomes 0 and any other remainder `r`
+    becomes `11 - r`. Inputs are ASCII bytes, which are converted to digit
+    values in a single `bytes.translate` pass through a precomputed table.
+
+    Args:
+        *weights (tuple[int, ...]): The weights of each check digit, in order.
+            The weights of a check digit cover the base number plus any check
+            digits computed before it.
+        values (bytes, optional): The table mapping each ASCII byte to its
+            value. Defaults to `DIGIT_VALUES`; documents that may hold
+            letters use `ALPHANUMERIC_VALUES`.
+
+    Example:
+        >>> pis = Mod11((3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+        >>> pis.check_digits(b"1234567890")
+        '0'
+        >>> pis.is_valid(b"12345678900")
+        True
+    """
+
+    __slots__ = ("weights", "values")
+
+    def __init__(self, *weights, values=DIGIT_VALUES):  # type: (tuple[int, ...], bytes) -> None
+        self.weights = weights
+        self.values = values
+
+    def digit(self, document, index):  # type: (bytes, int) -> int
+        """
+        Computes a single check digit of the given document.
+
+        Args:
+            document (bytes): The ASCII characters preceding the check
+                digit. Any extra trailing characters are ignored.
+            index (int): The index of the check digit, 0 for the first one.
+
+        Returns:
+            int: The check digit.
+        """
+
+        values = document.translate(self.values)
+
+        return CHECK_DIGITS[sum(map(mul, values, self.weights[index])) % 11]
+
+    def check_digits(self, base):  # type: (bytes) -> str
+        """
+        Computes all check digits for the given base number.
+
+        Args:
+            base (bytes): The ASCII characters of the base number.
+
+        Returns:
+            str: The check digits, in order.
+        """
+
+        values = bytearray(base.translate(self.values))
+        start = len(values)
+
+        for weights in self.weights:
+            values.append(CHECK_DIGITS[sum(map(mul, values, weights)) % 11])
+
+        return "".join(map(str, values[start:]))
+
+    def is_valid(self, document):  # type: (bytes) -> bool
+        """
+        Checks whether the trailing check digits of a document match its
+        base number.
+
+        The document must only hold characters of the value table and have
+        the full length of the scheme; this method does not check that.
+
+        Args:
+            document (bytes): The ASCII characters of the whole document.
+
+        Returns:
+            bool: True if every check digit matches, False otherwise.
+        """
+
+        values = document.translate(self.values)
+        position = len(values) - len(self.weights)
+
+        for weights in self.weights:
+            digit = CHECK_DIGITS[sum(map(mul, values, weights)) % 11]
+
+            if digit != values[position]:
+                return False
+
+            position += 1
+
+        return True
@@ -0,0 +1,68 @@
+from array import array
+from heapq import merge
+
+# Number of keys sorted at a time. Only the keys of the current chunk are
+# held as Python integers, the others are kept packed in arrays.
+_CHUNK_SIZE = 1 << 16
+
+
+class SortedKeyBuilder:
+    """
+    Collects unsigned 64-bit integer keys into a sorted `array("Q")` without
+    duplicates, keeping memory close to the 8 bytes per key of the result.
+
+    The keys are gathered in chunks, each one sorted into its own array when
+    it is full, and the chunks are merged at the end, dropping duplicates in
+    the same linear pass. Unlike building a `set` and sorting it, at no point
+    are all the keys held as Python integers.
+
+    Example:
+        >>> builder = SortedKeyBuilder()
+        >>> for key in (3, 1, 3, 2):
+        ...     builder.add(key)
+        >>> builder.build()
+        array('Q', [1, 2, 3])
+    """
+
+    __slots__ = ("_chunk", "_chunks")
+
+    def __init__(self):  # type: () -> None
+        self._chunk = array("Q")
+        self._chunks = []
+
+    def add(self, key):  # type: (int) -> None
+        """
+        Adds a key.
+
+        Args:
+            key (int): The key, between 0 and 2**64 - 1.
+        """
+
+        self._chunk.append(key)
+
+        if len(self._chunk) == _CHUNK_SIZE:
+            self._chunks.append(array("Q", sorted(self._chunk)))
+            self._chunk = array("Q")
+
+    def build(self):  # type: () -> array
+        """
+        Sorts and deduplicates the added keys.
+
+        Returns:
+            array: The distinct keys, in ascending order.
+        """
+
+        self._chunks.append(array("Q", sorted(self._chunk)))
+        self._chunk = array("Q")
+        keys = array("Q")
+        append = keys.append
+        previous = None
+
+        for key in merge(*self._chunks):
+            if key != previous:
+                append(key)
+                previous = key
+
+        self._chunks = []
+
+        return keys
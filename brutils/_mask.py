@@ -0,0 +1,104 @@
+from itertools import groupby
+
+
+class MaskTemplate:
+    """
+    Masks digit strings according to a display layout, keeping only some of
+    its digit segments visible.
+
+    The masked output is built from a preallocated bytes template in which
+    the hidden digits are already replaced by the mask character. Applying
+    the template to a buffer of many records copies each visible digit
+    column with a single extended slice assignment, so the cost per record
+    stays in C.
+
+    Args:
+        layout (str): The display layout, with one "#" per digit, e.g.
+            "###.###.###-##". Each run of "#" is a segment.
+        visible (Iterable[int]): The indexes of the segments to keep visible.
+        mask (str): The single ASCII character that replaces hidden digits.
+
+    Raises:
+        ValueError: If a segment index is out of range or the mask is not a
+            single ASCII character.
+
+    Example:
+        >>> MaskTemplate("###.###.###-##", (1, 2), "*").apply(b"82178537464")
+        ['***.785.374-**']
+    """
+
+    __slots__ = ("digit_count", "size", "template", "columns")
+
+    def __init__(self, layout, visible, mask):  # type: (str, Iterable[int], str) -> None
+        if len(mask) != 1 or not mask.isascii():
+            raise ValueError("The mask must be a single ASCII character.")
+
+        segments = []
+        position = 0
+
+        for is_digit, chars in groupby(layout, lambda char: char == "#"):
+            length = len(list(chars))
+
+            if is_digit:
+                segments.append((position, length))
+
+            position += length
+
+        visible = set(visible)
+
+        if not visible <= set(range(len(segments))):
+            raise ValueError(
+                f"The visible segments must be between 0 and "
+                f"{len(segments) - 1}."
+            )
+
+        template = layout
+        columns = []
+        digit = 0
+
+        for index, (position, length) in enumerate(segments):
+            if index in visible:
+                columns.extend(
+                    zip(
+                        range(digit, digit + length),
+                        range(position, position + length),
+                    )
+                )
+            else:
+                template = (
+                    template[:position]
+                    + mask * length
+                    + template[position + length :]
+                )
+
+            digit += length
+
+        self.digit_count = digit
+        self.size = len(layout)
+        self.template = template.encode()
+        self.columns = tuple(columns)
+
+    def apply(self, buffer):  # type: (bytes) -> list[str]
+        """
+        Masks every record of a buffer.
+
+        Args:
+            buffer (bytes): The ASCII digits of the records, back to back,
+                each one with as many digits as the layout.
+
+        Returns:
+            list[str]: The masked records, in order.
+        """
+
+        count = len(buffer) // self.digit_count
+        size = self.size
+        output = bytearray(self.template * count)
+
+        for digit, position in self.columns:
+            output[position::size] = buffer[digit :: self.digit_count]
+
+        text = output.decode()
+
+        return [
+            text[start : start + size] for start in range(0, len(text), size)
+        ]
@@ -0,0 +1,299 @@
+from array import array
+from bisect import bisect_left
+from math import ceil, log
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from sys import byteorder
+
+from brutils._keys import SortedKeyBuilder
+from brutils.cnpj import is_valid as is_valid_cnpj
+from brutils.cnpj import remove_symbols
+from brutils.cpf import is_valid as is_valid_cpf
+
+# Header of a saved blocklist: magic bytes, format version, number of hash
+# functions, number of bits of the Bloom filter and number of documents.
+_HEADER = Struct("<4sBB2xQQ")
+_MAGIC = b"BRBL"
+_VERSION = 1
+
+# Added to the integer value of a CPF, as if a "1" was prepended to its
+# digits, so that CPFs map to keys between 10**11 and 2 * 10**11.
+_CPF_OFFSET = 10**11
+
+# Set on the keys of CNPJs, which are the base 36 values of their 12 base
+# characters, below 36**12 < 2**63, so that they never collide with CPFs.
+_CNPJ_TAG = 1 << 63
+
+# Odd 64-bit multiplier spreading the keys over the bits of the hash.
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+class Blocklist:
+    """
+    A compact, read-only set of CPFs and CNPJs, for membership checks
+    against large blocklists.
+
+    Documents are normalized with `remove_symbols` and stored as 64-bit
+    integer keys in a sorted array, numeric and alphanumeric CNPJs alike,
+    using 8 bytes per document instead of a `str` object. A Bloom filter in
+    front of the array answers most lookups of documents that are not in the
+    blocklist without touching it, and the ones that pass the filter are
+    confirmed exactly by binary search.
+
+    A blocklist can be saved to a file and loaded back memory-mapped and
+    read-only, so that many worker processes share the same pages instead of
+    holding a copy each.
+
+    Args:
+        documents (Iterable[str], optional): The CPFs and CNPJs to block,
+            with or without symbols. Their check digits must be valid.
+        false_positive_rate (float, optional): The target rate of lookups
+            that pass the Bloom filter without being in the blocklist.
+            Defaults to 0.01.
+
+    Raises:
+        ValueError: If a document is neither a valid CPF nor a valid CNPJ, or
+            if the false positive rate is not between 0 and 1.
+
+    Example:
+        >>> blocklist = Blocklist(
+        ...     ["821.785.374-64", "01.838.723/0001-27", "12.ABC.345/01DE-35"]
+        ... )
+        >>> "82178537464" in blocklist
+        True
+        >>> blocklist.contains_many(["01838723000127", "12ABC34501DE35"])
+        [True, True]
+        >>> blocklist.save("blocklist.bin")
+        >>> with Blocklist.load("blocklist.bin") as shared:
+        ...     "821.785.374-64" in shared
+        True
+    """
+
+    __slots__ = ("_bits", "_bit_mask", "_hash_count", "_keys", "_mmap")
+
+    def __init__(self, documents=(), false_positive_rate=0.01):  # type: (Iterable[str], float) -> None
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("The false positive rate must be between 0 and 1.")
+
+        builder = SortedKeyBuilder()
+
+        for document in documents:
+            key = _key(document)
+
+            if key is None:
+                raise ValueError(f"Invalid document: {document!r}")
+
+            builder.add(key)
+
+        keys = builder.build()
+
+        # Optimal Bloom filter size for the target rate, rounded up to a
+        # power of two so that bit positions are computed with a mask.
+        optimal_bits = -len(keys) * log(false_positive_rate) / log(2) ** 2
+        bit_count = max(64, 1 << (ceil(optimal_bits) - 1).bit_length())
+        hash_count = max(1, round(-log(false_positive_rate) / log(2)))
+
+        self._bits = bytearray(bit_count // 8)
+        self._bit_mask = bit_count - 1
+        self._hash_count = hash_count
+        self._keys = keys
+        self._mmap = None
+
+        bits = self._bits
+
+        for key in self._keys:
+            for position in self._positions(key):
+                bits[position >> 3] |= 1 << (position & 7)
+
+    @classmethod
+    def load(cls, path):  # type: (str | os.PathLike) -> Blocklist
+        """
+        Loads a blocklist saved with `save`, memory-mapping the file
+        read-only.
+
+        The file is not read into memory: its pages are loaded on demand and
+        shared by every process that loads the same file. Call `close`, or
+        use the blocklist as a context manager, to release the mapping.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Returns:
+            Blocklist: The loaded blocklist.
+
+        Raises:
+            ValueError: If the file is not a saved blocklist.
+        """
+
+        with open(path, "rb") as file:
+            mapping = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        view = memoryview(mapping)
+        header = (
+            _HEADER.unpack_from(view) if len(view) >= _HEADER.size else None
+        )
+
+        if header is not None:
+            magic, version, hash_count, bit_count, key_count = header
+            keys_start = _HEADER.size + bit_count // 8
+
+        if (
+            header is None
+            or magic != _MAGIC
+            or version != _VERSION
+            or len(view) != keys_start + 8 * key_count
+        ):
+            view.release()
+            mapping.close()
+            raise ValueError(f"Not a saved blocklist: {path!r}")
+
+        blocklist = cls.__new__(cls)
+        blocklist._bits = view[_HEADER.size : keys_start]
+        blocklist._bit_mask = bit_count - 1
+        blocklist._hash_count = hash_count
+        blocklist._keys = view[keys_start:].cast("Q")
+        blocklist._mmap = mapping
+
+        if byteorder == "big":
+            keys = array("Q", blocklist._keys)
+            keys.byteswap()
+            blocklist._keys = keys
+
+        view.release()
+
+        return blocklist
+
+    def __len__(self):  # type: () -> int
+        return len(self._keys)
+
+    def __contains__(self, document):  # type: (object) -> bool
+        key = _key(document)
+
+        if key is None:
+            return False
+
+        bits = self._bits
+
+        for position in self._positions(key):
+            if not bits[position >> 3] >> (position & 7) & 1:
+                return False
+
+        keys = self._keys
+        index = bisect_left(keys, key)
+
+        return index < len(keys) and keys[index] == key
+
+    def __enter__(self):  # type: () -> Blocklist
+        return self
+
+    def __exit__(self, *exc_info):  # type: (object) -> None
+        self.close()
+
+    @property
+    def nbytes(self):  # type: () -> int
+        """
+        The number of bytes used to store the Bloom filter and the keys.
+        """
+
+        return len(self._bits) + len(self._keys) * 8
+
+    def contains_many(self, documents):  # type: (Iterable[object]) -> list[bool]
+        """
+        Checks many documents at once, returning a boolean mask.
+
+        Args:
+            documents (Iterable[object]): The documents to look up.
+
+        Returns:
+            list[bool]: Whether each document is in the blocklist, in order.
+        """
+
+        return list(map(self.__contains__, documents))
+
+    def save(self, path):  # type: (str | os.PathLike) -> None
+        """
+        Saves the blocklist to a file, to be loaded with `load`.
+
+        The file holds a small header, followed by the bytes of the Bloom
+        filter and by the sorted keys as little-endian 64-bit integers.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+        """
+
+        keys = array("Q", self._keys)
+
+        if byteorder == "big":
+            keys.byteswap()
+
+        with open(path, "wb") as file:
+            file.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _VERSION,
+                    self._hash_count,
+                    self._bit_mask + 1,
+                    len(keys),
+                )
+            )
+            file.write(self._bits)
+            keys.tofile(file)
+
+    def close(self):  # type: () -> None
+        """
+        Releases the memory mapping of a loaded blocklist. The blocklist
+        cannot be used afterwards. Does nothing for blocklists built in
+        memory.
+        """
+
+        if self._mmap is None:
+            return
+
+        if isinstance(self._keys, memoryview):
+            self._keys.release()
+
+        self._bits.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def _positions(self, key):  # type: (int) -> Iterator[int]
+        """
+        Computes the bit positions of a key in the Bloom filter, by double
+        hashing the two halves of its 64-bit multiplicative hash. Both the
+        construction and the lookups go through it, so they always agree.
+        """
+
+        digest = key * _HASH_MULTIPLIER & 0xFFFFFFFFFFFFFFFF
+        position = digest >> 32
+        step = digest & 0xFFFFFFFF | 1
+        mask = self._bit_mask
+
+        for _ in range(self._hash_count):
+            yield position & mask
+            position += step
+
+
+def _key(document):  # type: (object) -> int | None
+    """
+    Computes the integer key of a CPF or CNPJ.
+
+    Args:
+        document (object): The document, with or without symbols.
+
+    Returns:
+        int | None: The key, or None if the document is neither a valid CPF
+        nor a valid CNPJ.
+    """
+
+    if not isinstance(document, str):
+        return None
+
+    digits = remove_symbols(document)
+
+    if len(digits) == 11:
+        return _CPF_OFFSET + int(digits) if is_valid_cpf(digits) else None
+
+    if len(digits) != 14 or not is_valid_cnpj(digits):
+        return None
+
+    return _CNPJ_TAG | int(digits[:12], 36)
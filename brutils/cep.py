@@ -1,12 +1,38 @@
-from json import loads
+from array import array
+from asyncio import open_connection, wait_for
+from bisect import bisect_right
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache, partial
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from json import load, loads
+from os import path
+from queue import Empty, Full, LifoQueue
 from random import randint
+from threading import Lock
+from time import monotonic, sleep
 from unicodedata import normalize
+from urllib.parse import urlsplit
 from urllib.request import urlopen
 
 from brutils.data.enums import UF
 from brutils.exceptions import CEPNotFound, InvalidCEP
 from brutils.schemas import Address
 
+# Base URL of the ViaCEP API, to which the lookup paths are appended.
+_VIACEP_URL = "https://viacep.com.br/ws/"
+
+# Statistics of a `CEPCache`, like the ones of `functools.lru_cache`.
+CEPCacheInfo = namedtuple(
+    "CEPCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+# Official Correios CEP ranges of each UF, bundled with the package.
+_CEP_RANGES_FILE = path.join(
+    path.dirname(path.abspath(__file__)), "data", "cep_ranges.json"
+)
+
 # FORMATTING
 ############
 
@@ -112,6 +138,85 @@ def generate():  # type: () -> str
     return generated_number
 
 
+def get_uf(cep):  # type: (str) -> UF | None
+    """
+    Finds the UF (Federal Unit) of a CEP (Postal Code) offline.
+
+    The UF is looked up in the official Correios CEP ranges of each UF,
+    bundled with the package, by binary search over the sorted range
+    starts. No network request is made, but the CEP is not checked to
+    exist: any CEP within a UF range is resolved to that UF.
+
+    Args:
+        cep (str): The CEP, with or without symbols.
+
+    Returns:
+        UF | None: The UF of the CEP, or None if the CEP is invalid or does
+        not fall in any UF range.
+
+    Example:
+        >>> get_uf("01310-100")
+        <UF.SP: 'São Paulo'>
+        >>> get_uf("70040010")
+        <UF.DF: 'Distrito Federal'>
+        >>> get_uf("00000000")
+        None
+    """
+
+    if not isinstance(cep, str):
+        return None
+
+    clean_cep = remove_symbols(cep)
+
+    if not is_valid(clean_cep) or not clean_cep.isascii():
+        return None
+
+    starts, ends, ufs = _cep_ranges()
+    value = int(clean_cep)
+    position = bisect_right(starts, value) - 1
+
+    if position < 0 or value > ends[position]:
+        return None
+
+    return ufs[position]
+
+
+def get_uf_many(ceps):  # type: (Iterable[str]) -> list[UF | None]
+    """
+    Finds the UFs (Federal Units) of many CEPs (Postal Codes) offline.
+
+    The result is the same as calling `get_uf` on every item, but since the
+    UF ranges start and end at round prefixes, each CEP is resolved with a
+    single dictionary lookup of its prefix instead of a binary search.
+
+    Args:
+        ceps (Iterable[str]): The CEPs, with or without symbols.
+
+    Returns:
+        list[UF | None]: The UF of each CEP, in order, or None where the CEP
+        is invalid or does not fall in any UF range.
+
+    Example:
+        >>> get_uf_many(["01310-100", "70040010", "abc"])
+        [<UF.SP: 'São Paulo'>, <UF.DF: 'Distrito Federal'>, None]
+    """
+
+    prefix_length, ufs_by_prefix = _ufs_by_prefix()
+    get = ufs_by_prefix.get
+
+    return [
+        get(clean_cep[:prefix_length])
+        if len(clean_cep) == 8 and clean_cep.isdigit() and clean_cep.isascii()
+        else None
+        for clean_cep in (
+            cep.replace(".", "").replace("-", "")
+            if isinstance(cep, str)
+            else ""
+            for cep in ceps
+        )
+    ]
+
+
 # Reference: https://viacep.com.br/
 def get_address_from_cep(cep, raise_exceptions=False):  # type: (str, bool) -> Address | None
     """
@@ -152,8 +257,6 @@ def get_address_from_cep(cep, raise_exceptions=False):  # type: (str, bool) -> A
         >>> get_address_from_cep("00000000", True)
         CEPNotFound: 00000000
     """
-    base_api_url = "https://viacep.com.br/ws/{}/json/"
-
     clean_cep = remove_symbols(cep)
     cep_is_valid = is_valid(clean_cep)
 
@@ -164,21 +267,18 @@ def get_address_from_cep(cep, raise_exceptions=False):  # type: (str, bool) -> A
         return None
 
     try:
-        with urlopen(base_api_url.format(clean_cep)) as f:
-            response = f.read()
-            data = loads(response)
-
-            if data.get("erro", False):
-                raise CEPNotFound(cep)
-
-            return Address(**loads(response))
-
+        address = _fetch_address(clean_cep)
     except Exception as e:
         if raise_exceptions:
             raise CEPNotFound(cep) from e
 
         return None
 
+    if address is None and raise_exceptions:
+        raise CEPNotFound(cep)
+
+    return address
+
 
 def get_cep_information_from_address(
     federal_unit, city, street, raise_exceptions=False
@@ -225,44 +325,1022 @@ def get_cep_information_from_address(
         >>> get_cep_information_from_address("SP", "Example", "Example", True)
         CEPNotFound: SP - Example - Example
     """
-    if federal_unit in UF.values:
-        federal_unit = UF(federal_unit).name
+    uf = _federal_unit_name(federal_unit)
 
-    if federal_unit not in UF.names:
+    if uf is None:
         if raise_exceptions:
             raise ValueError(f"Invalid UF: {federal_unit}")
 
         return None
 
-    base_api_url = "https://viacep.com.br/ws/{}/{}/{}/json/"
-
-    parsed_city = (
-        normalize("NFD", city)
-        .encode("ascii", "ignore")
-        .decode("utf-8")
-        .replace(" ", "%20")
-    )
-    parsed_street = (
-        normalize("NFD", street)
-        .encode("ascii", "ignore")
-        .decode("utf-8")
-        .replace(" ", "%20")
-    )
+    query = f"{uf} - {city} - {street}"
 
     try:
         with urlopen(
-            base_api_url.format(federal_unit, parsed_city, parsed_street)
+            f"{_VIACEP_URL}{_address_path(uf, city, street)}/json/"
         ) as f:
-            response = f.read()
-            response = loads(response)
+            return _addresses_from_response(f.read(), query)
+
+    except Exception as e:
+        if raise_exceptions:
+            raise CEPNotFound(query) from e
+
+        return None
+
+
+async def aget_address_from_cep(cep, raise_exceptions=False, timeout=10.0):  # type: (str, bool, float | None) -> Address | None
+    """
+    Fetches address information from a given CEP (Postal Code) using the
+    ViaCEP API, asynchronously.
+
+    This is the native coroutine version of `get_address_from_cep`, with the
+    same arguments, results and exceptions, plus a timeout. The request is
+    made over
+    `asyncio` streams, without blocking the event loop or using threads, so
+    thousands of lookups can be in flight at once.
+
+    Args:
+        cep (str): The CEP (Postal Code) to be used in the search.
+        raise_exceptions (bool, optional): Whether to raise exceptions when
+            the CEP is invalid or not found. Defaults to False.
+        timeout (float, optional): The maximum time, in seconds, the request
+            may take. A request that times out counts as not found. Defaults
+            to 10.0, or None for no timeout.
+
+    Raises:
+        InvalidCEP: When the input CEP is invalid.
+        CEPNotFound: When the input CEP is not found.
+
+    Returns:
+        Address | None: An Address object (TypedDict) containing the address
+        information if the CEP is found, None otherwise.
+
+    Example:
+        >>> await aget_address_from_cep("01310-200")
+        {
+            "cep": "01310-200",
+            "logradouro": "Avenida Paulista",
+            ...
+            "uf": "SP",
+            ...
+        }
+        >>> await asyncio.gather(
+        ...     *map(aget_address_from_cep, ["01310200", "abc"])
+        ... )
+        [{'cep': '01310-200', ...}, None]
+    """
 
-            if len(response) == 0:
-                raise CEPNotFound(f"{federal_unit} - {city} - {street}")
+    clean_cep = remove_symbols(cep)
+
+    if not is_valid(clean_cep):
+        if raise_exceptions:
+            raise InvalidCEP(cep)
+
+        return None
+
+    try:
+        address = _address_from_response(
+            await _aget(f"{_VIACEP_URL}{clean_cep}/json/", timeout)
+        )
+    except Exception as e:
+        if raise_exceptions:
+            raise CEPNotFound(cep) from e
+
+        return None
+
+    if address is None and raise_exceptions:
+        raise CEPNotFound(cep)
+
+    return address
+
+
+async def aget_cep_information_from_address(
+    federal_unit, city, street, raise_exceptions=False, timeout=10.0
+):  # type: (str, str, str, bool, float | None) -> list[Address] | None
+    """
+    Fetches CEP (Postal Code) options from a given address using the ViaCEP
+    API, asynchronously.
+
+    This is the native coroutine version of
+    `get_cep_information_from_address`, with the same arguments, results and
+    exceptions, plus a timeout. The request is made over `asyncio` streams,
+    without blocking the event loop or using threads.
+
+    Args:
+        federal_unit (str): The two-letter abbreviation of the Brazilian
+            state.
+        city (str): The name of the city.
+        street (str): The name (or substring) of the street.
+        raise_exceptions (bool, optional): Whether to raise exceptions when
+            the address is invalid or not found. Defaults to False.
+        timeout (float, optional): The maximum time, in seconds, the request
+            may take. A request that times out counts as not found. Defaults
+            to 10.0, or None for no timeout.
+
+    Raises:
+        ValueError: When the input UF is invalid.
+        CEPNotFound: When the input address is not found.
+
+    Returns:
+        list[Address] | None: A list of Address objects (TypedDict)
+        containing the address information if the address is found, None
+        otherwise.
+
+    Example:
+        >>> await aget_cep_information_from_address(
+        ...     "SP", "São Paulo", "Avenida Paulista"
+        ... )
+        [{'cep': '01310-000', ...}, ...]
+        >>> await aget_cep_information_from_address("XX", "Example", "Example", True)
+        ValueError: Invalid UF: XX
+    """
+
+    uf = _federal_unit_name(federal_unit)
+
+    if uf is None:
+        if raise_exceptions:
+            raise ValueError(f"Invalid UF: {federal_unit}")
 
-            return [Address(**address) for address in response]
+        return None
 
+    query = f"{uf} - {city} - {street}"
+
+    try:
+        return _addresses_from_response(
+            await _aget(
+                f"{_VIACEP_URL}{_address_path(uf, city, street)}/json/",
+                timeout,
+            ),
+            query,
+        )
     except Exception as e:
         if raise_exceptions:
-            raise CEPNotFound(f"{federal_unit} - {city} - {street}") from e
+            raise CEPNotFound(query) from e
 
         return None
+
+
+def get_addresses_from_ceps(
+    ceps, max_concurrency=32, max_rate=None, client=None
+):  # type: (Iterable[str], int, float | None, ViaCEPClient | CEPCache | None) -> list[Address | InvalidCEP | CEPNotFound]
+    """
+    Fetches address information for many CEPs (Postal Codes) using the
+    ViaCEP API, concurrently.
+
+    The CEPs are stripped of their symbols and deduplicated, so each
+    distinct CEP is fetched only once, and invalid CEPs are rejected before
+    any request is made. The remaining lookups are spread over a pool of up
+    to `max_concurrency` threads sharing the keep-alive connections of a
+    `ViaCEPClient`, optionally limited to `max_rate` requests per second.
+    Lookups answered by a `CEPCache` are not rate limited.
+    A failed lookup does not abort the batch: its error is returned in place
+    of its address.
+
+    Args:
+        ceps (Iterable[str]): The CEPs (Postal Codes) to be looked up, with
+            or without symbols.
+        max_concurrency (int, optional): The maximum number of lookups in
+            flight at once. Defaults to 32.
+        max_rate (float, optional): The maximum number of requests started
+            per second, for the new client. Defaults to None, for no limit.
+            The rate of a given client is set on the client itself.
+        client (ViaCEPClient | CEPCache, optional): The client used for the
+            lookups, or a cache in front of one. Defaults to None, for a new
+            client with a pool of `max_concurrency` connections, closed when
+            the batch is done.
+
+    Returns:
+        list[Address | InvalidCEP | CEPNotFound]: For each input CEP, in
+        order, its address information or the error of its lookup: an
+        `InvalidCEP` if the CEP is invalid or a `CEPNotFound` if it was not
+        found or the request failed.
+
+    Raises:
+        ValueError: If `max_concurrency` or `max_rate` is not positive, or
+            if both `max_rate` and `client` are given.
+
+    Example:
+        >>> get_addresses_from_ceps(["01310-200", "abc", "01310200"])
+        [{'cep': '01310-200', ...}, InvalidCEP("CEP 'abc' is invalid."), {'cep': '01310-200', ...}]
+    """
+
+    if max_concurrency < 1:
+        raise ValueError("The maximum concurrency must be positive.")
+
+    if max_rate is not None and max_rate <= 0:
+        raise ValueError("The maximum rate must be positive.")
+
+    if max_rate is not None and client is not None:
+        raise ValueError(
+            "The maximum rate of a given client must be set on the client."
+        )
+
+    ceps = list(ceps)
+    clean_ceps = [
+        remove_symbols(cep) if isinstance(cep, str) else None for cep in ceps
+    ]
+    unique_ceps = list(
+        dict.fromkeys(
+            clean_cep
+            for clean_cep in clean_ceps
+            if clean_cep is not None and is_valid(clean_cep)
+        )
+    )
+    owns_client = client is None
+
+    if owns_client:
+        client = ViaCEPClient(
+            _VIACEP_URL, pool_size=max_concurrency, max_rate=max_rate
+        )
+
+    results = {}  # type: dict[str, dict | CEPNotFound]
+    pending = iter(unique_ceps)
+    pending_lock = Lock()
+
+    # Each worker pulls the next CEP from the shared iterator, so only one
+    # future per worker is ever created, however long the batch is.
+    def work():  # type: () -> None
+        while True:
+            with pending_lock:
+                cep = next(pending, None)
+
+            if cep is None:
+                return
+
+            try:
+                results[cep] = client.get_address_from_cep(cep, True)
+            except CEPNotFound as e:
+                results[cep] = e
+
+    workers = min(max_concurrency, len(unique_ceps)) or 1
+
+    try:
+        with ThreadPoolExecutor(workers) as executor:
+            for future in [executor.submit(work) for _ in range(workers)]:
+                future.result()
+    finally:
+        if owns_client:
+            client.close()
+
+    # Each duplicate gets its own copy of the address, so that updating one
+    # result does not change the others.
+    return [
+        InvalidCEP(cep)
+        if (result := results.get(clean_cep)) is None
+        else Address(**result)
+        if isinstance(result, dict)
+        else result
+        for cep, clean_cep in zip(ceps, clean_ceps)
+    ]
+
+
+class ViaCEPClient:
+    """
+    A client of the ViaCEP API that keeps its connections open between
+    lookups.
+
+    `get_address_from_cep` and `get_cep_information_from_address` open a new
+    connection, with new TCP and TLS handshakes, on every call. A client
+    keeps up to `pool_size` idle keep-alive connections to the API host and
+    reuses them for the following lookups, so sequential lookups only pay
+    for the request itself. Its methods take the same arguments, return the
+    same results and raise the same exceptions as those functions.
+
+    The client is thread-safe: each lookup takes an idle connection from the
+    pool, or opens a new one if there is none, and gives it back afterwards.
+    A pooled connection closed by the server in the meantime is replaced
+    transparently.
+
+    With `max_rate`, the requests are spaced out, across threads, so that at
+    most `max_rate` of them start per second. Only the requests sent to the
+    API count, so lookups answered by a `CEPCache` in front of the client
+    are not slowed down.
+
+    Args:
+        base_url (str, optional): The base URL of the API, to which the
+            lookup paths are appended. Defaults to
+            "https://viacep.com.br/ws/".
+        pool_size (int, optional): The maximum number of idle connections
+            kept open. Defaults to 4.
+        timeout (float, optional): The timeout of each connection, in
+            seconds. Defaults to 10.
+        ssl_context (ssl.SSLContext, optional): The SSL context of HTTPS
+            connections. Defaults to None, for the default context.
+        max_rate (float, optional): The maximum number of requests started
+            per second. Defaults to None, for no limit.
+
+    Raises:
+        ValueError: If the base URL is not an HTTP or HTTPS URL or the pool
+            size or the maximum rate is not positive.
+
+    Example:
+        >>> with ViaCEPClient() as client:
+        ...     [client.get_address_from_cep(cep)["uf"]
+        ...      for cep in ["01310-200", "20040-020"]]
+        ['SP', 'RJ']
+    """
+
+    __slots__ = ("_connect", "_path", "_pool", "_wait")
+
+    def __init__(
+        self,
+        base_url=_VIACEP_URL,
+        pool_size=4,
+        timeout=10.0,
+        ssl_context=None,
+        max_rate=None,
+    ):  # type: (str, int, float, ssl.SSLContext | None, float | None) -> None
+        url = urlsplit(base_url)
+
+        if url.scheme not in ("http", "https") or not url.netloc:
+            raise ValueError(f"Invalid base URL: {base_url!r}")
+
+        if pool_size < 1:
+            raise ValueError("The pool size must be positive.")
+
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("The maximum rate must be positive.")
+
+        self._connect = (
+            partial(
+                HTTPSConnection,
+                url.netloc,
+                timeout=timeout,
+                context=ssl_context,
+            )
+            if url.scheme == "https"
+            else partial(HTTPConnection, url.netloc, timeout=timeout)
+        )
+        self._path = url.path.rstrip("/") + "/"
+        self._pool = LifoQueue(pool_size)
+        self._wait = (
+            _RateLimiter(max_rate).wait if max_rate is not None else None
+        )
+
+    def __enter__(self):  # type: () -> ViaCEPClient
+        return self
+
+    def __exit__(self, *exc_info):  # type: (object) -> None
+        self.close()
+
+    def get_address_from_cep(self, cep, raise_exceptions=False):  # type: (str, bool) -> Address | None
+        """
+        Fetches address information from a given CEP (Postal Code), like
+        `get_address_from_cep`.
+
+        Args:
+            cep (str): The CEP (Postal Code) to be used in the search.
+            raise_exceptions (bool, optional): Whether to raise exceptions
+                when the CEP is invalid or not found. Defaults to False.
+
+        Raises:
+            InvalidCEP: When the input CEP is invalid.
+            CEPNotFound: When the input CEP is not found.
+
+        Returns:
+            Address | None: The address information if the CEP is found,
+            None otherwise.
+        """
+
+        clean_cep = remove_symbols(cep)
+
+        if not is_valid(clean_cep):
+            if raise_exceptions:
+                raise InvalidCEP(cep)
+
+            return None
+
+        try:
+            address = self.fetch_address(clean_cep)
+        except Exception as e:
+            if raise_exceptions:
+                raise CEPNotFound(cep) from e
+
+            return None
+
+        if address is None and raise_exceptions:
+            raise CEPNotFound(cep)
+
+        return address
+
+    def get_cep_information_from_address(
+        self, federal_unit, city, street, raise_exceptions=False
+    ):  # type: (str, str, str, bool) -> list[Address] | None
+        """
+        Fetches CEP (Postal Code) options from a given address, like
+        `get_cep_information_from_address`.
+
+        Args:
+            federal_unit (str): The two-letter abbreviation of the Brazilian
+                state.
+            city (str): The name of the city.
+            street (str): The name (or substring) of the street.
+            raise_exceptions (bool, optional): Whether to raise exceptions
+                when the address is invalid or not found. Defaults to False.
+
+        Raises:
+            ValueError: When the input UF is invalid.
+            CEPNotFound: When the input address is not found.
+
+        Returns:
+            list[Address] | None: The address information of each CEP if the
+            address is found, None otherwise.
+        """
+
+        uf = _federal_unit_name(federal_unit)
+
+        if uf is None:
+            if raise_exceptions:
+                raise ValueError(f"Invalid UF: {federal_unit}")
+
+            return None
+
+        query = f"{uf} - {city} - {street}"
+
+        try:
+            return _addresses_from_response(
+                self._get(f"{_address_path(uf, city, street)}/json/"), query
+            )
+        except Exception as e:
+            if raise_exceptions:
+                raise CEPNotFound(query) from e
+
+            return None
+
+    def fetch_address(self, clean_cep):  # type: (str) -> Address | None
+        """
+        Fetches a CEP from the API, telling a CEP the API did not find apart
+        from a failed request.
+
+        Unlike `get_address_from_cep`, the CEP is not validated, and only
+        failed requests raise exceptions, so that callers such as `CEPCache`
+        can cache the CEPs that were not found.
+
+        Args:
+            clean_cep (str): A valid CEP, without symbols.
+
+        Returns:
+            Address | None: The address information, or None if the API did
+            not find the CEP.
+
+        Raises:
+            HTTPException: If the response is malformed or its status is not
+                200 OK.
+            OSError: If the connection fails.
+            ValueError: If the body of the response is not valid JSON.
+        """
+
+        return _address_from_response(self._get(f"{clean_cep}/json/"))
+
+    def close(self):  # type: () -> None
+        """
+        Closes the idle connections of the pool. The client can still be
+        used afterwards, opening new connections.
+        """
+
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except Empty:
+                return
+
+    def _get(self, path):  # type: (str) -> bytes
+        """
+        Sends a GET request over a pooled connection.
+
+        Args:
+            path (str): The path of the request, relative to the base URL.
+
+        Returns:
+            bytes: The body of the response.
+
+        Raises:
+            HTTPException: If the response status is not 200 OK.
+            OSError: If a new connection fails.
+        """
+
+        if self._wait is not None:
+            self._wait()
+
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+                is_reused = True
+            except Empty:
+                connection = self._connect()
+                is_reused = False
+
+            try:
+                connection.request("GET", self._path + path)
+                response = connection.getresponse()
+                body = response.read()
+            except (ConnectionError, HTTPException):
+                connection.close()
+
+                # The server may close idle keep-alive connections at any
+                # time, so a failing pooled connection is retried with the
+                # next one, and eventually with a new one.
+                if is_reused:
+                    continue
+
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                try:
+                    self._pool.put_nowait(connection)
+                except Full:
+                    connection.close()
+
+            if response.status != 200:
+                raise HTTPException(
+                    f"HTTP Error {response.status}: {response.reason}"
+                )
+
+            return body
+
+
+class CEPCache:
+    """
+    An in-process cache of CEP (Postal Code) lookups, with least recently
+    used eviction and expiring entries.
+
+    Lookups are keyed by the CEP stripped of its symbols, so formatted and
+    unformatted CEPs share their entries. Found addresses are kept for `ttl`
+    seconds, and CEPs that the API answers as not found are kept for the
+    usually shorter `not_found_ttl`, so that new CEPs show up quickly.
+    Failed requests are not cached. Once `maxsize` CEPs are cached, the
+    least recently used one is evicted for each new CEP.
+
+    The cache is thread-safe, and since it has the `get_address_from_cep`
+    method of a `ViaCEPClient`, it can be passed as the client of
+    `get_addresses_from_ceps`. Concurrent misses of the same CEP may each
+    make a request.
+
+    Args:
+        maxsize (int, optional): The maximum number of cached CEPs. Defaults
+            to 1024.
+        ttl (float, optional): How long found addresses are kept, in
+            seconds. Defaults to one day.
+        not_found_ttl (float, optional): How long CEPs not found are kept,
+            in seconds. Defaults to one hour.
+        client (ViaCEPClient, optional): The client used for the lookups,
+            through its `fetch_address` method. Any object with a method
+            like it can be used. Defaults to None, for a new connection per
+            lookup, like `get_address_from_cep`.
+
+    Raises:
+        ValueError: If `maxsize`, `ttl` or `not_found_ttl` is not positive.
+
+    Example:
+        >>> cache = CEPCache(maxsize=10_000, client=ViaCEPClient())
+        >>> cache.get_address_from_cep("01310-200")["uf"]
+        'SP'
+        >>> cache.get_address_from_cep("01310200")["uf"]
+        'SP'
+        >>> cache.cache_info()
+        CEPCacheInfo(hits=1, misses=1, evictions=0, maxsize=10000, currsize=1)
+    """
+
+    __slots__ = (
+        "_client",
+        "_entries",
+        "_evictions",
+        "_hits",
+        "_lock",
+        "_maxsize",
+        "_misses",
+        "_not_found_ttl",
+        "_ttl",
+    )
+
+    def __init__(
+        self, maxsize=1024, ttl=86_400.0, not_found_ttl=3_600.0, client=None
+    ):  # type: (int, float, float, ViaCEPClient | None) -> None
+        if maxsize < 1:
+            raise ValueError("The maximum size must be positive.")
+
+        if ttl <= 0 or not_found_ttl <= 0:
+            raise ValueError("The TTLs must be positive.")
+
+        self._client = client
+        # Expiration time and address, or None if not found, of each CEP,
+        # from the least to the most recently used
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._not_found_ttl = not_found_ttl
+        self._hits = self._misses = self._evictions = 0
+
+    def get_address_from_cep(self, cep, raise_exceptions=False):  # type: (str, bool) -> Address | None
+        """
+        Fetches address information from a given CEP (Postal Code), like
+        `get_address_from_cep`, answering from the cache when possible.
+
+        Args:
+            cep (str): The CEP (Postal Code) to be used in the search.
+            raise_exceptions (bool, optional): Whether to raise exceptions
+                when the CEP is invalid or not found. Defaults to False.
+
+        Raises:
+            InvalidCEP: When the input CEP is invalid.
+            CEPNotFound: When the input CEP is not found.
+
+        Returns:
+            Address | None: A copy of the address information if the CEP is
+            found, None otherwise.
+        """
+
+        clean_cep = remove_symbols(cep) if isinstance(cep, str) else ""
+
+        if not is_valid(clean_cep):
+            if raise_exceptions:
+                raise InvalidCEP(cep)
+
+            return None
+
+        now = monotonic()
+
+        with self._lock:
+            entry = self._entries.get(clean_cep)
+
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(clean_cep)
+                self._hits += 1
+            else:
+                if entry is not None:
+                    del self._entries[clean_cep]
+                    entry = None
+
+                self._misses += 1
+
+        if entry is not None:
+            address = entry[1]
+        else:
+            try:
+                address = self._fetch(clean_cep)
+            except Exception as e:
+                if raise_exceptions:
+                    raise CEPNotFound(cep) from e
+
+                return None
+
+        if address is None:
+            if raise_exceptions:
+                raise CEPNotFound(cep)
+
+            return None
+
+        return Address(**address)
+
+    def cache_info(self):  # type: () -> CEPCacheInfo
+        """
+        Reports the statistics of the cache.
+
+        Returns:
+            CEPCacheInfo: The number of lookups answered from the cache
+            (`hits`) and by the API (`misses`), the number of CEPs evicted to
+            make room for new ones, the maximum size and the current number
+            of cached CEPs.
+        """
+
+        with self._lock:
+            return CEPCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._entries),
+            )
+
+    def cache_clear(self):  # type: () -> None
+        """
+        Empties the cache and resets its statistics.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _fetch(self, clean_cep):  # type: (str) -> Address | None
+        """
+        Fetches a CEP from the API and caches the answer.
+
+        Args:
+            clean_cep (str): The valid CEP, without symbols.
+
+        Returns:
+            Address | None: The address information, or None if the API did
+            not find the CEP.
+
+        Raises:
+            Exception: If the request failed, in which case nothing is
+                cached.
+        """
+
+        address = (
+            _fetch_address(clean_cep)
+            if self._client is None
+            else self._client.fetch_address(clean_cep)
+        )
+        ttl = self._not_found_ttl if address is None else self._ttl
+
+        with self._lock:
+            self._entries[clean_cep] = (monotonic() + ttl, address)
+            self._entries.move_to_end(clean_cep)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return address
+
+
+class _RateLimiter:
+    """
+    Spaces out calls, across threads, so that at most `rate` of them start
+    per second.
+
+    Args:
+        rate (float): The maximum number of calls per second.
+    """
+
+    __slots__ = ("_interval", "_lock", "_next_start")
+
+    def __init__(self, rate):  # type: (float) -> None
+        self._interval = 1 / rate
+        self._lock = Lock()
+        self._next_start = monotonic()
+
+    def wait(self):  # type: () -> None
+        """
+        Blocks until the calling thread may start its call.
+        """
+
+        with self._lock:
+            now = monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+
+        if start > now:
+            sleep(start - now)
+
+
+@lru_cache(maxsize=None)
+def _cep_ranges():  # type: () -> tuple[array, array, tuple[UF, ...]]
+    """
+    Loads, and caches, the CEP ranges of each UF.
+
+    Returns:
+        tuple[array, array, tuple[UF, ...]]: The first and last CEPs of each
+        range as integers, sorted, and the UF of each range.
+    """
+
+    with open(_CEP_RANGES_FILE) as file:
+        ranges = sorted(load(file), key=lambda cep_range: cep_range["start"])
+
+    return (
+        array("L", [int(cep_range["start"]) for cep_range in ranges]),
+        array("L", [int(cep_range["end"]) for cep_range in ranges]),
+        tuple(UF[cep_range["uf"]] for cep_range in ranges),
+    )
+
+
+@lru_cache(maxsize=None)
+def _ufs_by_prefix():  # type: () -> tuple[int, dict[str, UF]]
+    """
+    Builds, and caches, a table mapping CEP prefixes to UFs.
+
+    The prefix length is the shortest one at which every range starts and
+    ends on a whole prefix, so that all the CEPs sharing a prefix belong to
+    the same UF. Prefixes outside of every range are left out.
+
+    Returns:
+        tuple[int, dict[str, UF]]: The prefix length and the UF of each
+        prefix.
+    """
+
+    starts, ends, ufs = _cep_ranges()
+    prefix_length = 8
+
+    while prefix_length > 0 and all(
+        start % 10 ** (9 - prefix_length) == 0
+        and (end + 1) % 10 ** (9 - prefix_length) == 0
+        for start, end in zip(starts, ends)
+    ):
+        prefix_length -= 1
+
+    scale = 10 ** (8 - prefix_length)
+
+    return prefix_length, {
+        f"{prefix:0{prefix_length}d}": uf
+        for start, end, uf in zip(starts, ends, ufs)
+        for prefix in range(start // scale, (end + 1) // scale)
+    }
+
+
+async def _aget(url, timeout):  # type: (str, float | None) -> bytes
+    """
+    Sends a GET request over `asyncio` streams, on a new connection that is
+    closed afterwards, cancelling it if it takes longer than the timeout.
+
+    Args:
+        url (str): The HTTP or HTTPS URL of the request.
+        timeout (float | None): The maximum time, in seconds, the request
+            may take, or None for no timeout.
+
+    Returns:
+        bytes: The body of the response.
+
+    Raises:
+        HTTPException: If the response is malformed or its status is not
+            200 OK.
+        OSError: If the connection fails.
+        asyncio.TimeoutError: If the request times out.
+    """
+
+    return await wait_for(_arequest(url), timeout)
+
+
+async def _arequest(url):  # type: (str) -> bytes
+    """
+    Sends a GET request over `asyncio` streams, without a timeout.
+
+    Args:
+        url (str): The HTTP or HTTPS URL of the request.
+
+    Returns:
+        bytes: The body of the response.
+    """
+
+    url = urlsplit(url)
+    is_https = url.scheme == "https"
+    reader, writer = await open_connection(
+        url.hostname, url.port or (443 if is_https else 80), ssl=is_https
+    )
+
+    try:
+        writer.write(
+            f"GET {url.path} HTTP/1.1\r\n"
+            f"Host: {url.netloc}\r\n"
+            "Accept: application/json\r\n"
+            "Connection: close\r\n\r\n".encode("ascii")
+        )
+        await writer.drain()
+        status_line = (await reader.readline()).decode("latin-1").split(None, 2)
+
+        if len(status_line) < 2 or not status_line[0].startswith("HTTP/"):
+            raise HTTPException(f"Invalid status line: {status_line!r}")
+
+        headers = {}
+
+        while (line := await reader.readline()).strip():
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await _aread_chunked(reader)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+    finally:
+        writer.close()
+
+        with suppress(OSError):
+            await writer.wait_closed()
+
+    if status_line[1] != "200":
+        raise HTTPException(f"HTTP Error {' '.join(status_line[1:])}")
+
+    return body
+
+
+async def _aread_chunked(reader):  # type: (asyncio.StreamReader) -> bytes
+    """
+    Reads a body sent with the chunked transfer encoding.
+
+    Args:
+        reader (asyncio.StreamReader): The stream, positioned at the start
+            of the body.
+
+    Returns:
+        bytes: The body, without the chunk framing.
+    """
+
+    chunks = []
+
+    while size := int((await reader.readline()).split(b";")[0], 16):
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+    return b"".join(chunks)
+
+
+def _fetch_address(clean_cep):  # type: (str) -> Address | None
+    """
+    Fetches a CEP from the API on a new connection.
+
+    Args:
+        clean_cep (str): The valid CEP, without symbols.
+
+    Returns:
+        Address | None: The address information, or None if the API did not
+        find the CEP.
+
+    Raises:
+        Exception: If the request failed.
+    """
+
+    with urlopen(f"{_VIACEP_URL}{clean_cep}/json/") as f:
+        return _address_from_response(f.read())
+
+
+def _address_from_response(response):  # type: (bytes) -> Address | None
+    """
+    Parses the ViaCEP response of a CEP lookup.
+
+    Args:
+        response (bytes): The body of the response.
+
+    Returns:
+        Address | None: The address information, or None if the API did not
+        find the CEP.
+    """
+
+    data = loads(response)
+
+    if data.get("erro", False):
+        return None
+
+    return Address(**data)
+
+
+def _addresses_from_response(response, query):  # type: (bytes, str) -> list[Address]
+    """
+    Parses the ViaCEP response of an address lookup.
+
+    Args:
+        response (bytes): The body of the response.
+        query (str): The address that was looked up, for error messages.
+
+    Returns:
+        list[Address]: The address information of each CEP found.
+
+    Raises:
+        CEPNotFound: If the API did not find any CEP.
+    """
+
+    data = loads(response)
+
+    if len(data) == 0:
+        raise CEPNotFound(query)
+
+    return [Address(**address) for address in data]
+
+
+def _federal_unit_name(federal_unit):  # type: (str) -> str | None
+    """
+    Converts a UF given by abbreviation or full name to its abbreviation.
+
+    Args:
+        federal_unit (str): The abbreviation or the name of the UF.
+
+    Returns:
+        str | None: The abbreviation of the UF, or None if it is unknown.
+    """
+
+    if federal_unit in UF.values:
+        federal_unit = UF(federal_unit).name
+
+    return federal_unit if federal_unit in UF.names else None
+
+
+def _address_path(federal_unit, city, street):  # type: (str, str, str) -> str
+    """
+    Builds the path of a ViaCEP address lookup, stripping accents from the
+    city and street names and escaping their spaces.
+
+    Args:
+        federal_unit (str): The abbreviation of the UF.
+        city (str): The name of the city.
+        street (str): The name (or substring) of the street.
+
+    Returns:
+        str: The path, relative to the base URL of the API.
+    """
+
+    parsed_city, parsed_street = (
+        normalize("NFD", name)
+        .encode("ascii", "ignore")
+        .decode("utf-8")
+        .replace(" ", "%20")
+        for name in (city, street)
+    )
+
+    return f"{federal_unit}/{parsed_city}/{parsed_street}"
@@ -1,5 +1,138 @@
-from itertools import chain
-from random import randint
+from array import array
+from bisect import bisect_left
+from csv import reader
+from datetime import date
+from functools import lru_cache
+from io import TextIOWrapper
+from itertools import islice
+from operator import index, mul
+from random import choices, randint
+from struct import Struct
+from sys import byteorder
+from zipfile import ZipFile
+
+from brutils._check_digit import (
+    ALPHANUMERIC_VALUES,
+    CHECK_DIGITS,
+    ENDINGS,
+    SUBSTITUTION_COSTS,
+    Mod11,
+)
+from brutils._keys import SortedKeyBuilder
+from brutils._mask import MaskTemplate
+
+# The first check digit weighs the 12 base characters with 5 down to 2
+# followed by 9 down to 2, and the second one weighs those plus the first
+# check digit with 6 down to 2 followed by 9 down to 2. Since July 2026, base
+# characters may be uppercase letters, valued by their ASCII code minus 48.
+_CHECK_DIGIT = Mod11(
+    (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+    (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+    values=ALPHANUMERIC_VALUES,
+)
+
+# Characters allowed in the 12 base characters of a CNPJ.
+_BASE_CHARACTERS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_BASE_BYTES = _BASE_CHARACTERS.encode()
+_DIGIT_BYTES = b"0123456789"
+
+# Weighted sums of the first 3 digits of a branch number for each check digit,
+# along with their digit strings, for every value from 000 to 999.
+_BRANCH_HEADS = tuple(
+    (
+        5 * (head // 100) + 4 * (head // 10 % 10) + 3 * (head % 10),
+        6 * (head // 100) + 5 * (head // 10 % 10) + 4 * (head % 10),
+        f"{head:03d}",
+    )
+    for head in range(1000)
+)
+
+# Base 36 strings of every pair of base characters, in the order of their
+# values, to turn the integer keys of a `CNPJIndex` back into CNPJs.
+_BASE_PAIRS = tuple(
+    first + second for first in _BASE_CHARACTERS for second in _BASE_CHARACTERS
+)
+
+# Number of integer keys of a `CNPJIndex` taken by each root, one per base 36
+# branch number.
+_BRANCH_COUNT = 36**4
+
+# Header of a saved `CNPJIndex`: magic bytes, format version and number of
+# CNPJs.
+_INDEX_HEADER = Struct("<4sB3xQ")
+_INDEX_MAGIC = b"BRCX"
+_INDEX_VERSION = 1
+
+# Values of the characters that may replace a mistyped character of a CNPJ:
+# digits only, or digits and uppercase letters for alphanumeric CNPJs.
+_DIGIT_REPLACEMENTS = tuple(range(10))
+_ALPHANUMERIC_REPLACEMENTS = _DIGIT_REPLACEMENTS + tuple(range(17, 43))
+
+# Columns of the establishment files of the Receita Federal open CNPJ data,
+# in order. The files have no header row.
+_ESTABLISHMENT_COLUMNS = (
+    "cnpj_basico",
+    "cnpj_ordem",
+    "cnpj_dv",
+    "identificador_matriz_filial",
+    "nome_fantasia",
+    "situacao_cadastral",
+    "data_situacao_cadastral",
+    "motivo_situacao_cadastral",
+    "nome_cidade_exterior",
+    "pais",
+    "data_inicio_atividade",
+    "cnae_fiscal_principal",
+    "cnae_fiscal_secundaria",
+    "tipo_logradouro",
+    "logradouro",
+    "numero",
+    "complemento",
+    "bairro",
+    "cep",
+    "uf",
+    "municipio",
+    "ddd_1",
+    "telefone_1",
+    "ddd_2",
+    "telefone_2",
+    "ddd_fax",
+    "fax",
+    "correio_eletronico",
+    "situacao_especial",
+    "data_situacao_especial",
+)
+_ESTABLISHMENT_FIELDS = ("cnpj",) + _ESTABLISHMENT_COLUMNS
+
+# Lookup tables mapping each ASCII byte to its value multiplied by the weight
+# of a given position, one table per position. They let the batch validation
+# sum a CNPJ with plain indexing.
+_FIRST_DIGIT_TABLES = tuple(
+    tuple(value * weight for value in ALPHANUMERIC_VALUES)
+    for weight in (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+)
+_SECOND_DIGIT_TABLES = tuple(
+    tuple(value * weight for value in ALPHANUMERIC_VALUES)
+    for weight in (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+)
+
+# Weighted sums of every 3-digit chunk of a base number, for each chunk
+# position (most significant first) and each check digit. They let check
+# digits be computed straight from an integer base number.
+_FIRST_CHUNK_SUMS = tuple(
+    tuple(
+        a * (chunk // 100) + b * (chunk // 10 % 10) + c * (chunk % 10)
+        for chunk in range(1000)
+    )
+    for a, b, c in ((5, 4, 3), (2, 9, 8), (7, 6, 5), (4, 3, 2))
+)
+_SECOND_CHUNK_SUMS = tuple(
+    tuple(
+        a * (chunk // 100) + b * (chunk // 10 % 10) + c * (chunk % 10)
+        for chunk in range(1000)
+    )
+    for a, b, c in ((6, 5, 4), (3, 2, 9), (8, 7, 6), (5, 4, 3))
+)
 
 # FORMATTING
 ############
@@ -30,7 +163,7 @@ def sieve(dirty):  # type: (str) -> str
        backward compatibility.
     """
 
-    return "".join(filter(lambda char: char not in "./-", dirty))
+    return dirty.replace(".", "").replace("/", "").replace("-", "")
 
 
 def remove_symbols(dirty):  # type: (str) -> str
@@ -83,7 +216,7 @@ def display(cnpj):  # type: (str) -> str
        backward compatibility.
     """
 
-    if not cnpj.isdigit() or len(cnpj) != 14 or len(set(cnpj)) == 1:
+    if not _has_valid_characters(cnpj) or len(set(cnpj)) == 1:
         return None
     return "{}.{}.{}/{}-{}".format(
         cnpj[:2], cnpj[2:5], cnpj[5:8], cnpj[8:12], cnpj[12:]
@@ -108,6 +241,8 @@ def format_cnpj(cnpj):  # type: (str) -> str
     Example:
         >>> format_cnpj("03560714000142")
         '03.560.714/0001-42'
+        >>> format_cnpj("12ABC34501DE35")
+        '12.ABC.345/01DE-35'
         >>> format_cnpj("98765432100100")
         None
     """
@@ -120,6 +255,85 @@ def format_cnpj(cnpj):  # type: (str) -> str
     )
 
 
+def mask_cnpj(cnpj, visible=(1, 2), mask="*"):  # type: (str, Iterable[int], str) -> str | None
+    """
+    Formats a CNPJ for display, masking some of its digits.
+
+    The formatted CNPJ has five digit segments, "12.345.678/0001-95" being
+    segments 0 to 4. The digits of the segments that are not visible are
+    replaced by the mask character.
+
+    Args:
+        cnpj (str): A numbers-only CNPJ string.
+        visible (Iterable[int], optional): The indexes of the segments to
+            keep visible. Defaults to (1, 2).
+        mask (str, optional): The character that replaces hidden digits.
+            Defaults to "*".
+
+    Returns:
+        str: The masked CNPJ, or None if the input is invalid.
+
+    Raises:
+        ValueError: If a segment index is out of range or the mask is not a
+            single ASCII character.
+
+    Example:
+        >>> mask_cnpj("03560714000142")
+        '**.560.714/****-**'
+        >>> mask_cnpj("03560714000142", visible=(0, 1, 2, 3))
+        '03.560.714/0001-**'
+    """
+
+    if not is_valid(cnpj):
+        return None
+
+    return _mask_template(tuple(visible), mask).apply(cnpj.encode())[0]
+
+
+def mask_cnpj_many(cnpjs, visible=(1, 2), mask="*"):  # type: (Iterable[str | bytes], Iterable[int], str) -> list[str | None]
+    """
+    Masks a whole column of CNPJs at once.
+
+    The result is the same as calling `mask_cnpj` on every item, but the
+    valid CNPJs are masked together, copying each visible digit of all of
+    them into a preallocated template with a single slice assignment, so
+    there is no per-item formatting overhead.
+
+    Args:
+        cnpjs (Iterable[str | bytes]): The numbers-only CNPJs to be masked,
+            as strings or bytes.
+        visible (Iterable[int], optional): The indexes of the segments to
+            keep visible. Defaults to (1, 2).
+        mask (str, optional): The character that replaces hidden digits.
+            Defaults to "*".
+
+    Returns:
+        list[str | None]: The masked CNPJs, with None for the invalid ones.
+
+    Raises:
+        ValueError: If a segment index is out of range or the mask is not a
+            single ASCII character.
+
+    Example:
+        >>> mask_cnpj_many(["03560714000142", "1"])
+        ['**.560.714/****-**', None]
+    """
+
+    template = _mask_template(tuple(visible), mask)
+    cnpjs = list(cnpjs)
+    validity = is_valid_many(cnpjs)
+    buffer = b"".join(
+        cnpj.encode() if isinstance(cnpj, str) else cnpj
+        for cnpj, is_valid_cnpj in zip(cnpjs, validity)
+        if is_valid_cnpj
+    )
+    masked = iter(template.apply(buffer))
+
+    return [
+        next(masked) if is_valid_cnpj else None for is_valid_cnpj in validity
+    ]
+
+
 # OPERATIONS
 ############
 
@@ -130,8 +344,9 @@ def validate(cnpj):  # type: (str) -> bool
     verifying checksum digits to its base number.
 
     This function checks the validity of a CNPJ by comparing its verifying
-    checksum digits to its base number. The input should be a string of digits
-    with the appropriate length.
+    checksum digits to its base number. The input should be a string of the
+    appropriate length, whose 12 base characters are digits or, in the
+    alphanumeric format introduced in July 2026, uppercase letters.
 
     Args:
         cnpj (str): The CNPJ to be validated.
@@ -143,6 +358,8 @@ def validate(cnpj):  # type: (str) -> bool
     Example:
         >>> validate("03560714000142")
         True
+        >>> validate("12ABC34501DE35")
+        True
         >>> validate("00111222000133")
         False
 
@@ -151,11 +368,9 @@ def validate(cnpj):  # type: (str) -> bool
        backward compatibility.
     """
 
-    if not cnpj.isdigit() or len(cnpj) != 14 or len(set(cnpj)) == 1:
+    if not _has_valid_characters(cnpj) or len(set(cnpj)) == 1:
         return False
-    return all(
-        _hashdigit(cnpj, i + 13) == int(v) for i, v in enumerate(cnpj[12:])
-    )
+    return _CHECK_DIGIT.is_valid(cnpj.encode())
 
 
 def is_valid(cnpj):  # type: (str) -> bool
@@ -164,10 +379,11 @@ def is_valid(cnpj):  # type: (str) -> bool
     match its base number.
 
     This function does not verify the existence of the CNPJ; it only
-    validates the format of the string.
+    validates the format of the string. Both the numeric CNPJs and the
+    alphanumeric ones, introduced in July 2026, are supported.
 
     Args:
-        cnpj (str): The CNPJ to be validated, a 14-digit string
+        cnpj (str): The CNPJ to be validated, a 14-character string
 
     Returns:
         bool: True if the checksum digits match the base number,
@@ -176,6 +392,8 @@ def is_valid(cnpj):  # type: (str) -> bool
     Example:
         >>> is_valid("03560714000142")
         True
+        >>> is_valid("12ABC34501DE35")
+        True
         >>> is_valid("00111222000133")
         False
     """
@@ -183,13 +401,127 @@ def is_valid(cnpj):  # type: (str) -> bool
     return isinstance(cnpj, str) and validate(cnpj)
 
 
-def generate(branch=1):  # type: (int) -> str
+def is_valid_many(cnpjs, return_failures=False):  # type: (Iterable[str | bytes] | bytes, bool) -> list[bool] | tuple[list[bool], list[int]]
+    """
+    Validates many CNPJs at once, returning a boolean mask.
+
+    The result is the same as calling `is_valid` on every item, numeric and
+    alphanumeric CNPJs alike, but the CNPJs are packed into a single buffer
+    and split into 14 columns, one per character position. Each column is
+    checked for invalid characters at once, and the check digits of every
+    CNPJ are computed from its column values through precomputed weight
+    tables, with no slicing or per-item type checks.
+
+    Args:
+        cnpjs (Iterable[str | bytes] | bytes): The CNPJs to be validated. It
+            can be any iterable of strings or bytes (a list, a NumPy array of
+            fixed-width bytes, etc.) or a single bytes-like buffer holding
+            the 14-character CNPJs back to back, like the `tobytes()` of a
+            NumPy "S14" array.
+        return_failures (bool, optional): Whether to also return the
+            indexes of the invalid CNPJs. Defaults to False.
+
+    Returns:
+        list[bool] | tuple[list[bool], list[int]]: One boolean per input,
+        True where the CNPJ is valid. If `return_failures` is True, a tuple
+        holding that list and the indexes of the invalid CNPJs, in order.
+
+    Raises:
+        ValueError: If a bytes-like buffer length is not a multiple of 14.
+
+    Example:
+        >>> is_valid_many(["03560714000142", "12ABC34501DE35", "1"])
+        [True, True, False]
+        >>> is_valid_many(b"0356071400014203560714000143")
+        [True, False]
+        >>> is_valid_many(["1", "03560714000142", "2"], return_failures=True)
+        ([False, True, False], [0, 2])
+    """
+
+    if isinstance(cnpjs, (bytes, bytearray, memoryview)):
+        buffer = bytes(cnpjs)
+
+        if len(buffer) % 14:
+            raise ValueError(
+                "The buffer length must be a multiple of 14 to hold CNPJs."
+            )
+
+        validity = _validate_buffer(buffer)
+    else:
+        validity = _validate_list(list(cnpjs))
+
+    if return_failures:
+        return validity, [
+            position
+            for position, is_valid_cnpj in enumerate(validity)
+            if not is_valid_cnpj
+        ]
+
+    return validity
+
+
+def is_valid_int_many(values):  # type: (Iterable[int]) -> list[bool]
+    """
+    Validates many CNPJs given as integers, returning a boolean mask.
+
+    Spreadsheets often store CNPJs as numbers, losing their leading zeros.
+    Instead of converting each value to a zero-padded string, the check
+    digits are computed straight from the integer through division, so
+    `1838723000127` stands for the CNPJ "01838723000127".
+
+    Args:
+        values (Iterable[int]): The CNPJs to be validated, as Python integers
+            or any other integer type, like the items of a NumPy int64
+            array. Values of other types are invalid.
+
+    Returns:
+        list[bool]: One boolean per input, True where the CNPJ is valid.
+
+    Example:
+        >>> is_valid_int_many([3560714000142, 1838723000127, 1838723000128])
+        [True, True, False]
+    """
+
+    return list(map(_validate_int, values))
+
+
+def normalize_int_many(values):  # type: (Iterable[int]) -> list[str | None]
+    """
+    Converts many CNPJs given as integers into numbers-only CNPJ strings.
+
+    Each value is validated on its integer representation, as done by
+    `is_valid_int_many`, and only the valid ones are formatted, with their
+    leading zeros restored.
+
+    Args:
+        values (Iterable[int]): The CNPJs to be converted, as Python integers
+            or any other integer type, like the items of a NumPy int64
+            array.
+
+    Returns:
+        list[str | None]: The 14-digit CNPJs, with None for the invalid ones.
+
+    Example:
+        >>> normalize_int_many([3560714000142, 1838723000127, 1838723000128])
+        ['03560714000142', '01838723000127', None]
+    """
+
+    return [
+        f"{index(value):014d}" if _validate_int(value) else None
+        for value in values
+    ]
+
+
+def generate(branch=1, alphanumeric=False):  # type: (int, bool) -> str
     """
     Generates a random valid CNPJ digit string. An optional branch number
     parameter can be given; it defaults to 1.
 
     Args:
         branch (int): An optional branch number to be included in the CNPJ.
+        alphanumeric (bool): Whether to generate a CNPJ in the alphanumeric
+            format introduced in July 2026, whose 8-character root may hold
+            uppercase letters. Defaults to False.
 
     Returns:
         str: A randomly generated valid CNPJ string.
@@ -199,16 +531,585 @@ def generate(branch=1):  # type: (int) -> str
         "30180536000105"
         >>> generate(1234)
         "01745284123455"
+        >>> generate(alphanumeric=True)
+        "821TCOV0000141"
     """
 
     branch %= 10000
     branch += int(branch == 0)
     branch = str(branch).zfill(4)
-    base = str(randint(0, 99999999)).zfill(8) + branch
+
+    if alphanumeric:
+        base = "".join(choices(_BASE_CHARACTERS, k=8)) + branch
+    else:
+        base = str(randint(0, 99999999)).zfill(8) + branch
 
     return base + _checksum(base)
 
 
+def generate_branches(root, start=1, stop=9999):  # type: (str, int, int) -> bytes
+    """
+    Generates the valid CNPJs of every branch of a company, in order.
+
+    The weighted sums of the 8-character root are computed only once. The
+    sums of the first 3 digits of each branch number then come from a
+    precomputed table, and the last digit of the branch number together
+    with both check digits from another one, so no check digit is computed
+    from scratch.
+
+    Args:
+        root (str): The root of the CNPJs, its first 8 characters, with or
+            without symbols. Alphanumeric roots are supported.
+        start (int, optional): The first branch number, inclusive. Defaults
+            to 1.
+        stop (int, optional): The last branch number, inclusive. Defaults to
+            9999.
+
+    Returns:
+        bytes: The numbers-only CNPJs back to back, 14 ASCII characters
+        each, ready to be passed to `is_valid_many`.
+
+    Raises:
+        ValueError: If the root is invalid or the branch numbers are not
+            between 0 and 9999, in order.
+
+    Example:
+        >>> generate_branches("03.560.714", 1, 3)
+        b'035607140001420356071400022303560714000304'
+        >>> cnpjs = generate_branches("12ABC345")
+        >>> len(cnpjs) // 14
+        9999
+    """
+
+    clean_root = remove_symbols(root) if isinstance(root, str) else ""
+
+    if (
+        len(clean_root) != 8
+        or not clean_root.isascii()
+        or clean_root.strip(_BASE_CHARACTERS)
+    ):
+        raise ValueError(f"Invalid CNPJ root: {root!r}")
+
+    if not 0 <= start <= stop <= 9999:
+        raise ValueError(
+            "The branch numbers must be between 0 and 9999, in order."
+        )
+
+    first_weights, second_weights = _CHECK_DIGIT.weights
+    values = clean_root.encode().translate(ALPHANUMERIC_VALUES)
+    first = sum(map(mul, values, first_weights))
+    second = sum(map(mul, values, second_weights))
+    cnpjs = []
+
+    for head in range(start // 10, stop // 10 + 1):
+        first_head, second_head, digits = _BRANCH_HEADS[head]
+        endings = ENDINGS[
+            (first + first_head) % 11 * 11 + (second + second_head) % 11
+        ]
+        cnpjs.extend(
+            map(
+                (clean_root + digits).__add__,
+                endings[max(start - head * 10, 0) : stop - head * 10 + 1],
+            )
+        )
+
+    # A CNPJ made of a single repeated character is not valid, even when its
+    # check digits match, and only a root like that can produce one.
+    if clean_root.count(clean_root[0]) == 8 and clean_root[0] * 14 in cnpjs:
+        cnpjs.remove(clean_root[0] * 14)
+
+    return "".join(cnpjs).encode()
+
+
+def suggest_corrections(cnpj):  # type: (str) -> list[str]
+    """
+    Suggest valid CNPJs one typo away from the given one.
+
+    This function tries every single-character substitution and every swap
+    of two adjacent characters of the CNPJ, and returns the candidates whose
+    check digits are valid. The weighted sums of the original CNPJ are
+    computed once and each candidate only adjusts them by the changed
+    characters, so the whole search takes a few dozen microseconds.
+
+    Base characters are replaced by digits or, when the base already holds
+    letters, by digits and uppercase letters; check digits are only replaced
+    by digits. Candidates are ranked by how likely the typo is: swapped
+    characters first, then digits next to each other on a numeric keypad,
+    then characters that look alike, then any other substitution.
+
+    Args:
+        cnpj (str): The mistyped CNPJ. It may contain symbols.
+
+    Returns:
+        list[str]: The candidate CNPJs without symbols, most likely first.
+        The list is empty if the input does not hold the 14 characters of a
+        CNPJ.
+
+    Example:
+        >>> suggest_corrections("03.560.714/0001-43")
+        ['03560714000142']
+        >>> suggest_corrections("03560741000142")
+        ['03560471000142', '03560714000142']
+    """
+
+    if not isinstance(cnpj, str):
+        return []
+
+    clean_cnpj = remove_symbols(cnpj)
+
+    if len(clean_cnpj) != 14 or not _has_valid_characters(clean_cnpj):
+        return []
+
+    values = clean_cnpj.encode().translate(ALPHANUMERIC_VALUES)
+    # Pad the weights with zeros so that both sums cover all 14 positions
+    first_weights, second_weights = _CHECK_DIGIT.weights
+    first_weights += (0, 0)
+    second_weights += (0,)
+    first_sum = sum(map(mul, values, first_weights))
+    second_sum = sum(map(mul, values, second_weights))
+    first_digit, second_digit = values[12], values[13]
+    base_replacements = (
+        _DIGIT_REPLACEMENTS
+        if clean_cnpj[:12].isdigit()
+        else _ALPHANUMERIC_REPLACEMENTS
+    )
+    suggestions = []
+
+    for position, value in enumerate(values):
+        first_weight = first_weights[position]
+        second_weight = second_weights[position]
+
+        for replacement in (
+            base_replacements if position < 12 else _DIGIT_REPLACEMENTS
+        ):
+            if replacement == value:
+                continue
+
+            delta = replacement - value
+
+            if CHECK_DIGITS[(first_sum + delta * first_weight) % 11] == (
+                replacement if position == 12 else first_digit
+            ) and CHECK_DIGITS[(second_sum + delta * second_weight) % 11] == (
+                replacement if position == 13 else second_digit
+            ):
+                cost = SUBSTITUTION_COSTS.get(
+                    frozenset((value, replacement)), 3
+                )
+                candidate = (
+                    clean_cnpj[:position]
+                    + chr(replacement + 48)
+                    + clean_cnpj[position + 1 :]
+                )
+                suggestions.append((cost, position, candidate))
+
+    for position in range(13):
+        value, next_value = values[position], values[position + 1]
+        swapped = bytearray(values)
+        swapped[position], swapped[position + 1] = next_value, value
+
+        # Letters cannot move into the check digits
+        if value == next_value or swapped[12] > 9:
+            continue
+
+        delta = next_value - value
+        first_weight_delta = (
+            first_weights[position] - first_weights[position + 1]
+        )
+        second_weight_delta = (
+            second_weights[position] - second_weights[position + 1]
+        )
+
+        if (
+            CHECK_DIGITS[(first_sum + delta * first_weight_delta) % 11]
+            == swapped[12]
+            and CHECK_DIGITS[(second_sum + delta * second_weight_delta) % 11]
+            == swapped[13]
+        ):
+            candidate = (
+                clean_cnpj[:position]
+                + clean_cnpj[position + 1]
+                + clean_cnpj[position]
+                + clean_cnpj[position + 2 :]
+            )
+            suggestions.append((0, position, candidate))
+
+    suggestions.sort(key=lambda suggestion: suggestion[:2])
+
+    # A CNPJ made of a single repeated character is not valid, even when its
+    # check digits match.
+    return [
+        candidate
+        for _, _, candidate in suggestions
+        if candidate.count(candidate[0]) != 14
+    ]
+
+
+def read_establishments(
+    source, chunk_size=10_000, drop_invalid=False, on_chunk=None
+):  # type: (str | os.PathLike | IO[bytes], int, bool, Callable[[int, int], None] | None) -> Iterator[Establishment]
+    """
+    Reads the establishment files of the Receita Federal open CNPJ data
+    ("Dados Abertos CNPJ"), lazily.
+
+    The files are read straight from the zip archive in which they are
+    published, without extracting them, as latin-1 text with fields
+    separated by semicolons. The rows are consumed in chunks of
+    `chunk_size`: for each chunk, the CNPJs are assembled from the
+    `cnpj_basico`, `cnpj_ordem` and `cnpj_dv` columns and validated all at
+    once with `is_valid_many`. Only one chunk is held in memory at a time,
+    so whole dumps can be processed with bounded memory.
+
+    Each row is turned into an `Establishment` record with one key per
+    column of the file, plus the assembled `cnpj`. Codes are converted to
+    `int` and dates to `datetime.date`, with empty values and zeroed dates
+    becoming None, and the secondary CNAEs are split into a list.
+
+    Args:
+        source (str | os.PathLike | IO[bytes]): The path of the zip archive,
+            or a binary file object holding it. Every file in the archive is
+            read, in order.
+        chunk_size (int, optional): How many rows to process at a time.
+            Defaults to 10000.
+        drop_invalid (bool, optional): Whether to skip the rows holding an
+            invalid CNPJ. Defaults to False.
+        on_chunk (Callable[[int, int], None], optional): A function called
+            after each chunk is processed with the number of rows in the
+            chunk and how many of them hold an invalid CNPJ, e.g. to report
+            progress and throughput. Defaults to None.
+
+    Returns:
+        Iterator[Establishment]: The establishment records, in file order.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive or, while reading, if a
+            row does not have the 30 columns of an establishment file.
+
+    Example:
+        >>> establishments = read_establishments("Estabelecimentos0.zip")
+        >>> record = next(establishments)
+        >>> record["cnpj"], record["uf"], record["data_inicio_atividade"]
+        ('03560714000142', 'SP', datetime.date(2000, 1, 28))
+    """
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive.")
+
+    return _read_establishments(source, chunk_size, drop_invalid, on_chunk)
+
+
+def parse_cnpj(raw):  # type: (str) -> ParsedCNPJ
+    """
+    Parses a CNPJ that may contain symbols, in a single pass.
+
+    This function removes the symbols, validates the CNPJ and returns the
+    result in a lightweight object, so callers that need the clean digits,
+    the validation result and the formatted CNPJ do not have to call
+    `remove_symbols`, `is_valid` and `format_cnpj` one after the other.
+
+    Args:
+        raw (str): The CNPJ to be parsed, with or without symbols.
+
+    Returns:
+        ParsedCNPJ: The parsing result, holding the clean `digits`, whether
+        the CNPJ `is_valid`, its `formatted` version and, for invalid CNPJs,
+        the `error` that made it invalid: "invalid_type",
+        "invalid_length", "invalid_characters", "repeated_digits" or
+        "invalid_check_digits".
+
+    Example:
+        >>> parsed = parse_cnpj("03.560.714/0001-42")
+        >>> parsed.digits, parsed.is_valid, parsed.formatted
+        ('03560714000142', True, '03.560.714/0001-42')
+        >>> parse_cnpj("00.111.222/0001-33").error
+        'invalid_check_digits'
+    """
+
+    if not isinstance(raw, str):
+        return ParsedCNPJ(None, "invalid_type")
+
+    digits = raw.replace(".", "").replace("/", "").replace("-", "")
+
+    if len(digits) != 14:
+        return ParsedCNPJ(digits, "invalid_length")
+
+    if not _has_valid_characters(digits):
+        return ParsedCNPJ(digits, "invalid_characters")
+
+    if digits.count(digits[0]) == 14:
+        return ParsedCNPJ(digits, "repeated_digits")
+
+    if not _CHECK_DIGIT.is_valid(digits.encode()):
+        return ParsedCNPJ(digits, "invalid_check_digits")
+
+    return ParsedCNPJ(digits, None)
+
+
+class ParsedCNPJ:
+    """
+    The result of `parse_cnpj`.
+
+    Attributes:
+        digits (str | None): The CNPJ without symbols, or None if the input
+            was not a string.
+        error (str | None): Why the CNPJ is invalid, or None if it is valid.
+    """
+
+    __slots__ = ("digits", "error")
+
+    def __init__(self, digits, error):  # type: (str | None, str | None) -> None
+        self.digits = digits
+        self.error = error
+
+    @property
+    def is_valid(self):  # type: () -> bool
+        """
+        Whether the CNPJ is valid.
+        """
+
+        return self.error is None
+
+    @property
+    def formatted(self):  # type: () -> str | None
+        """
+        The CNPJ formatted with visual aid symbols, or None if it is invalid.
+        """
+
+        if self.error is not None:
+            return None
+
+        digits = self.digits
+
+        return "{}.{}.{}/{}-{}".format(
+            digits[:2], digits[2:5], digits[5:8], digits[8:12], digits[12:]
+        )
+
+    def __repr__(self):  # type: () -> str
+        return f"ParsedCNPJ(digits={self.digits!r}, error={self.error!r})"
+
+
+class CNPJIndex:
+    """
+    A compact, sorted index of CNPJs grouped by company.
+
+    The 12 base characters of each CNPJ are stored as a base 36 integer,
+    which fits in an unsigned 64-bit integer for numeric and alphanumeric
+    CNPJs alike; the check digits are recomputed when a CNPJ is read back.
+    The integers are kept in a sorted `array("Q")`, so the CNPJs of the same
+    root (the company) are contiguous and ordered by branch number, and a
+    root is found by binary search.
+
+    Args:
+        cnpjs (Iterable[str], optional): The CNPJs to index. They may contain
+            symbols, which are removed with `remove_symbols`.
+
+    Raises:
+        ValueError: If any of the given CNPJs is invalid.
+
+    Example:
+        >>> index = CNPJIndex(
+        ...     ["03.560.714/0002-23", "03560714000142", "34665388000161"]
+        ... )
+        >>> index.branches_of("03.560.714")
+        ['03560714000142', '03560714000223']
+        >>> index.headquarters_of("03560714000223")
+        '03560714000142'
+        >>> [(root, len(cnpjs)) for root, cnpjs in index.group_by_root()]
+        [('03560714', 2), ('34665388', 1)]
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, cnpjs=()):  # type: (Iterable[str]) -> None
+        builder = SortedKeyBuilder()
+
+        for cnpj in cnpjs:
+            clean_cnpj = remove_symbols(cnpj) if isinstance(cnpj, str) else ""
+
+            if not is_valid(clean_cnpj):
+                raise ValueError(f"Invalid CNPJ: {cnpj!r}")
+
+            builder.add(int(clean_cnpj[:12], 36))
+
+        self._keys = builder.build()
+
+    @classmethod
+    def load(cls, path):  # type: (str | os.PathLike) -> CNPJIndex
+        """
+        Loads an index saved with `save`, reading its integers straight into
+        memory without parsing any CNPJ.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Returns:
+            CNPJIndex: The loaded index.
+
+        Raises:
+            ValueError: If the file is not a saved index.
+        """
+
+        with open(path, "rb") as file:
+            header = file.read(_INDEX_HEADER.size)
+            keys = array("Q")
+
+            try:
+                magic, version, count = _INDEX_HEADER.unpack(header)
+                keys.fromfile(file, count)
+            except Exception:
+                magic = None
+
+            if (
+                magic != _INDEX_MAGIC
+                or version != _INDEX_VERSION
+                or file.read(1)
+            ):
+                raise ValueError(f"Not a saved CNPJ index: {path!r}")
+
+        if byteorder == "big":
+            keys.byteswap()
+
+        cnpj_index = cls.__new__(cls)
+        cnpj_index._keys = keys
+
+        return cnpj_index
+
+    def __len__(self):  # type: () -> int
+        return len(self._keys)
+
+    def __iter__(self):  # type: () -> Iterator[str]
+        return map(_from_key, self._keys)
+
+    def __contains__(self, cnpj):  # type: (object) -> bool
+        if not isinstance(cnpj, str):
+            return False
+
+        clean_cnpj = remove_symbols(cnpj)
+
+        if not is_valid(clean_cnpj):
+            return False
+
+        key = int(clean_cnpj[:12], 36)
+        position = bisect_left(self._keys, key)
+
+        return position < len(self._keys) and self._keys[position] == key
+
+    def __eq__(self, other):  # type: (object) -> bool
+        if not isinstance(other, CNPJIndex):
+            return NotImplemented
+
+        return self._keys == other._keys
+
+    def __repr__(self):  # type: () -> str
+        return f"CNPJIndex({list(self)!r})"
+
+    @property
+    def nbytes(self):  # type: () -> int
+        """
+        The number of bytes used to store the CNPJs.
+        """
+
+        return len(self._keys) * self._keys.itemsize
+
+    def branches_of(self, root):  # type: (str) -> list[str]
+        """
+        Returns the indexed CNPJs of a company, ordered by branch number.
+
+        Args:
+            root (str): The root of the company, the first 8 characters of
+                its CNPJs, with or without symbols. A whole CNPJ may be
+                given as well.
+
+        Returns:
+            list[str]: The numbers-only CNPJs of the company, which is empty
+            if none of them is indexed.
+
+        Raises:
+            ValueError: If the root is invalid.
+        """
+
+        start = _root_key(root)
+        keys = self._keys
+
+        return list(
+            map(
+                _from_key,
+                keys[
+                    bisect_left(keys, start) : bisect_left(
+                        keys, start + _BRANCH_COUNT
+                    )
+                ],
+            )
+        )
+
+    def headquarters_of(self, cnpj):  # type: (str) -> str | None
+        """
+        Returns the headquarters of the company of a CNPJ, i.e. its
+        establishment with branch number 0001, if it is indexed.
+
+        Args:
+            cnpj (str): A CNPJ of the company, or just its root, with or
+                without symbols.
+
+        Returns:
+            str | None: The numbers-only CNPJ of the headquarters, or None
+            if it is not indexed.
+
+        Raises:
+            ValueError: If the root of the CNPJ is invalid.
+        """
+
+        key = _root_key(cnpj) + 1
+        keys = self._keys
+        position = bisect_left(keys, key)
+
+        if position < len(keys) and keys[position] == key:
+            return _from_key(key)
+
+        return None
+
+    def group_by_root(self):  # type: () -> Iterator[tuple[str, list[str]]]
+        """
+        Iterates over the indexed companies, in order.
+
+        Returns:
+            Iterator[tuple[str, list[str]]]: The root of each company and its
+            numbers-only CNPJs, ordered by branch number.
+        """
+
+        keys = self._keys
+        start = 0
+
+        while start < len(keys):
+            root = keys[start] // _BRANCH_COUNT
+            stop = bisect_left(keys, (root + 1) * _BRANCH_COUNT, start)
+            cnpjs = list(map(_from_key, keys[start:stop]))
+            start = stop
+
+            yield cnpjs[0][:8], cnpjs
+
+    def save(self, path):  # type: (str | os.PathLike) -> None
+        """
+        Saves the index to a file, to be loaded with `load`.
+
+        The file holds a small header followed by the sorted integers, as
+        little-endian 64-bit integers.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+        """
+
+        keys = array("Q", self._keys)
+
+        if byteorder == "big":
+            keys.byteswap()
+
+        with open(path, "wb") as file:
+            file.write(
+                _INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, len(keys))
+            )
+            keys.tofile(file)
+
+
 def _hashdigit(cnpj, position):  # type: (str, int) -> int
     """
     Calculates the checksum digit at the given `position` for the provided
@@ -228,11 +1129,7 @@ def _hashdigit(cnpj, position):  # type: (str, int) -> int
         9
     """
 
-    weightgen = chain(range(position - 8, 1, -1), range(9, 1, -1))
-    val = (
-        sum(int(digit) * weight for digit, weight in zip(cnpj, weightgen)) % 11
-    )
-    return 0 if val < 2 else 11 - val
+    return _CHECK_DIGIT.digit(cnpj.encode(), position - 13)
 
 
 def _checksum(basenum):  # type: (str) -> str
@@ -257,6 +1154,436 @@ def _checksum(basenum):  # type: (str) -> str
         "41"
     """
 
-    verifying_digits = str(_hashdigit(basenum, 13))
-    verifying_digits += str(_hashdigit(basenum + verifying_digits, 14))
-    return verifying_digits
+    return _CHECK_DIGIT.check_digits(basenum.encode())
+
+
+def _has_valid_characters(cnpj):  # type: (str) -> bool
+    """
+    Checks whether a CNPJ has 14 characters, the first 12 being digits or
+    uppercase letters and the last 2 being digits, without verifying its
+    check digits.
+
+    Args:
+        cnpj (str): The CNPJ without symbols.
+
+    Returns:
+        bool: True if the characters are allowed, False otherwise.
+
+    Example:
+        >>> _has_valid_characters("12ABC34501DE35")
+        True
+        >>> _has_valid_characters("12abc34501de35")
+        False
+    """
+
+    return (
+        len(cnpj) == 14
+        and cnpj.isascii()
+        and not cnpj[:12].strip(_BASE_CHARACTERS)
+        and cnpj[12:].isdigit()
+    )
+
+
+def _validate_item(cnpj):  # type: (str | bytes) -> bool
+    """
+    Validates a single CNPJ given as a string or bytes, through the fast
+    bytes path whenever possible.
+
+    Args:
+        cnpj (str | bytes): The CNPJ to be validated.
+
+    Returns:
+        bool: True if the CNPJ is valid, False otherwise.
+    """
+
+    if isinstance(cnpj, bytes):
+        return _validate_bytes(cnpj)
+
+    if isinstance(cnpj, str) and cnpj.isascii():
+        return _validate_bytes(cnpj.encode())
+
+    return False
+
+
+def _validate_bytes(cnpj):  # type: (bytes) -> bool
+    """
+    Validates the checksum digits of an ASCII encoded CNPJ in a single pass,
+    using the per-position weight tables.
+
+    Args:
+        cnpj (bytes): The ASCII encoded CNPJ.
+
+    Returns:
+        bool: True if the CNPJ is valid, False otherwise.
+
+    Example:
+        >>> _validate_bytes(b"12ABC34501DE35")
+        True
+        >>> _validate_bytes(b"11111111111111")
+        False
+    """
+
+    if (
+        len(cnpj) != 14
+        or cnpj[:12].strip(_BASE_BYTES)
+        or not cnpj[12:].isdigit()
+    ):
+        return False
+
+    return _validate_values(*cnpj)
+
+
+def _validate_list(cnpjs):  # type: (list) -> list[bool]
+    """
+    Validates a list of CNPJs, packing the ones that are 14-character ASCII
+    strings into a buffer for `_validate_buffer` and validating any bytes
+    on their own.
+
+    Args:
+        cnpjs (list): The CNPJs to be validated, of any type.
+
+    Returns:
+        list[bool]: One boolean per input, True where the CNPJ is valid.
+    """
+
+    packed = [
+        position
+        for position, cnpj in enumerate(cnpjs)
+        if isinstance(cnpj, str) and len(cnpj) == 14
+    ]
+    text = "".join([cnpjs[position] for position in packed])
+
+    if not text.isascii():
+        return [_validate_item(cnpj) for cnpj in cnpjs]
+
+    packed_validity = _validate_buffer(text.encode())
+
+    if len(packed) == len(cnpjs):
+        return packed_validity
+
+    validity = [
+        isinstance(cnpj, bytes) and _validate_bytes(cnpj) for cnpj in cnpjs
+    ]
+
+    for position, is_valid_cnpj in zip(packed, packed_validity):
+        validity[position] = is_valid_cnpj
+
+    return validity
+
+
+def _validate_buffer(buffer):  # type: (bytes) -> list[bool]
+    """
+    Validates the CNPJs of a buffer column by column.
+
+    The buffer is split into one column per character position with
+    extended slices. The check digits of every CNPJ are then computed by
+    mapping `_validate_values` over the columns, and the CNPJs holding an
+    invalid character are looked for only in the columns that have one.
+
+    Args:
+        buffer (bytes): The ASCII characters of the CNPJs, back to back.
+
+    Returns:
+        list[bool]: One boolean per CNPJ, True where it is valid.
+    """
+
+    columns = [buffer[position::14] for position in range(14)]
+    validity = list(map(_validate_values, *columns))
+
+    for position, column in enumerate(columns):
+        allowed = _BASE_BYTES if position < 12 else _DIGIT_BYTES
+
+        if column.translate(None, allowed):
+            for row, byte in enumerate(column):
+                if byte not in allowed:
+                    validity[row] = False
+
+    return validity
+
+
+def _validate_values(
+    d0, d1, d2, d3, d4, d5, d6, d7, d8, d9, d10, d11, d12, d13
+):  # type: (int, int, int, int, int, int, int, int, int, int, int, int, int, int) -> bool
+    """
+    Validates the checksum digits of a CNPJ given as the ASCII codes of its
+    14 characters, which must be allowed in their positions.
+
+    Args:
+        d0 ... d13 (int): The ASCII codes of the characters.
+
+    Returns:
+        bool: True if the CNPJ is valid, False otherwise.
+
+    Example:
+        >>> _validate_values(*b"12ABC34501DE35")
+        True
+    """
+
+    t0, t1, t2, t3, t4, t5, t6, t7, t8, t9, t10, t11 = _FIRST_DIGIT_TABLES
+    val = t0[d0] + t1[d1] + t2[d2] + t3[d3] + t4[d4] + t5[d5]
+    val = (val + t6[d6] + t7[d7] + t8[d8] + t9[d9] + t10[d10] + t11[d11]) % 11
+
+    if (0 if val < 2 else 11 - val) != d12 - 48:
+        return False
+
+    t0, t1, t2, t3, t4, t5, t6, t7, t8, t9, t10, t11, t12 = _SECOND_DIGIT_TABLES
+    val = t0[d0] + t1[d1] + t2[d2] + t3[d3] + t4[d4] + t5[d5] + t6[d6]
+    val = (val + t7[d7] + t8[d8] + t9[d9] + t10[d10] + t11[d11] + t12[d12]) % 11
+
+    # CNPJs made of a single repeated character are not valid, even when
+    # their check digits match, like "00000000000000".
+    return (0 if val < 2 else 11 - val) == d13 - 48 and not (
+        d0 == d1 == d2 == d3 == d4 == d5 == d6 == d7
+        and d7 == d8 == d9 == d10 == d11 == d12 == d13
+    )
+
+
+def _validate_int(value):  # type: (int) -> bool
+    """
+    Validates the checksum digits of a CNPJ given as an integer, splitting
+    its base number into 3-digit chunks through division.
+
+    Args:
+        value (int): The CNPJ, without its leading zeros.
+
+    Returns:
+        bool: True if the CNPJ is valid, False otherwise.
+
+    Example:
+        >>> _validate_int(1838723000127)
+        True
+    """
+
+    try:
+        value = index(value)
+    except TypeError:
+        return False
+
+    if not 0 <= value < 100_000_000_000_000 or value % 11_111_111_111_111 == 0:
+        return False
+
+    base, check_digits = divmod(value, 100)
+    first, second = _check_digits_of(base)
+
+    return check_digits == first * 10 + second
+
+
+def _check_digits_of(base):  # type: (int) -> tuple[int, int]
+    """
+    Computes both check digits of a CNPJ from its integer base number.
+
+    Args:
+        base (int): The base number, between 0 and 999999999999.
+
+    Returns:
+        tuple[int, int]: The first and second check digits.
+
+    Example:
+        >>> _check_digits_of(18387230001)
+        (2, 7)
+    """
+
+    high, low = divmod(base, 1000)
+    high, middle_low = divmod(high, 1000)
+    high, middle_high = divmod(high, 1000)
+    sums = _FIRST_CHUNK_SUMS
+    total = (
+        sums[0][high]
+        + sums[1][middle_high]
+        + sums[2][middle_low]
+        + sums[3][low]
+    )
+    first = CHECK_DIGITS[total % 11]
+    sums = _SECOND_CHUNK_SUMS
+    total = (
+        sums[0][high]
+        + sums[1][middle_high]
+        + sums[2][middle_low]
+        + sums[3][low]
+    )
+    second = CHECK_DIGITS[(total + 2 * first) % 11]
+
+    return first, second
+
+
+def _root_key(root):  # type: (str) -> int
+    """
+    Computes the smallest `CNPJIndex` key of a root.
+
+    Args:
+        root (str): The root, or a whole CNPJ, with or without symbols.
+
+    Returns:
+        int: The key of the root followed by branch number 0000.
+
+    Raises:
+        ValueError: If the root is invalid.
+    """
+
+    clean_root = remove_symbols(root) if isinstance(root, str) else ""
+
+    if len(clean_root) == 14:
+        clean_root = clean_root[:8]
+
+    if (
+        len(clean_root) != 8
+        or not clean_root.isascii()
+        or clean_root.strip(_BASE_CHARACTERS)
+    ):
+        raise ValueError(f"Invalid CNPJ root: {root!r}")
+
+    return int(clean_root, 36) * _BRANCH_COUNT
+
+
+def _from_key(key):  # type: (int) -> str
+    """
+    Builds the numbers-only CNPJ of a `CNPJIndex` key, converting it to base
+    36 two characters at a time and recomputing the check digits.
+
+    Args:
+        key (int): The base 36 value of the 12 base characters.
+
+    Returns:
+        str: The CNPJ.
+
+    Example:
+        >>> _from_key(int("035607140001", 36))
+        '03560714000142'
+    """
+
+    key, sixth = divmod(key, 1296)
+    key, fifth = divmod(key, 1296)
+    key, fourth = divmod(key, 1296)
+    key, third = divmod(key, 1296)
+    first, second = divmod(key, 1296)
+    base = "".join(
+        [
+            _BASE_PAIRS[first],
+            _BASE_PAIRS[second],
+            _BASE_PAIRS[third],
+            _BASE_PAIRS[fourth],
+            _BASE_PAIRS[fifth],
+            _BASE_PAIRS[sixth],
+        ]
+    )
+
+    return base + _CHECK_DIGIT.check_digits(base.encode())
+
+
+@lru_cache(maxsize=None)
+def _mask_template(visible, mask):  # type: (tuple[int, ...], str) -> MaskTemplate
+    """
+    Builds, and caches, the mask template of the CNPJ display layout.
+
+    Args:
+        visible (tuple[int, ...]): The indexes of the segments to keep
+            visible.
+        mask (str): The character that replaces hidden digits.
+
+    Returns:
+        MaskTemplate: The mask template.
+    """
+
+    return MaskTemplate("##.###.###/####-##", visible, mask)
+
+
+def _read_establishments(source, chunk_size, drop_invalid, on_chunk):  # type: (str | os.PathLike | IO[bytes], int, bool, Callable[[int, int], None] | None) -> Iterator[Establishment]
+    """
+    Generator behind `read_establishments`.
+    """
+
+    column_count = len(_ESTABLISHMENT_COLUMNS)
+    fields = _ESTABLISHMENT_FIELDS
+    parse_int = _parse_int
+    parse_date = _parse_date
+
+    with ZipFile(source) as archive:
+        for member in archive.infolist():
+            if member.is_dir():
+                continue
+
+            with TextIOWrapper(
+                archive.open(member), encoding="latin-1", newline=""
+            ) as file:
+                rows = reader(file, delimiter=";")
+                row_count = 0
+
+                while chunk := list(islice(rows, chunk_size)):
+                    if set(map(len, chunk)) != {column_count}:
+                        position, row = next(
+                            (position, row)
+                            for position, row in enumerate(chunk)
+                            if len(row) != column_count
+                        )
+                        raise ValueError(
+                            f"Row {row_count + position + 1} of "
+                            f"{member.filename!r} has {len(row)} columns "
+                            f"instead of {column_count}."
+                        )
+
+                    row_count += len(chunk)
+                    cnpjs = [row[0] + row[1] + row[2] for row in chunk]
+                    validity = is_valid_many(cnpjs)
+
+                    for cnpj, row, is_valid_cnpj in zip(cnpjs, chunk, validity):
+                        if not is_valid_cnpj and drop_invalid:
+                            continue
+
+                        record = dict(zip(fields, [cnpj, *row]))
+                        record["identificador_matriz_filial"] = parse_int(
+                            row[3]
+                        )
+                        record["situacao_cadastral"] = parse_int(row[5])
+                        record["data_situacao_cadastral"] = parse_date(row[6])
+                        record["motivo_situacao_cadastral"] = parse_int(row[7])
+                        record["data_inicio_atividade"] = parse_date(row[10])
+                        record["cnae_fiscal_secundaria"] = (
+                            row[12].split(",") if row[12] else []
+                        )
+                        record["data_situacao_especial"] = parse_date(row[29])
+                        yield record
+
+                    if on_chunk is not None:
+                        on_chunk(len(chunk), validity.count(False))
+
+
+@lru_cache(maxsize=1024)
+def _parse_int(value):  # type: (str) -> int | None
+    """
+    Converts a code of an establishment file to an integer, and caches it,
+    since codes take few distinct values.
+
+    Args:
+        value (str): The code, possibly empty.
+
+    Returns:
+        int | None: The code as an integer, or None if it is empty or not a
+        number.
+    """
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65_536)
+def _parse_date(value):  # type: (str) -> date | None
+    """
+    Converts a YYYYMMDD date of an establishment file to a `date`, and
+    caches it, since dates repeat a lot across rows.
+
+    Args:
+        value (str): The date, possibly empty or zeroed.
+
+    Returns:
+        date | None: The date, or None if it is empty, zeroed or invalid.
+    """
+
+    if len(value) != 8 or not value.isdigit():
+        return None
+
+    try:
+        return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+    except ValueError:
+        return None
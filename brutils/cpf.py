@@ -1,4 +1,84 @@
-from random import randint
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from hashlib import shake_256
+from operator import index, mul
+from random import Random, randint
+from sys import byteorder
+
+from brutils._check_digit import (
+    CHECK_DIGITS,
+    DIGIT_VALUES,
+    ENDINGS,
+    SUBSTITUTION_COSTS,
+    Mod11,
+)
+from brutils._keys import SortedKeyBuilder
+from brutils._mask import MaskTemplate
+from brutils.data.enums import FiscalRegion
+
+# The first check digit weighs the 9 base digits from 10 down to 2, and the
+# second one weighs those plus the first check digit from 11 down to 2.
+_CHECK_DIGIT = Mod11(tuple(range(10, 1, -1)), tuple(range(11, 1, -1)))
+
+# Lookup tables mapping each ASCII byte to its digit value multiplied by the
+# weight of a given position, one table per position. They let the batch
+# validation sum a CPF with plain indexing instead of int() conversions.
+_FIRST_DIGIT_TABLES = tuple(
+    tuple(
+        (byte - 48) * weight if 48 <= byte <= 57 else 0 for byte in range(256)
+    )
+    for weight in range(10, 1, -1)
+)
+_SECOND_DIGIT_TABLES = tuple(
+    tuple(
+        (byte - 48) * weight if 48 <= byte <= 57 else 0 for byte in range(256)
+    )
+    for weight in range(11, 1, -1)
+)
+
+# Weighted sums of every 3-digit chunk of a base number, for each chunk
+# position (most significant first) and each check digit. They let the bulk
+# generation compute check digits straight from an integer base number.
+_FIRST_CHUNK_SUMS = tuple(
+    tuple(
+        a * (chunk // 100) + b * (chunk // 10 % 10) + c * (chunk % 10)
+        for chunk in range(1000)
+    )
+    for a, b, c in ((10, 9, 8), (7, 6, 5), (4, 3, 2))
+)
+_SECOND_CHUNK_SUMS = tuple(
+    tuple(
+        a * (chunk // 100) + b * (chunk // 10 % 10) + c * (chunk % 10)
+        for chunk in range(1000)
+    )
+    for a, b, c in ((11, 10, 9), (8, 7, 6), (5, 4, 3))
+)
+
+# Number of base numbers a generated CPF can have, from 000000001 up to
+# 999999998.
+_BASE_COUNT = 999_999_998
+
+# Number of base numbers that are not made of a single repeated digit.
+_UNIQUE_BASE_COUNT = 1_000_000_000 - 10
+
+# Number of rounds of the Feistel network behind the random and keyed
+# permutations of the base numbers.
+_FEISTEL_ROUNDS = 10
+
+# Weighted sums of the 7th and 8th base digits for each check digit, along
+# with their digit strings, for every value from 00 to 99.
+_TENS = tuple(
+    (4 * (tens // 10) + 3 * (tens % 10), 5 * (tens // 10) + 4 * (tens % 10))
+    + (f"{tens:02d}",)
+    for tens in range(100)
+)
+
+# Fiscal regions by the ASCII code of the 9th digit of a CPF.
+_FISCAL_REGIONS_BY_DIGIT = {
+    48 + digit: FiscalRegion(digit or 10) for digit in range(10)
+}
 
 # FORMATTING
 ############
@@ -29,7 +109,7 @@ def sieve(dirty):  # type: (str) -> str
        backward compatibility.
     """
 
-    return "".join(filter(lambda char: char not in ".-", dirty))
+    return dirty.replace(".", "").replace("-", "")
 
 
 def remove_symbols(dirty):  # type: (str) -> str
@@ -104,6 +184,83 @@ def format_cpf(cpf):  # type: (str) -> str
     return "{}.{}.{}-{}".format(cpf[:3], cpf[3:6], cpf[6:9], cpf[9:11])
 
 
+def mask_cpf(cpf, visible=(1, 2), mask="*"):  # type: (str, Iterable[int], str) -> str | None
+    """
+    Format a CPF for display, masking some of its digits.
+
+    The formatted CPF has four digit segments, "123.456.789-01" being
+    segments 0 to 3. The digits of the segments that are not visible are
+    replaced by the mask character, as required by LGPD compliant reports.
+
+    Args:
+        cpf (str): A numbers-only CPF string.
+        visible (Iterable[int], optional): The indexes of the segments to
+            keep visible. Defaults to (1, 2).
+        mask (str, optional): The character that replaces hidden digits.
+            Defaults to "*".
+
+    Returns:
+        str: The masked CPF, or None if the input is invalid.
+
+    Raises:
+        ValueError: If a segment index is out of range or the mask is not a
+            single ASCII character.
+
+    Example:
+        >>> mask_cpf("82178537464")
+        '***.785.374-**'
+        >>> mask_cpf("82178537464", visible=(0, 3), mask="X")
+        '821.XXX.XXX-64'
+    """
+
+    if not is_valid(cpf):
+        return None
+
+    return _mask_template(tuple(visible), mask).apply(cpf.encode())[0]
+
+
+def mask_cpf_many(cpfs, visible=(1, 2), mask="*"):  # type: (Iterable[str | bytes], Iterable[int], str) -> list[str | None]
+    """
+    Mask a whole column of CPFs at once.
+
+    The result is the same as calling `mask_cpf` on every item, but the
+    valid CPFs are masked together, copying each visible digit of all of
+    them into a preallocated template with a single slice assignment, so
+    there is no per-item formatting overhead.
+
+    Args:
+        cpfs (Iterable[str | bytes]): The numbers-only CPFs to be masked, as
+            strings or bytes.
+        visible (Iterable[int], optional): The indexes of the segments to
+            keep visible. Defaults to (1, 2).
+        mask (str, optional): The character that replaces hidden digits.
+            Defaults to "*".
+
+    Returns:
+        list[str | None]: The masked CPFs, with None for the invalid ones.
+
+    Raises:
+        ValueError: If a segment index is out of range or the mask is not a
+            single ASCII character.
+
+    Example:
+        >>> mask_cpf_many(["82178537464", "1", "55550207753"])
+        ['***.785.374-**', None, '***.502.077-**']
+    """
+
+    template = _mask_template(tuple(visible), mask)
+    cpfs = list(cpfs)
+    validity = is_valid_many(cpfs)
+    buffer = b"".join(
+        cpf.encode() if isinstance(cpf, str) else cpf
+        for cpf, is_valid_cpf in zip(cpfs, validity)
+        if is_valid_cpf
+    )
+    masked = iter(template.apply(buffer))
+
+    return [next(masked) if is_valid_cpf else None for is_valid_cpf in validity]
+
+
 # OPERATIONS
 ############
 
@@ -133,10 +290,15 @@ def validate(cpf):  # type: (str) -> bool
        backward compatibility.
     """
 
-    if not cpf.isdigit() or len(cpf) != 11 or len(set(cpf)) == 1:
+    if (
+        not cpf.isdigit()
+        or not cpf.isascii()
+        or len(cpf) != 11
+        or len(set(cpf)) == 1
+    ):
         return False
 
-    return all(_hashdigit(cpf, i + 10) == int(v) for i, v in enumerate(cpf[9:]))
+    return _CHECK_DIGIT.is_valid(cpf.encode())
 
 
 def is_valid(cpf):  # type: (str) -> bool
@@ -164,6 +326,101 @@ def is_valid(cpf):  # type: (str) -> bool
     return isinstance(cpf, str) and validate(cpf)
 
 
+def is_valid_many(cpfs):  # type: (Iterable[str | bytes] | bytes) -> list[bool]
+    """
+    Validates many CPFs at once, returning a boolean mask.
+
+    The result is the same as calling `is_valid` on every item, but each CPF
+    is checked in a single pass over its ASCII bytes using precomputed
+    weight tables, which is several times faster for large columns.
+
+    Args:
+        cpfs (Iterable[str | bytes] | bytes): The CPFs to be validated. It can
+            be any iterable of strings or bytes (a list, a NumPy array of
+            fixed-width bytes, etc.) or a single bytes-like buffer holding
+            the 11-digit CPFs back to back.
+
+    Returns:
+        list[bool]: One boolean per input, True where the CPF is valid.
+
+    Raises:
+        ValueError: If a bytes-like buffer length is not a multiple of 11.
+
+    Example:
+        >>> is_valid_many(["82178537464", "55550207753", "11111111111"])
+        [True, True, False]
+        >>> is_valid_many(b"8217853746455550207754")
+        [True, False]
+    """
+
+    if isinstance(cpfs, (bytes, bytearray, memoryview)):
+        buffer = bytes(cpfs)
+
+        if len(buffer) % 11:
+            raise ValueError(
+                "The buffer length must be a multiple of 11 to hold CPFs."
+            )
+
+        return [
+            _validate_bytes(buffer[start : start + 11])
+            for start in range(0, len(buffer), 11)
+        ]
+
+    return [_validate_item(cpf) for cpf in cpfs]
+
+
+def is_valid_int_many(values):  # type: (Iterable[int]) -> list[bool]
+    """
+    Validates many CPFs given as integers, returning a boolean mask.
+
+    Spreadsheets often store CPFs as numbers, losing their leading zeros.
+    Instead of converting each value to a zero-padded string, the check
+    digits are computed straight from the integer through division, so
+    `1234567890` stands for the CPF "01234567890".
+
+    Args:
+        values (Iterable[int]): The CPFs to be validated, as Python integers
+            or any other integer type, like the items of a NumPy int64
+            array. Values of other types are invalid.
+
+    Returns:
+        list[bool]: One boolean per input, True where the CPF is valid.
+
+    Example:
+        >>> is_valid_int_many([82178537464, 1234567890, 11111111111])
+        [True, True, False]
+    """
+
+    return list(map(_validate_int, values))
+
+
+def normalize_int_many(values):  # type: (Iterable[int]) -> list[str | None]
+    """
+    Converts many CPFs given as integers into numbers-only CPF strings.
+
+    Each value is validated on its integer representation, as done by
+    `is_valid_int_many`, and only the valid ones are formatted, with their
+    leading zeros restored.
+
+    Args:
+        values (Iterable[int]): The CPFs to be converted, as Python integers
+            or any other integer type, like the items of a NumPy int64
+            array.
+
+    Returns:
+        list[str | None]: The 11-digit CPFs, with None for the invalid ones.
+
+    Example:
+        >>> normalize_int_many([82178537464, 1234567890, 1234567891])
+        ['82178537464', '01234567890', None]
+    """
+
+    return [
+        f"{index(value):011d}" if _validate_int(value) else None
+        for value in values
+    ]
+
+
 def generate():  # type: () -> str
     """
     Generate a random valid CPF digit string.
@@ -185,6 +442,678 @@ def generate():  # type: () -> str
     return base + _checksum(base)
 
 
+def generate_many(n, seed=None, unique=False, formatted=False):  # type: (int, int | None, bool, bool) -> Iterator[str]
+    """
+    Generate many random valid CPFs lazily, for synthetic datasets.
+
+    Base numbers are drawn from a `random.Random` instance and the check
+    digits are computed straight from the integer base, which is much faster
+    than calling `generate` in a loop. Base numbers made of a single repeated
+    digit are never produced.
+
+    Args:
+        n (int): How many CPFs to generate.
+        seed (int, optional): Seed for the random generator. The same seed
+            always produces the same sequence of CPFs. Defaults to None.
+        unique (bool, optional): Whether every generated CPF must be
+            distinct. Uniqueness is guaranteed by walking a random
+            permutation of the base numbers, so it needs no memory for the
+            already generated CPFs. Defaults to False.
+        formatted (bool, optional): Whether to yield the CPFs formatted with
+            visual aid symbols, as `format_cpf` does. Defaults to False.
+
+    Returns:
+        Iterator[str]: An iterator over `n` random valid CPFs.
+
+    Raises:
+        ValueError: If `n` is negative, or if `unique` is True and `n` is
+            greater than the number of existing CPFs.
+
+    Example:
+        >>> list(generate_many(2, seed=42))
+        ['68657930480', '11954083238']
+        >>> list(generate_many(2, seed=42, formatted=True))
+        ['686.579.304-80', '119.540.832-38']
+    """
+
+    if n < 0:
+        raise ValueError("The number of CPFs to generate must not be negative.")
+
+    rng = Random(seed)
+
+    if unique:
+        if n > _UNIQUE_BASE_COUNT:
+            raise ValueError(
+                f"Cannot generate more than {_UNIQUE_BASE_COUNT} unique CPFs."
+            )
+
+        bases = _unique_bases(rng, n)
+    else:
+        bases = _random_bases(rng, n)
+
+    return map(_format_base if formatted else _from_base, bases)
+
+
+def iter_valid(start_base=0, stop_base=1_000_000_000):  # type: (int, int) -> Iterator[str]
+    """
+    Iterate over every valid CPF whose base number is in a range, in order.
+
+    Instead of computing the check digits of each base number from scratch,
+    the weighted sums of the first 6 base digits are computed once for each
+    block of 1000 base numbers and the sums of the remaining digits are
+    added from precomputed tables, which also hold the ready-made endings
+    of the CPFs. Base numbers made of a single repeated digit are skipped,
+    since their CPFs are not valid.
+
+    Args:
+        start_base (int, optional): The first base number, inclusive.
+            Defaults to 0.
+        stop_base (int, optional): The last base number, exclusive. Defaults
+            to 1000000000, which covers every CPF.
+
+    Returns:
+        Iterator[str]: An iterator over the numbers-only valid CPFs.
+
+    Raises:
+        ValueError: If the range is not within 0 and 1000000000.
+
+    Example:
+        >>> list(iter_valid(1, 4))
+        ['00000000191', '00000000272', '00000000353']
+    """
+
+    if not 0 <= start_base <= stop_base <= 1_000_000_000:
+        raise ValueError(
+            "The base numbers must be between 0 and 1000000000, in order."
+        )
+
+    return _iter_valid(start_base, stop_base)
+
+
+def shard_bases(count, start_base=0, stop_base=1_000_000_000):  # type: (int, int, int) -> list[tuple[int, int]]
+    """
+    Split a range of CPF base numbers into shards of about the same size.
+
+    The shards are contiguous and, together, cover the whole range in
+    order, so that each one can be enumerated with `iter_valid` by a
+    different process, e.g. through a `ProcessPoolExecutor`. Their bounds
+    are multiples of 1000 when the shards are at least that long, which is
+    what `iter_valid` processes fastest.
+
+    Args:
+        count (int): How many shards to split the range into.
+        start_base (int, optional): The first base number, inclusive.
+            Defaults to 0.
+        stop_base (int, optional): The last base number, exclusive. Defaults
+            to 1000000000, which covers every CPF.
+
+    Returns:
+        list[tuple[int, int]]: The `(start_base, stop_base)` bounds of each
+        shard. Shards may be empty if the range is too small.
+
+    Raises:
+        ValueError: If `count` is not positive or the range is not within 0
+            and 1000000000.
+
+    Example:
+        >>> shard_bases(3)
+        [(0, 333333000), (333333000, 666666000), (666666000, 1000000000)]
+        >>> def count_valid(shard):
+        ...     return sum(1 for _ in iter_valid(*shard))
+        >>> with ProcessPoolExecutor() as executor:
+        ...     sum(executor.map(count_valid, shard_bases(8)))
+        999999990
+    """
+
+    if count < 1:
+        raise ValueError("The number of shards must be positive.")
+
+    if not 0 <= start_base <= stop_base <= 1_000_000_000:
+        raise ValueError(
+            "The base numbers must be between 0 and 1000000000, in order."
+        )
+
+    aligned = stop_base - start_base >= 1000 * count
+    bounds = [start_base]
+
+    for shard in range(1, count):
+        bound = start_base + (stop_base - start_base) * shard // count
+        bounds.append(bound - bound % 1000 if aligned else bound)
+
+    bounds.append(stop_base)
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def suggest_corrections(cpf):  # type: (str) -> list[str]
+    """
+    Suggest valid CPFs one typo away from the given one.
+
+    This function tries every single-digit substitution and every swap of
+    two adjacent digits of the CPF, and returns the candidates whose
+    checksum digits are valid. The weighted sums of the original CPF are
+    computed once and each candidate only adjusts them by the changed
+    digits, so the whole search takes a few dozen microseconds.
+
+    Candidates are ranked by how likely the typo is: swapped digits first,
+    then digits next to each other on a numeric keypad, then digits that
+    look alike, then any other substitution.
+
+    Args:
+        cpf (str): The mistyped CPF. It may contain symbols.
+
+    Returns:
+        list[str]: The numbers-only candidate CPFs, most likely first. The
+        list is empty if the input does not hold 11 digits.
+
+    Example:
+        >>> suggest_corrections("821.785.374-65")
+        ['82178537464']
+        >>> suggest_corrections("11144477753")
+        ['11144477573', '11144477735']
+    """
+
+    if not isinstance(cpf, str):
+        return []
+
+    clean_cpf = remove_symbols(cpf)
+
+    if (
+        len(clean_cpf) != 11
+        or not clean_cpf.isdigit()
+        or not clean_cpf.isascii()
+    ):
+        return []
+
+    digits = clean_cpf.encode().translate(DIGIT_VALUES)
+    # Pad the weights with zeros so that both sums cover all 11 positions
+    first_weights, second_weights = _CHECK_DIGIT.weights
+    first_weights += (0, 0)
+    second_weights += (0,)
+    first_sum = sum(map(mul, digits, first_weights))
+    second_sum = sum(map(mul, digits, second_weights))
+    suggestions = []
+
+    for position, digit in enumerate(digits):
+        for replacement in range(10):
+            if replacement == digit:
+                continue
+
+            delta = replacement - digit
+            candidate = bytearray(digits)
+            candidate[position] = replacement
+
+            if _matches_check_digits(
+                candidate,
+                first_sum + delta * first_weights[position],
+                second_sum + delta * second_weights[position],
+            ):
+                cost = SUBSTITUTION_COSTS.get(
+                    frozenset((digit, replacement)), 3
+                )
+                suggestions.append((cost, position, candidate))
+
+    for position in range(10):
+        digit, next_digit = digits[position], digits[position + 1]
+
+        if digit == next_digit:
+            continue
+
+        delta = next_digit - digit
+        candidate = bytearray(digits)
+        candidate[position], candidate[position + 1] = next_digit, digit
+        first_weight_delta = (
+            first_weights[position] - first_weights[position + 1]
+        )
+        second_weight_delta = (
+            second_weights[position] - second_weights[position + 1]
+        )
+
+        if _matches_check_digits(
+            candidate,
+            first_sum + delta * first_weight_delta,
+            second_sum + delta * second_weight_delta,
+        ):
+            suggestions.append((0, position, candidate))
+
+    suggestions.sort(key=lambda suggestion: suggestion[:2])
+
+    return ["".join(map(str, candidate)) for _, _, candidate in suggestions]
+
+
+def get_fiscal_region(cpf):  # type: (str) -> FiscalRegion | None
+    """
+    Get the Receita Federal fiscal region that issued a CPF.
+
+    The 9th digit of a CPF identifies the fiscal region where it was
+    issued, and each region covers one or more UFs, available through the
+    `ufs` property of the returned region. The digit 0 stands for the 10th
+    region.
+
+    Args:
+        cpf (str): A numbers-only CPF string.
+
+    Returns:
+        FiscalRegion | None: The fiscal region of the CPF, or None if the
+        CPF is invalid.
+
+    Example:
+        >>> get_fiscal_region("82178537464")
+        <FiscalRegion.RF04: 4>
+        >>> get_fiscal_region("82178537464").ufs
+        (<UF.AL: 'Alagoas'>, <UF.PB: 'Paraíba'>, <UF.PE: 'Pernambuco'>, <UF.RN: 'Rio Grande do Norte'>)
+        >>> get_fiscal_region("00000000000")
+        None
+    """
+
+    if not is_valid(cpf):
+        return None
+
+    return FiscalRegion(int(cpf[8]) or 10)
+
+
+def count_by_fiscal_region(cpfs):  # type: (Iterable[str | bytes]) -> Counter[FiscalRegion | None]
+    """
+    Count how many CPFs of a column were issued by each fiscal region.
+
+    The CPFs are validated and tallied by their 9th digit in a single pass,
+    in the same way as `is_valid_many` validates them, so large columns can
+    be profiled without calling `get_fiscal_region` for every item.
+
+    Args:
+        cpfs (Iterable[str | bytes]): The numbers-only CPFs to count, as
+            strings or bytes.
+
+    Returns:
+        Counter[FiscalRegion | None]: The number of CPFs per fiscal region.
+        Invalid CPFs are counted under None.
+
+    Example:
+        >>> count_by_fiscal_region(["82178537464", "55550207753", "1"])
+        Counter({<FiscalRegion.RF04: 4>: 1, <FiscalRegion.RF07: 7>: 1, None: 1})
+    """
+
+    digits = Counter(map(_fiscal_region_digit, cpfs))
+
+    return Counter(
+        {
+            _FISCAL_REGIONS_BY_DIGIT.get(digit): count
+            for digit, count in digits.items()
+        }
+    )
+
+
+def pseudonymize(cpf, key):  # type: (str, str | bytes) -> str | None
+    """
+    Map a CPF to a deterministic, keyed pseudonym that is a valid CPF too.
+
+    The 9-digit base number goes through a format-preserving permutation
+    derived from the secret key, and the check digits are recomputed for the
+    new base number. The same CPF and key always give the same pseudonym
+    and different CPFs always give different pseudonyms. This is
+    pseudonymization, not anonymization: there are only about a billion
+    CPFs, so anyone holding the key can rebuild the whole mapping, and the
+    pseudonyms are only as private as the key. The key schedule is built
+    once per key and cached.
+
+    Args:
+        cpf (str): A numbers-only CPF string.
+        key (str | bytes): The secret key of the pseudonymization.
+
+    Returns:
+        str: The numbers-only pseudonym, or None if the CPF is invalid.
+
+    Example:
+        >>> pseudonymize("82178537464", "secret")
+        '19065387862'
+        >>> pseudonymize("82178537464", "another secret")
+        '56069925076'
+    """
+
+    if not is_valid(cpf):
+        return None
+
+    return _from_base(_key_permutation(key).permute(int(cpf[:9])))
+
+
+def pseudonymize_many(cpfs, key):  # type: (Iterable[str | bytes], str | bytes) -> list[str | None]
+    """
+    Pseudonymize a whole column of CPFs with the same key.
+
+    The result is the same as calling `pseudonymize` on every item, but the
+    CPFs are validated all at once and the key schedule is only looked up
+    once for the whole column.
+
+    Args:
+        cpfs (Iterable[str | bytes]): The numbers-only CPFs to be
+            pseudonymized, as strings or bytes.
+        key (str | bytes): The secret key of the pseudonymization.
+
+    Returns:
+        list[str | None]: The numbers-only pseudonyms, with None for the
+        invalid CPFs.
+
+    Example:
+        >>> pseudonymize_many(["82178537464", "1"], "secret")
+        ['19065387862', None]
+    """
+
+    permute = _key_permutation(key).permute
+    cpfs = list(cpfs)
+
+    return [
+        _from_base(permute(int(cpf[:9]))) if is_valid_cpf else None
+        for cpf, is_valid_cpf in zip(cpfs, is_valid_many(cpfs))
+    ]
+
+
+def parse_cpf(raw):  # type: (str) -> ParsedCPF
+    """
+    Parse a CPF that may contain symbols, in a single pass.
+
+    This function removes the symbols, validates the CPF and returns the
+    result in a lightweight object, so callers that need the clean digits,
+    the validation result and the formatted CPF do not have to call
+    `remove_symbols`, `is_valid` and `format_cpf` one after the other.
+
+    Args:
+        raw (str): The CPF to be parsed, with or without symbols.
+
+    Returns:
+        ParsedCPF: The parsing result, holding the clean `digits`, whether
+        the CPF `is_valid`, its `formatted` version and, for invalid CPFs,
+        the `error` that made it invalid: "invalid_type",
+        "invalid_length", "invalid_characters", "repeated_digits" or
+        "invalid_check_digits".
+
+    Example:
+        >>> parsed = parse_cpf("821.785.374-64")
+        >>> parsed.digits, parsed.is_valid, parsed.formatted
+        ('82178537464', True, '821.785.374-64')
+        >>> parse_cpf("111.111.111-11").error
+        'repeated_digits'
+    """
+
+    if not isinstance(raw, str):
+        return ParsedCPF(None, "invalid_type")
+
+    digits = raw.replace(".", "").replace("-", "")
+
+    if len(digits) != 11:
+        return ParsedCPF(digits, "invalid_length")
+
+    if not digits.isdigit() or not digits.isascii():
+        return ParsedCPF(digits, "invalid_characters")
+
+    if digits.count(digits[0]) == 11:
+        return ParsedCPF(digits, "repeated_digits")
+
+    if not _CHECK_DIGIT.is_valid(digits.encode()):
+        return ParsedCPF(digits, "invalid_check_digits")
+
+    return ParsedCPF(digits, None)
+
+
+class ParsedCPF:
+    """
+    The result of `parse_cpf`.
+
+    Attributes:
+        digits (str | None): The CPF without symbols, or None if the input
+            was not a string.
+        error (str | None): Why the CPF is invalid, or None if it is valid.
+    """
+
+    __slots__ = ("digits", "error")
+
+    def __init__(self, digits, error):  # type: (str | None, str | None) -> None
+        self.digits = digits
+        self.error = error
+
+    @property
+    def is_valid(self):  # type: () -> bool
+        """
+        Whether the CPF is valid.
+        """
+
+        return self.error is None
+
+    @property
+    def formatted(self):  # type: () -> str | None
+        """
+        The CPF formatted with visual aid symbols, or None if it is invalid.
+        """
+
+        if self.error is not None:
+            return None
+
+        digits = self.digits
+
+        return f"{digits[:3]}.{digits[3:6]}.{digits[6:9]}-{digits[9:]}"
+
+    def __repr__(self):  # type: () -> str
+        return f"ParsedCPF(digits={self.digits!r}, error={self.error!r})"
+
+
+class CPFArray:
+    """
+    A compact, sorted set of CPFs stored as 64-bit integers.
+
+    An 11-digit CPF fits in an unsigned 64-bit integer, so the CPFs are kept
+    in a sorted `array("Q")` instead of as `str` objects, using 8 bytes per
+    CPF. Duplicates are dropped on construction, membership tests use binary
+    search and set operations merge the sorted arrays in linear time.
+    Iterating yields the CPFs formatted by `format_cpf`, one at a time.
+
+    Args:
+        cpfs (Iterable[str], optional): The CPFs to store. They may contain
+            symbols, which are removed with `remove_symbols`.
+
+    Raises:
+        ValueError: If any of the given CPFs is invalid.
+
+    Example:
+        >>> cpfs = CPFArray(["821.785.374-64", "55550207753", "82178537464"])
+        >>> len(cpfs)
+        2
+        >>> "82178537464" in cpfs
+        True
+        >>> list(cpfs | CPFArray(["11144477735"]))
+        ['111.444.777-35', '555.502.077-53', '821.785.374-64']
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, cpfs=()):  # type: (Iterable[str]) -> None
+        builder = SortedKeyBuilder()
+
+        for cpf in cpfs:
+            clean_cpf = remove_symbols(cpf) if isinstance(cpf, str) else ""
+
+            if not is_valid(clean_cpf):
+                raise ValueError(f"Invalid CPF: {cpf!r}")
+
+            builder.add(int(clean_cpf))
+
+        self._values = builder.build()
+
+    @classmethod
+    def _from_sorted(cls, values):  # type: (array) -> CPFArray
+        cpf_array = cls.__new__(cls)
+        cpf_array._values = values
+
+        return cpf_array
+
+    def __len__(self):  # type: () -> int
+        return len(self._values)
+
+    def __iter__(self):  # type: () -> Iterator[str]
+        for value in self._values:
+            yield format_cpf(f"{value:011d}")
+
+    def __contains__(self, cpf):  # type: (object) -> bool
+        if not isinstance(cpf, str):
+            return False
+
+        clean_cpf = remove_symbols(cpf)
+
+        if (
+            not clean_cpf.isdigit()
+            or not clean_cpf.isascii()
+            or len(clean_cpf) != 11
+        ):
+            return False
+
+        value = int(clean_cpf)
+        index = bisect_left(self._values, value)
+
+        return index < len(self._values) and self._values[index] == value
+
+    def __eq__(self, other):  # type: (object) -> bool
+        if not isinstance(other, CPFArray):
+            return NotImplemented
+
+        return self._values == other._values
+
+    def __repr__(self):  # type: () -> str
+        return f"CPFArray({list(self)!r})"
+
+    def __or__(self, other):  # type: (object) -> CPFArray
+        if not isinstance(other, CPFArray):
+            return NotImplemented
+
+        return self.union(other)
+
+    def __and__(self, other):  # type: (object) -> CPFArray
+        if not isinstance(other, CPFArray):
+            return NotImplemented
+
+        return self.intersection(other)
+
+    def __sub__(self, other):  # type: (object) -> CPFArray
+        if not isinstance(other, CPFArray):
+            return NotImplemented
+
+        return self.difference(other)
+
+    @property
+    def nbytes(self):  # type: () -> int
+        """
+        The number of bytes used to store the CPFs.
+        """
+
+        return len(self._values) * self._values.itemsize
+
+    def union(self, other):  # type: (CPFArray | Iterable[str]) -> CPFArray
+        """
+        Returns the CPFs that are in this array or in the other one.
+
+        Args:
+            other (CPFArray | Iterable[str]): The other array, or any
+                iterable of CPFs, which is converted to an array first.
+
+        Returns:
+            CPFArray: A new array with the union of both.
+
+        Raises:
+            ValueError: If `other` is not an array and holds an invalid CPF.
+        """
+
+        if not isinstance(other, CPFArray):
+            other = CPFArray(other)
+
+        left, right = self._values, other._values
+        result = array("Q")
+        i, j = 0, 0
+
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                result.append(left[i])
+                i += 1
+            elif left[i] > right[j]:
+                result.append(right[j])
+                j += 1
+            else:
+                result.append(left[i])
+                i += 1
+                j += 1
+
+        result.extend(left[i:])
+        result.extend(right[j:])
+
+        return CPFArray._from_sorted(result)
+
+    def intersection(self, other):  # type: (CPFArray | Iterable[str]) -> CPFArray
+        """
+        Returns the CPFs that are both in this array and in the other one.
+
+        Args:
+            other (CPFArray | Iterable[str]): The other array, or any
+                iterable of CPFs, which is converted to an array first.
+
+        Returns:
+            CPFArray: A new array with the intersection of both.
+
+        Raises:
+            ValueError: If `other` is not an array and holds an invalid CPF.
+        """
+
+        if not isinstance(other, CPFArray):
+            other = CPFArray(other)
+
+        left, right = self._values, other._values
+        result = array("Q")
+        i, j = 0, 0
+
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                i += 1
+            elif left[i] > right[j]:
+                j += 1
+            else:
+                result.append(left[i])
+                i += 1
+                j += 1
+
+        return CPFArray._from_sorted(result)
+
+    def difference(self, other):  # type: (CPFArray | Iterable[str]) -> CPFArray
+        """
+        Returns the CPFs that are in this array but not in the other one.
+
+        Args:
+            other (CPFArray | Iterable[str]): The other array, or any
+                iterable of CPFs, which is converted to an array first.
+
+        Returns:
+            CPFArray: A new array with the difference of both.
+
+        Raises:
+            ValueError: If `other` is not an array and holds an invalid CPF.
+        """
+
+        if not isinstance(other, CPFArray):
+            other = CPFArray(other)
+
+        left, right = self._values, other._values
+        result = array("Q")
+        i, j = 0, 0
+
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                result.append(left[i])
+                i += 1
+            elif left[i] > right[j]:
+                j += 1
+            else:
+                i += 1
+                j += 1
+
+        result.extend(left[i:])
+
+        return CPFArray._from_sorted(result)
+
+
 def _hashdigit(cpf, position):  # type: (str, int) -> int
     """
     Compute the given position checksum digit for a CPF.
@@ -208,15 +1137,7 @@ def _hashdigit(cpf, position):  # type: (str, int) -> int
         6
     """
 
-    val = (
-        sum(
-            int(digit) * weight
-            for digit, weight in zip(cpf, range(position, 1, -1))
-        )
-        % 11
-    )
-
-    return 0 if val < 2 else 11 - val
+    return _CHECK_DIGIT.digit(cpf.encode(), position - 10)
 
 
 def _checksum(basenum):  # type: (str) -> str
@@ -239,7 +1160,463 @@ def _checksum(basenum):  # type: (str) -> str
         '26'
     """
 
-    verifying_digits = str(_hashdigit(basenum, 10))
-    verifying_digits += str(_hashdigit(basenum + verifying_digits, 11))
+    return _CHECK_DIGIT.check_digits(basenum.encode())
+
+
+def _validate_item(cpf):  # type: (str | bytes) -> bool
+    """
+    Validates a single CPF given as a string or bytes, through the fast
+    bytes path whenever possible.
+
+    Args:
+        cpf (str | bytes): The CPF to be validated.
+
+    Returns:
+        bool: True if the CPF is valid, False otherwise.
+    """
+
+    if isinstance(cpf, bytes):
+        return _validate_bytes(cpf)
+
+    if isinstance(cpf, str) and cpf.isascii():
+        return _validate_bytes(cpf.encode())
+
+    return False
+
+
+def _validate_bytes(cpf):  # type: (bytes) -> bool
+    """
+    Validates the checksum digits of an ASCII encoded CPF in a single pass,
+    using the per-position weight tables.
+
+    Args:
+        cpf (bytes): The ASCII encoded CPF.
+
+    Returns:
+        bool: True if the CPF is valid, False otherwise.
+
+    Example:
+        >>> _validate_bytes(b"82178537464")
+        True
+        >>> _validate_bytes(b"11111111111")
+        False
+    """
+
+    if len(cpf) != 11 or not cpf.isdigit() or cpf.count(cpf[0]) == 11:
+        return False
+
+    d0, d1, d2, d3, d4, d5, d6, d7, d8, d9, d10 = cpf
+    t0, t1, t2, t3, t4, t5, t6, t7, t8 = _FIRST_DIGIT_TABLES
+    val = t0[d0] + t1[d1] + t2[d2] + t3[d3] + t4[d4]
+    val = (val + t5[d5] + t6[d6] + t7[d7] + t8[d8]) % 11
+
+    if (0 if val < 2 else 11 - val) != d9 - 48:
+        return False
+
+    t0, t1, t2, t3, t4, t5, t6, t7, t8, t9 = _SECOND_DIGIT_TABLES
+    val = t0[d0] + t1[d1] + t2[d2] + t3[d3] + t4[d4]
+    val = (val + t5[d5] + t6[d6] + t7[d7] + t8[d8] + t9[d9]) % 11
+
+    return (0 if val < 2 else 11 - val) == d10 - 48
+
+
+def _validate_int(value):  # type: (int) -> bool
+    """
+    Validates the checksum digits of a CPF given as an integer, splitting
+    its base number into 3-digit chunks through division.
+
+    Args:
+        value (int): The CPF, without its leading zeros.
+
+    Returns:
+        bool: True if the CPF is valid, False otherwise.
+
+    Example:
+        >>> _validate_int(1234567890)
+        True
+    """
+
+    try:
+        value = index(value)
+    except TypeError:
+        return False
+
+    if not 0 <= value < 100_000_000_000 or value % 11_111_111_111 == 0:
+        return False
+
+    base, check_digits = divmod(value, 100)
+    first, second = _check_digits_of(base)
+
+    return check_digits == first * 10 + second
+
+
+def _random_bases(rng, n):  # type: (Random, int) -> Iterator[int]
+    """
+    Draws `n` random CPF base numbers, skipping the ones made of a single
+    repeated digit.
+
+    Args:
+        rng (Random): The random generator to draw from.
+        n (int): How many base numbers to draw.
+
+    Returns:
+        Iterator[int]: The base numbers, as integers.
+    """
+
+    randrange = rng.randrange
+
+    for _ in range(n):
+        base = randrange(_BASE_COUNT) + 1
+
+        while base % 111_111_111 == 0:
+            base = randrange(_BASE_COUNT) + 1
+
+        yield base
+
+
+def _unique_bases(rng, n):  # type: (Random, int) -> Iterator[int]
+    """
+    Draws `n` distinct random CPF base numbers, skipping the ones made of a
+    single repeated digit.
+
+    The base numbers are the images of 1, 2, 3... through a random
+    permutation of the base number space, so they never repeat.
+
+    Args:
+        rng (Random): The random generator used to build the permutation.
+        n (int): How many base numbers to draw.
+
+    Returns:
+        Iterator[int]: The base numbers, as integers.
+    """
+
+    permute = _Permutation.from_random(rng).permute
+    index = 0
+
+    while n:
+        index += 1
+
+        if index % 111_111_111:
+            n -= 1
+            yield permute(index)
+
+
+def _iter_valid(start, stop):  # type: (int, int) -> Iterator[str]
+    """
+    Generator behind `iter_valid`.
+
+    Whole blocks of 1000 base numbers take the fast path, which derives the
+    CPFs from the weighted sums of the block and the `_TENS` and `ENDINGS`
+    tables. The partial blocks at both ends of the range and the blocks
+    holding a base number made of a single repeated digit are handled one
+    base number at a time.
+
+    Args:
+        start (int): The first base number, inclusive.
+        stop (int): The last base number, exclusive.
+
+    Returns:
+        Iterator[str]: The numbers-only valid CPFs.
+    """
+
+    first_block = -(-start // 1000)
+    stop_block = stop // 1000
+
+    if first_block >= stop_block:
+        yield from _iter_valid_slowly(start, stop)
+        return
+
+    yield from _iter_valid_slowly(start, first_block * 1000)
+
+    first_high, first_middle, _ = _FIRST_CHUNK_SUMS
+    second_high, second_middle, _ = _SECOND_CHUNK_SUMS
+
+    for block in range(first_block, stop_block):
+        if block % 111_111 == 0:
+            yield from _iter_valid_slowly(block * 1000, block * 1000 + 1000)
+            continue
+
+        high, middle = divmod(block, 1000)
+        first = first_high[high] + first_middle[middle]
+        second = second_high[high] + second_middle[middle]
+        head = f"{block:06d}"
+
+        for first_tens, second_tens, tens in _TENS:
+            endings = ENDINGS[
+                (first + first_tens) % 11 * 11 + (second + second_tens) % 11
+            ]
+            yield from map((head + tens).__add__, endings)
+
+    yield from _iter_valid_slowly(stop_block * 1000, stop)
+
+
+def _iter_valid_slowly(start, stop):  # type: (int, int) -> Iterator[str]
+    """
+    Yields the valid CPFs of a range of base numbers one at a time, skipping
+    the base numbers made of a single repeated digit.
+
+    Args:
+        start (int): The first base number, inclusive.
+        stop (int): The last base number, exclusive.
+
+    Returns:
+        Iterator[str]: The numbers-only valid CPFs.
+    """
+
+    for base in range(start, stop):
+        if base % 111_111_111:
+            yield _from_base(base)
+
+
+class _Permutation:
+    """
+    A permutation of the CPF base numbers, from 0 to 999999999, that are not
+    made of a single repeated digit.
+
+    It is a 10-round Feistel network over 30-bit integers whose round
+    functions are lookup tables of 15-bit values, drawn at random or derived
+    from a secret key; images falling outside the base numbers are walked
+    through the network again until they land on one.
+
+    Args:
+        rounds (tuple[array[int], ...]): The 10 round tables, each one with
+            32768 values of 15 bits.
+    """
+
+    __slots__ = ("rounds", "_pairs")
+
+    def __init__(self, rounds):  # type: (tuple[array[int], ...]) -> None
+        self.rounds = rounds
+        self._pairs = tuple(zip(rounds[::2], rounds[1::2]))
+
+    @classmethod
+    def from_random(cls, rng):  # type: (Random) -> _Permutation
+        """
+        Builds a random permutation.
+
+        Args:
+            rng (Random): The random generator used to fill the round tables.
+
+        Returns:
+            _Permutation: The permutation.
+        """
+
+        getrandbits = rng.getrandbits
+
+        return cls(
+            tuple(
+                array("H", [getrandbits(15) for _ in range(1 << 15)])
+                for _ in range(_FEISTEL_ROUNDS)
+            )
+        )
+
+    @classmethod
+    def from_key(cls, key):  # type: (bytes) -> _Permutation
+        """
+        Builds the permutation of a secret key, expanding it into the round
+        tables with SHAKE-256.
+
+        Args:
+            key (bytes): The secret key.
+
+        Returns:
+            _Permutation: The permutation.
+        """
+
+        values = array(
+            "H",
+            shake_256(b"brutils.cpf.pseudonymize:" + key).digest(
+                _FEISTEL_ROUNDS << 16
+            ),
+        )
+
+        if byteorder == "big":
+            values.byteswap()
+
+        return cls(
+            tuple(
+                array(
+                    "H",
+                    [
+                        value & 0x7FFF
+                        for value in values[start : start + (1 << 15)]
+                    ],
+                )
+                for start in range(0, _FEISTEL_ROUNDS << 15, 1 << 15)
+            )
+        )
+
+    def permute(self, value):  # type: (int) -> int
+        """
+        Maps a base number to its image through the permutation.
+
+        Args:
+            value (int): A base number that is not made of a single repeated
+                digit.
+
+        Returns:
+            int: The image of the base number, which is not made of a
+            single repeated digit either.
+        """
+
+        pairs = self._pairs
+
+        while True:
+            left, right = value >> 15, value & 0x7FFF
+
+            for even, odd in pairs:
+                left ^= even[right]
+                right ^= odd[left]
+
+            value = left << 15 | right
+
+            if value < 1_000_000_000 and value % 111_111_111:
+                return value
+
+
+def _check_digits_of(base):  # type: (int) -> tuple[int, int]
+    """
+    Computes both check digits of a CPF from its integer base number.
+
+    Args:
+        base (int): The base number, between 0 and 999999999.
+
+    Returns:
+        tuple[int, int]: The first and second check digits.
+
+    Example:
+        >>> _check_digits_of(525131277)
+        (6, 5)
+    """
+
+    high, low = divmod(base, 1000)
+    high, middle = divmod(high, 1000)
+    sums_high, sums_middle, sums_low = _FIRST_CHUNK_SUMS
+    total = sums_high[high] + sums_middle[middle] + sums_low[low]
+    first = CHECK_DIGITS[total % 11]
+    sums_high, sums_middle, sums_low = _SECOND_CHUNK_SUMS
+    total = sums_high[high] + sums_middle[middle] + sums_low[low]
+    second = CHECK_DIGITS[(total + 2 * first) % 11]
+
+    return first, second
+
+
+def _from_base(base):  # type: (int) -> str
+    """
+    Builds the digit string of a CPF from its integer base number.
+
+    Args:
+        base (int): The base number, between 0 and 999999999.
+
+    Returns:
+        str: The 11-digit CPF.
+
+    Example:
+        >>> _from_base(525131277)
+        '52513127765'
+    """
+
+    first, second = _check_digits_of(base)
+
+    return f"{base:09d}{first}{second}"
+
+
+def _format_base(base):  # type: (int) -> str
+    """
+    Builds the formatted CPF from its integer base number.
+
+    Args:
+        base (int): The base number, between 0 and 999999999.
+
+    Returns:
+        str: The CPF formatted with visual aid symbols.
+
+    Example:
+        >>> _format_base(525131277)
+        '525.131.277-65'
+    """
+
+    first, second = _check_digits_of(base)
+    high, low = divmod(base, 1000)
+    high, middle = divmod(high, 1000)
+
+    return f"{high:03d}.{middle:03d}.{low:03d}-{first}{second}"
+
+
+def _matches_check_digits(digits, first_sum, second_sum):  # type: (bytearray, int, int) -> bool
+    """
+    Checks whether the check digits of a candidate CPF match the given
+    weighted sums, rejecting CPFs made of a single repeated digit.
+
+    Args:
+        digits (bytearray): The 11 digit values of the candidate CPF.
+        first_sum (int): The weighted sum of the first check digit.
+        second_sum (int): The weighted sum of the second check digit.
+
+    Returns:
+        bool: True if the candidate is a valid CPF, False otherwise.
+    """
+
+    return (
+        CHECK_DIGITS[first_sum % 11] == digits[9]
+        and CHECK_DIGITS[second_sum % 11] == digits[10]
+        and digits.count(digits[0]) != 11
+    )
+
+
+def _fiscal_region_digit(cpf):  # type: (str | bytes) -> int | None
+    """
+    Gets the ASCII code of the digit that identifies the fiscal region of a
+    CPF given as a string or bytes.
+
+    Args:
+        cpf (str | bytes): The CPF.
+
+    Returns:
+        int | None: The ASCII code of the 9th digit, or None if the CPF is
+        invalid.
+    """
+
+    if isinstance(cpf, str) and cpf.isascii():
+        cpf = cpf.encode()
+
+    if not isinstance(cpf, bytes) or not _validate_bytes(cpf):
+        return None
+
+    return cpf[8]
+
+
+@lru_cache(maxsize=None)
+def _mask_template(visible, mask):  # type: (tuple[int, ...], str) -> MaskTemplate
+    """
+    Builds, and caches, the mask template of the CPF display layout.
+
+    Args:
+        visible (tuple[int, ...]): The indexes of the segments to keep
+            visible.
+        mask (str): The character that replaces hidden digits.
+
+    Returns:
+        MaskTemplate: The mask template.
+    """
+
+    return MaskTemplate("###.###.###-##", visible, mask)
+
+
+@lru_cache(maxsize=16)
+def _key_permutation(key):  # type: (str | bytes) -> _Permutation
+    """
+    Builds, and caches, the permutation used to pseudonymize CPFs with the
+    given key.
+
+    Args:
+        key (str | bytes): The secret key of the pseudonymization.
+
+    Returns:
+        _Permutation: The permutation of the key.
+    """
+
+    if isinstance(key, str):
+        key = key.encode()
 
-    return verifying_digits
+    return _Permutation.from_key(key)
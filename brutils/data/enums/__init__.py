@@ -1 +1,3 @@
+from brutils.data.enums.document_type import DocumentType
+from brutils.data.enums.fiscal_region import FiscalRegion
 from brutils.data.enums.uf import UF, UF_CODE
@@ -0,0 +1,7 @@
+from brutils.data.enums.better_enum import BetterEnum
+
+
+class DocumentType(BetterEnum):
+    CPF = "cpf"
+    CNPJ = "cnpj"
+    INVALID = "invalid"
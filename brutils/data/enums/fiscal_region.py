@@ -0,0 +1,33 @@
+from brutils.data.enums.better_enum import BetterEnum
+from brutils.data.enums.uf import UF
+
+
+class FiscalRegion(BetterEnum):
+    RF01 = 1
+    RF02 = 2
+    RF03 = 3
+    RF04 = 4
+    RF05 = 5
+    RF06 = 6
+    RF07 = 7
+    RF08 = 8
+    RF09 = 9
+    RF10 = 10
+
+    @property
+    def ufs(self) -> tuple[UF, ...]:
+        return _FISCAL_REGION_UFS[self]
+
+
+_FISCAL_REGION_UFS = {
+    FiscalRegion.RF01: (UF.DF, UF.GO, UF.MT, UF.MS, UF.TO),
+    FiscalRegion.RF02: (UF.AC, UF.AP, UF.AM, UF.PA, UF.RO, UF.RR),
+    FiscalRegion.RF03: (UF.CE, UF.MA, UF.PI),
+    FiscalRegion.RF04: (UF.AL, UF.PB, UF.PE, UF.RN),
+    FiscalRegion.RF05: (UF.BA, UF.SE),
+    FiscalRegion.RF06: (UF.MG,),
+    FiscalRegion.RF07: (UF.ES, UF.RJ),
+    FiscalRegion.RF08: (UF.SP,),
+    FiscalRegion.RF09: (UF.PR, UF.SC),
+    FiscalRegion.RF10: (UF.RS,),
+}
@@ -0,0 +1,96 @@
+from itertools import compress
+from string import punctuation, whitespace
+
+from brutils.cnpj import is_valid_many as is_valid_many_cnpj
+from brutils.cpf import is_valid_many as is_valid_many_cpf
+from brutils.data.enums import DocumentType
+
+# ASCII punctuation and whitespace characters, deleted from the encoded
+# documents in a single pass, so that documents written with any separators
+# are cleaned at the speed of `bytes.translate`.
+_SYMBOLS = (punctuation + whitespace).encode()
+
+# Document type of each cleaned length, along with the batch validator used
+# for the documents of that length.
+_DOCUMENT_LENGTHS = {
+    11: (DocumentType.CPF, is_valid_many_cpf),
+    14: (DocumentType.CNPJ, is_valid_many_cnpj),
+}
+
+
+def classify_document(raw):  # type: (str) -> DocumentType
+    """
+    Classifies a document that may be either a CPF or a CNPJ.
+
+    Every ASCII punctuation and whitespace character is removed first, so
+    documents may be written with any separators. The cleaned document is
+    then validated as a CPF if it has 11 characters or as a CNPJ if it has 14
+    characters, including alphanumeric CNPJs.
+
+    Args:
+        raw (str): The document to be classified.
+
+    Returns:
+        DocumentType: `DocumentType.CPF` or `DocumentType.CNPJ` if the
+        document is a valid CPF or CNPJ, `DocumentType.INVALID` otherwise.
+
+    Example:
+        >>> classify_document("821.785.374-64")
+        <DocumentType.CPF: 'cpf'>
+        >>> classify_document("03 560 714 / 0001 - 42")
+        <DocumentType.CNPJ: 'cnpj'>
+        >>> classify_document("821.785.374-65")
+        <DocumentType.INVALID: 'invalid'>
+    """
+
+    return classify_document_many([raw])[0]
+
+
+def classify_document_many(raws):  # type: (Iterable[str]) -> list[DocumentType]
+    """
+    Classifies many documents that may be either CPFs or CNPJs at once.
+
+    The result is the same as calling `classify_document` on every item, but
+    the documents are cleaned once, bucketed by length and each bucket is
+    joined into a single buffer and validated all at once with
+    `brutils.cpf.is_valid_many` or `brutils.cnpj.is_valid_many`, so no
+    document goes through more than one validator.
+
+    Args:
+        raws (Iterable[str]): The documents to be classified. Items that are
+            not strings are classified as invalid.
+
+    Returns:
+        list[DocumentType]: The type of each document, in order.
+
+    Example:
+        >>> classify_document_many(["82178537464", "03.560.714/0001-42", "123"])
+        [<DocumentType.CPF: 'cpf'>, <DocumentType.CNPJ: 'cnpj'>, <DocumentType.INVALID: 'invalid'>]
+    """
+
+    # Lone surrogates are encoded instead of raising, and since every
+    # non-ASCII character leaves bytes that are not valid in a document, the
+    # documents holding them are classified as invalid.
+    documents = [
+        raw.encode("utf-8", "surrogatepass").translate(None, _SYMBOLS)
+        if isinstance(raw, str)
+        else b""
+        for raw in raws
+    ]
+    lengths = list(map(len, documents))
+    types = [DocumentType.INVALID] * len(documents)
+
+    for length, (document_type, are_valid) in _DOCUMENT_LENGTHS.items():
+        positions = [
+            position for position, size in enumerate(lengths) if size == length
+        ]
+
+        if not positions:
+            continue
+
+        buffer = b"".join([documents[position] for position in positions])
+
+        for position in compress(positions, are_valid(buffer)):
+            types[position] = document_type
+
+    return types
@@ -1,7 +1,11 @@
 from random import randint
 
+from brutils._check_digit import Mod11
+
 WEIGHTS = [3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
 
+_CHECK_DIGIT = Mod11(tuple(WEIGHTS))
+
 # FORMATTING
 ############
 
@@ -83,7 +87,8 @@ def is_valid(pis: str) -> bool:
         isinstance(pis, str)
         and len(pis) == 11
         and pis.isdigit()
-        and pis[-1] == str(_checksum(pis[:-1]))
+        and pis.isascii()
+        and _CHECK_DIGIT.is_valid(pis.encode())
     )
 
 
@@ -109,7 +114,7 @@ def generate() -> str:
     """
     base = str(randint(0, 9999999999)).zfill(10)
 
-    return base + str(_checksum(base))
+    return base + _CHECK_DIGIT.check_digits(base.encode())
 
 
 def _checksum(base_pis: str) -> int:
@@ -122,8 +127,4 @@ def _checksum(base_pis: str) -> int:
     Returns:
         int: The checksum digit.
     """
-    pis_digits = list(map(int, base_pis))
-    pis_sum = sum(digit * weight for digit, weight in zip(pis_digits, WEIGHTS))
-    check_digit = 11 - (pis_sum % 11)
-
-    return 0 if check_digit in [10, 11] else check_digit
+    return _CHECK_DIGIT.digit(base_pis.encode(), 0)
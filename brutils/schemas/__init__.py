@@ -1 +1,2 @@
 from .address import Address
+from .establishment import Establishment
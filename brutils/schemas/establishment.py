@@ -0,0 +1,36 @@
+from datetime import date
+from typing import TypedDict
+
+
+class Establishment(TypedDict):
+    cnpj: str
+    cnpj_basico: str
+    cnpj_ordem: str
+    cnpj_dv: str
+    identificador_matriz_filial: int | None
+    nome_fantasia: str
+    situacao_cadastral: int | None
+    data_situacao_cadastral: date | None
+    motivo_situacao_cadastral: int | None
+    nome_cidade_exterior: str
+    pais: str
+    data_inicio_atividade: date | None
+    cnae_fiscal_principal: str
+    cnae_fiscal_secundaria: list[str]
+    tipo_logradouro: str
+    logradouro: str
+    numero: str
+    complemento: str
+    bairro: str
+    cep: str
+    uf: str
+    municipio: str
+    ddd_1: str
+    telefone_1: str
+    ddd_2: str
+    telefone_2: str
+    ddd_fax: str
+    fax: str
+    correio_eletronico: str
+    situacao_especial: str
+    data_situacao_especial: date | None
@@ -0,0 +1,139 @@
+from itertools import islice, repeat
+
+from brutils.cnpj import format_cnpj
+from brutils.cnpj import is_valid_many as is_valid_many_cnpj
+from brutils.cnpj import remove_symbols as remove_symbols_cnpj
+from brutils.cpf import format_cpf
+from brutils.cpf import is_valid_many as is_valid_many_cpf
+from brutils.cpf import remove_symbols as remove_symbols_cpf
+
+# Functions used to clean, validate and format each kind of document. The
+# validators take a whole chunk of values and return one boolean per value.
+_DOCUMENT_KINDS = {
+    "cpf": (remove_symbols_cpf, is_valid_many_cpf, format_cpf),
+    "cnpj": (remove_symbols_cnpj, is_valid_many_cnpj, format_cnpj),
+}
+
+
+def clean_column(
+    rows,
+    column,
+    kind="cpf",
+    formatted=False,
+    drop_invalid=False,
+    chunk_size=10_000,
+    on_chunk=None,
+):  # type: (Iterable[list | dict], int | str, str, bool, bool, int, Callable[[int, int], None] | None) -> Iterator[list | dict]
+    """
+    Cleans a CPF or CNPJ column of a stream of rows, lazily.
+
+    The rows are consumed in chunks of `chunk_size`. For each chunk, the
+    symbols of the document column are removed, the documents are validated
+    all at once and, if requested, the valid ones are formatted for display.
+    Only one chunk is held in memory at a time, so arbitrarily large files
+    can be processed, e.g. straight from a `csv.reader` or `csv.DictReader`.
+
+    Args:
+        rows (Iterable[list | dict]): The rows to be cleaned. They are
+            updated in place, so they must be mutable, like the lists and
+            dicts produced by the `csv` readers.
+        column (int | str): The index or key of the document column.
+        kind (str, optional): The kind of document in the column, either
+            "cpf" or "cnpj". Defaults to "cpf".
+        formatted (bool, optional): Whether to format the valid documents
+            with `format_cpf` or `format_cnpj`. Invalid documents are only
+            stripped of their symbols. Defaults to False.
+        drop_invalid (bool, optional): Whether to skip the rows holding an
+            invalid document. Rows too short to have the column, or whose
+            value is not a string, count as invalid and are otherwise left
+            unchanged. Defaults to False.
+        chunk_size (int, optional): How many rows to process at a time.
+            Defaults to 10000.
+        on_chunk (Callable[[int, int], None], optional): A function called
+            after each chunk is processed with the number of rows in the
+            chunk and how many of them hold an invalid document. Defaults to
+            None.
+
+    Returns:
+        Iterator[list | dict]: The cleaned rows, in the same order.
+
+    Raises:
+        ValueError: If `kind` is unknown or `chunk_size` is not positive.
+
+    Example:
+        >>> import csv, io
+        >>> reader = csv.reader(io.StringIO("Ana,821.785.374-64\\nBia,123\\n"))
+        >>> list(clean_column(reader, 1, on_chunk=print))
+        2 1
+        [['Ana', '82178537464'], ['Bia', '123']]
+    """
+
+    if kind not in _DOCUMENT_KINDS:
+        raise ValueError(f"Unknown document kind: {kind!r}")
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive.")
+
+    return _clean_column(
+        iter(rows),
+        column,
+        *_DOCUMENT_KINDS[kind],
+        formatted,
+        drop_invalid,
+        chunk_size,
+        on_chunk,
+    )
+
+
+def _clean_column(
+    rows,
+    column,
+    remove_symbols,
+    are_valid,
+    format_document,
+    formatted,
+    drop_invalid,
+    chunk_size,
+    on_chunk,
+):  # type: (Iterator[list | dict], int | str, Callable[[str], str], Callable[[list[str]], list[bool]], Callable[[str], str], bool, bool, int, Callable[[int, int], None] | None) -> Iterator[list | dict]
+    """
+    Generator behind `clean_column`, which receives the functions of the
+    chosen document kind.
+    """
+
+    while chunk := list(islice(rows, chunk_size)):
+        documents = [
+            remove_symbols(value) if isinstance(value, str) else None
+            for value in map(_column_value, chunk, repeat(column))
+        ]
+        validity = are_valid(documents)
+
+        for row, document, is_valid in zip(chunk, documents, validity):
+            if document is None:
+                if not drop_invalid:
+                    yield row
+
+                continue
+
+            if is_valid and formatted:
+                document = format_document(document)
+            elif not is_valid and drop_invalid:
+                continue
+
+            row[column] = document
+            yield row
+
+        if on_chunk is not None:
+            on_chunk(len(chunk), validity.count(False))
+
+
+def _column_value(row, column):  # type: (list | dict, int | str) -> object
+    """
+    Gets the value of a column of a row, or None if the row is too short to
+    have it.
+    """
+
+    try:
+        return row[column]
+    except (IndexError, KeyError):
+        return None
@@ -0,0 +1,168 @@
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from brutils.blocklist import Blocklist
+from brutils.cpf import generate_many
+
+
+class TestBlocklist(TestCase):
+    def setUp(self):
+        self.cpfs = list(generate_many(2_000, seed=3, unique=True))
+        self.blocked = self.cpfs[:1_000] + [
+            "01.838.723/0001-27",
+            "12.ABC.345/01DE-35",
+        ]
+        self.blocklist = Blocklist(self.blocked)
+        self.directory = TemporaryDirectory()
+        self.path = path.join(self.directory.name, "blocklist.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertBlocks(self, blocklist):
+        self.assertEqual(len(blocklist), 1_002)
+        self.assertEqual(
+            blocklist.contains_many(self.cpfs), [True] * 1_000 + [False] * 1_000
+        )
+        self.assertIn("01838723000127", blocklist)
+        self.assertIn("01.838.723/0001-27", blocklist)
+        self.assertNotIn("01838723000128", blocklist)
+        self.assertIn("12ABC34501DE35", blocklist)
+        self.assertIn("12.ABC.345/01DE-35", blocklist)
+        self.assertNotIn("12ABC34501DE36", blocklist)
+        self.assertNotIn("12abc34501de35", blocklist)
+
+    def test_contains(self):
+        self.assertBlocks(self.blocklist)
+
+        cpf = self.cpfs[0]
+        formatted_cpf = f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+
+        self.assertIn(formatted_cpf, self.blocklist)
+
+    def test_contains_invalid_documents(self):
+        self.assertNotIn("", self.blocklist)
+        self.assertNotIn("123", self.blocklist)
+        self.assertNotIn("1234567890a", self.blocklist)
+        self.assertNotIn(None, self.blocklist)
+        self.assertNotIn(82178537464, self.blocklist)
+
+    def test_cpf_and_cnpj_with_same_digits_are_distinct(self):
+        blocklist = Blocklist(["00000226135446"])
+
+        self.assertIn("00000226135446", blocklist)
+        self.assertNotIn("00226135446", blocklist)
+
+        blocklist = Blocklist(["00226135446"])
+
+        self.assertIn("00226135446", blocklist)
+        self.assertNotIn("00000226135446", blocklist)
+
+    def test_alphanumeric_cnpjs(self):
+        blocklist = Blocklist(["12ABC34501DE35", "ZZZZZZZZZZZZ62"])
+
+        self.assertEqual(
+            blocklist.contains_many(
+                ["12ABC34501DE35", "ZZZZZZZZZZZZ62", "12ABC34501DE"]
+            ),
+            [True, True, False],
+        )
+
+    def test_empty_blocklist(self):
+        blocklist = Blocklist()
+
+        self.assertEqual(len(blocklist), 0)
+        self.assertNotIn("82178537464", blocklist)
+
+    def test_duplicates_are_dropped(self):
+        blocklist = Blocklist(["82178537464", "821.785.374-64"])
+
+        self.assertEqual(len(blocklist), 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Blocklist(["123"])
+
+        with self.assertRaises(ValueError):
+            Blocklist([None])
+
+        with self.assertRaises(ValueError):
+            Blocklist(["12ABC34501DE36"])
+
+        for cpf in ("12345678900", "00000000000", "\u0668" * 11):
+            with self.assertRaises(ValueError):
+                Blocklist([cpf])
+
+        with self.assertRaises(ValueError):
+            Blocklist(false_positive_rate=0)
+
+        with self.assertRaises(ValueError):
+            Blocklist(false_positive_rate=1)
+
+    def test_false_positive_rate(self):
+        blocklist = Blocklist(self.cpfs[:1_000], false_positive_rate=0.01)
+        bits = blocklist._bits
+        false_positives = sum(
+            all(
+                bits[position >> 3] >> (position & 7) & 1
+                for position in blocklist._positions(10**11 + int(cpf))
+            )
+            for cpf in generate_many(20_000, seed=4)
+        )
+
+        self.assertLess(false_positives, 20_000 * 0.02)
+
+    def test_save_and_load(self):
+        self.blocklist.save(self.path)
+
+        with Blocklist.load(self.path) as blocklist:
+            self.assertBlocks(blocklist)
+            self.assertEqual(blocklist.nbytes, self.blocklist.nbytes)
+
+        with self.assertRaises(ValueError):
+            blocklist.contains_many(self.cpfs)
+
+    def test_save_and_load_empty_blocklist(self):
+        Blocklist().save(self.path)
+
+        with Blocklist.load(self.path) as blocklist:
+            self.assertEqual(len(blocklist), 0)
+            self.assertNotIn("82178537464", blocklist)
+
+    def test_load_invalid_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a blocklist")
+
+        with self.assertRaises(ValueError):
+            Blocklist.load(self.path)
+
+        self.blocklist.save(self.path)
+
+        # Files of unknown format versions are rejected
+        with open(self.path, "r+b") as file:
+            file.seek(4)
+            file.write(b"\x02")
+
+        with self.assertRaises(ValueError):
+            Blocklist.load(self.path)
+
+        self.blocklist.save(self.path)
+
+        with open(self.path, "ab") as file:
+            file.write(b"\x00")
+
+        with self.assertRaises(ValueError):
+            Blocklist.load(self.path)
+
+    def test_close(self):
+        self.blocklist.close()
+        self.blocklist.save(self.path)
+
+        blocklist = Blocklist.load(self.path)
+        blocklist.close()
+        blocklist.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,32 @@
-from unittest import TestCase, main
+from asyncio import gather
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from socket import SHUT_RDWR, socket
+from threading import Event, Lock, Thread
+from unittest import IsolatedAsyncioTestCase, TestCase, main
 from unittest.mock import MagicMock, patch
 
 from brutils.cep import (
+    CEPCache,
+    CEPCacheInfo,
     CEPNotFound,
     InvalidCEP,
+    ViaCEPClient,
+    aget_address_from_cep,
+    aget_cep_information_from_address,
     format_cep,
     generate,
     get_address_from_cep,
+    get_addresses_from_ceps,
     get_cep_information_from_address,
+    get_uf,
+    get_uf_many,
     is_valid,
     remove_symbols,
 )
+from brutils.data.enums import UF
 
 
 class TestCEP(TestCase):
@@ -43,6 +59,50 @@ class TestCEP(TestCase):
             self.assertIs(is_valid(generate()), True)
 
 
+class TestGetUF(TestCase):
+    def test_get_uf(self):
+        self.assertEqual(get_uf("01310100"), UF.SP)
+        self.assertEqual(get_uf("01310-100"), UF.SP)
+        self.assertEqual(get_uf("20040020"), UF.RJ)
+        self.assertEqual(get_uf("70040010"), UF.DF)
+        self.assertEqual(get_uf("99999999"), UF.RS)
+
+    def test_get_uf_at_range_boundaries(self):
+        self.assertEqual(get_uf("68899999"), UF.PA)
+        self.assertEqual(get_uf("68900000"), UF.AP)
+        self.assertEqual(get_uf("69299999"), UF.AM)
+        self.assertEqual(get_uf("69300000"), UF.RR)
+        self.assertEqual(get_uf("69400000"), UF.AM)
+        self.assertEqual(get_uf("72799999"), UF.DF)
+        self.assertEqual(get_uf("72800000"), UF.GO)
+        self.assertEqual(get_uf("73000000"), UF.DF)
+        self.assertEqual(get_uf("76800000"), UF.RO)
+
+    def test_get_uf_invalid_cep(self):
+        self.assertIsNone(get_uf("00000000"))
+        self.assertIsNone(get_uf("00999999"))
+        self.assertIsNone(get_uf("0131010"))
+        self.assertIsNone(get_uf("0131010a"))
+        self.assertIsNone(get_uf("01310١٠٠"))
+        self.assertIsNone(get_uf(None))
+
+    def test_get_uf_many(self):
+        self.assertEqual(
+            get_uf_many(["01310-100", "70040010", "abc", None, "00999999"]),
+            [UF.SP, UF.DF, None, None, None],
+        )
+        self.assertEqual(get_uf_many([]), [])
+
+    def test_get_uf_many_matches_get_uf(self):
+        ceps = [f"{cep:08d}" for cep in range(0, 10**8, 99_991)]
+        ceps += ["01310١٠٠", "01310-100", "0131-0100"]
+
+        self.assertEqual(get_uf_many(ceps), list(map(get_uf, ceps)))
+        self.assertEqual(
+            {uf for uf in get_uf_many(ceps) if uf is not None}, set(UF)
+        )
+
+
 @patch("brutils.cep.is_valid")
 class TestIsValidToFormat(TestCase):
     def test_when_cep_is_valid_returns_True_to_format(self, mock_is_valid):
@@ -236,5 +296,665 @@ class TestGetAddressFromCEP_MC_DC(TestCase):
             get_address_from_cep("01001000", raise_exceptions=True)
 
 
+# Responses of the stand-in ViaCEP server, by request path.
+VIACEP_RESPONSES = {
+    "/ws/01310200/json/": {"cep": "01310-200", "uf": "SP"},
+    "/ws/20040020/json/": {"cep": "20040-020", "uf": "RJ"},
+    "/ws/99999999/json/": {"erro": True},
+    "/ws/SP/Sao%20Paulo/Paulista/json/": [
+        {"cep": "01310-100", "uf": "SP"},
+        {"cep": "01310-200", "uf": "SP"},
+    ],
+    "/ws/SP/Sao%20Paulo/Nowhere/json/": [],
+    "/ws/04538133/json/": {"cep": "04538-133", "uf": "SP"},
+}
+
+# Paths answered with the chunked transfer encoding.
+CHUNKED_PATHS = {"/ws/04538133/json/"}
+
+
+class ViaCEPHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for the ViaCEP API, answering from `VIACEP_RESPONSES` with
+    keep-alive connections and counting the connections it accepts.
+
+    While the `released` event of the server is clear, requests are held
+    until `release_count` of them are in flight at once, which sets it, or
+    until the test sets it.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connection_count += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.request_count += 1
+            self.server.active_count += 1
+            self.server.max_active_count = max(
+                self.server.max_active_count, self.server.active_count
+            )
+
+            if self.server.active_count == self.server.release_count:
+                self.server.released.set()
+
+        # Gives up after a while, so that a failing test does not hang
+        self.server.released.wait(5)
+
+        with self.server.lock:
+            self.server.active_count -= 1
+
+        data = VIACEP_RESPONSES.get(self.path)
+        body = b"Bad Request" if data is None else dumps(data).encode()
+        self.send_response(400 if data is None else 200)
+
+        if self.path in CHUNKED_PATHS:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            for start in range(0, len(body), 10):
+                chunk = body[start : start + 10]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ViaCEPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Accepts bursts of concurrent connections without dropping any
+    request_queue_size = 256
+
+
+class ViaCEPServerTestCase(TestCase):
+    """
+    Runs a stand-in ViaCEP server on localhost for the tests of the class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ViaCEPServer(("127.0.0.1", 0), ViaCEPHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/ws/"
+        Thread(
+            target=cls.server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.lock = Lock()
+        self.server.released = Event()
+        self.server.released.set()
+        self.server.release_count = None
+        self.server.connection_count = 0
+        self.server.request_count = 0
+        self.server.active_count = 0
+        self.server.max_active_count = 0
+
+    def stop_clock(self):
+        """
+        Stops the clock of the rate limiter, so that its schedule does not
+        depend on timing, and records the sleeps it asks for instead of
+        sleeping.
+        """
+
+        sleeps = []
+
+        for name, value in (
+            ("monotonic", lambda: 0.0),
+            ("sleep", sleeps.append),
+        ):
+            patcher = patch(f"brutils.cep.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        return sleeps
+
+
+class TestViaCEPClient(ViaCEPServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = ViaCEPClient(self.base_url, pool_size=2)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_get_address_from_cep(self):
+        self.assertEqual(
+            self.client.get_address_from_cep("01310-200"),
+            {"cep": "01310-200", "uf": "SP"},
+        )
+        self.assertEqual(
+            self.client.get_address_from_cep("20040020", True),
+            {"cep": "20040-020", "uf": "RJ"},
+        )
+
+    def test_get_address_from_cep_errors(self):
+        self.assertIsNone(self.client.get_address_from_cep("99999999"))
+        self.assertIsNone(self.client.get_address_from_cep("abc"))
+
+        with self.assertRaises(CEPNotFound):
+            self.client.get_address_from_cep("99999999", True)
+
+        with self.assertRaises(CEPNotFound):
+            # Answered with 400 Bad Request
+            self.client.get_address_from_cep("11111111", True)
+
+        with self.assertRaises(InvalidCEP):
+            self.client.get_address_from_cep("abc", True)
+
+        self.assertEqual(self.server.request_count, 3)
+
+    def test_fetch_address(self):
+        self.assertEqual(
+            self.client.fetch_address("01310200"),
+            {"cep": "01310-200", "uf": "SP"},
+        )
+        self.assertIsNone(self.client.fetch_address("99999999"))
+
+        with self.assertRaises(HTTPException):
+            # Answered with 400 Bad Request
+            self.client.fetch_address("11111111")
+
+    def test_get_cep_information_from_address(self):
+        self.assertEqual(
+            self.client.get_cep_information_from_address(
+                "São Paulo", "São Paulo", "Paulista"
+            ),
+            [
+                {"cep": "01310-100", "uf": "SP"},
+                {"cep": "01310-200", "uf": "SP"},
+            ],
+        )
+        self.assertIsNone(
+            self.client.get_cep_information_from_address(
+                "SP", "São Paulo", "Nowhere"
+            )
+        )
+        self.assertIsNone(
+            self.client.get_cep_information_from_address(
+                "XX", "São Paulo", "Paulista"
+            )
+        )
+
+        with self.assertRaisesRegex(CEPNotFound, "SP - São Paulo - Nowhere"):
+            self.client.get_cep_information_from_address(
+                "SP", "São Paulo", "Nowhere", True
+            )
+
+        with self.assertRaises(ValueError):
+            self.client.get_cep_information_from_address(
+                "XX", "São Paulo", "Paulista", True
+            )
+
+    def test_max_rate(self):
+        sleeps = self.stop_clock()
+
+        with ViaCEPClient(self.base_url, max_rate=100) as client:
+            for _ in range(5):
+                client.get_address_from_cep("01310200")
+                client.get_address_from_cep("99999999")
+
+        # The 10 requests are scheduled 10 milliseconds apart
+        self.assertEqual(len(sleeps), 9)
+
+        for i, seconds in enumerate(sleeps, 1):
+            self.assertAlmostEqual(seconds, i / 100)
+
+        self.assertEqual(self.server.request_count, 10)
+
+    def test_connections_are_reused(self):
+        for _ in range(5):
+            self.client.get_address_from_cep("01310200")
+            self.client.get_address_from_cep("99999999")
+
+        self.assertEqual(self.server.request_count, 10)
+        self.assertEqual(self.server.connection_count, 1)
+
+    def test_closed_connections_are_replaced(self):
+        self.client.get_address_from_cep("01310200")
+        # Shuts the pooled connection down, as a server dropping idle
+        # keep-alive connections does
+        connection = self.client._pool.get_nowait()
+        connection.sock.shutdown(SHUT_RDWR)
+        self.client._pool.put_nowait(connection)
+
+        self.assertEqual(
+            self.client.get_address_from_cep("01310200", True)["uf"], "SP"
+        )
+        self.assertEqual(self.server.connection_count, 2)
+
+    def test_close(self):
+        self.client.get_address_from_cep("01310200")
+        self.client.close()
+
+        self.assertTrue(self.client._pool.empty())
+        self.assertEqual(
+            self.client.get_address_from_cep("01310200")["uf"], "SP"
+        )
+
+        with ViaCEPClient(self.base_url) as client:
+            client.get_address_from_cep("01310200")
+
+        self.assertTrue(client._pool.empty())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ViaCEPClient("ftp://viacep.com.br/ws/")
+
+        with self.assertRaises(ValueError):
+            ViaCEPClient("viacep.com.br/ws/")
+
+        with self.assertRaises(ValueError):
+            ViaCEPClient(pool_size=0)
+
+        with self.assertRaises(ValueError):
+            ViaCEPClient(max_rate=0)
+
+    def test_connection_refused(self):
+        # A port that was just released has nothing listening on it
+        with socket() as unused_socket:
+            unused_socket.bind(("127.0.0.1", 0))
+            port = unused_socket.getsockname()[1]
+
+        client = ViaCEPClient(f"http://127.0.0.1:{port}/ws/")
+
+        self.assertIsNone(client.get_address_from_cep("01310200"))
+
+        with self.assertRaises(CEPNotFound):
+            client.get_address_from_cep("01310200", True)
+
+
+class TestAsyncCEP(ViaCEPServerTestCase, IsolatedAsyncioTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch("brutils.cep._VIACEP_URL", self.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_aget_address_from_cep(self):
+        self.assertEqual(
+            await aget_address_from_cep("01310-200"),
+            {"cep": "01310-200", "uf": "SP"},
+        )
+        # Answered with the chunked transfer encoding
+        self.assertEqual(
+            await aget_address_from_cep("04538133", True),
+            {"cep": "04538-133", "uf": "SP"},
+        )
+
+    async def test_aget_address_from_cep_errors(self):
+        self.assertIsNone(await aget_address_from_cep("99999999"))
+        self.assertIsNone(await aget_address_from_cep("abc"))
+
+        with self.assertRaises(CEPNotFound):
+            await aget_address_from_cep("99999999", True)
+
+        with self.assertRaises(CEPNotFound):
+            # Answered with 400 Bad Request
+            await aget_address_from_cep("11111111", True)
+
+        with self.assertRaises(InvalidCEP):
+            await aget_address_from_cep("abc", True)
+
+        self.assertEqual(self.server.request_count, 3)
+
+    async def test_aget_cep_information_from_address(self):
+        self.assertEqual(
+            await aget_cep_information_from_address(
+                "São Paulo", "São Paulo", "Paulista"
+            ),
+            [
+                {"cep": "01310-100", "uf": "SP"},
+                {"cep": "01310-200", "uf": "SP"},
+            ],
+        )
+        self.assertIsNone(
+            await aget_cep_information_from_address(
+                "SP", "São Paulo", "Nowhere"
+            )
+        )
+
+        with self.assertRaisesRegex(CEPNotFound, "SP - São Paulo - Nowhere"):
+            await aget_cep_information_from_address(
+                "SP", "São Paulo", "Nowhere", True
+            )
+
+        with self.assertRaises(ValueError):
+            await aget_cep_information_from_address(
+                "XX", "São Paulo", "Paulista", True
+            )
+
+    async def test_many_lookups_in_flight(self):
+        ceps = ["01310200", "20040020", "99999999", "abc"] * 50
+        addresses = await gather(*map(aget_address_from_cep, ceps))
+
+        self.assertEqual(
+            [address and address["uf"] for address in addresses],
+            ["SP", "RJ", None, None] * 50,
+        )
+        self.assertEqual(self.server.request_count, 150)
+
+    async def test_timeout(self):
+        # The requests are held until the end of the test, so the lookups
+        # only finish by timing out
+        self.server.released.clear()
+        self.addCleanup(self.server.released.set)
+
+        self.assertIsNone(await aget_address_from_cep("01310200", timeout=0.05))
+
+        with self.assertRaises(CEPNotFound):
+            await aget_address_from_cep("01310200", True, timeout=0.05)
+
+        with self.assertRaises(CEPNotFound):
+            await aget_cep_information_from_address(
+                "SP", "São Paulo", "Paulista", True, timeout=0.05
+            )
+
+    async def test_connection_refused(self):
+        with socket() as unused_socket:
+            unused_socket.bind(("127.0.0.1", 0))
+            port = unused_socket.getsockname()[1]
+
+        with patch("brutils.cep._VIACEP_URL", f"http://127.0.0.1:{port}/ws/"):
+            self.assertIsNone(await aget_address_from_cep("01310200"))
+
+            with self.assertRaises(CEPNotFound):
+                await aget_address_from_cep("01310200", True)
+
+
+class TestGetAddressesFromCEPs(ViaCEPServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = ViaCEPClient(self.base_url, pool_size=8)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_get_addresses_from_ceps(self):
+        results = get_addresses_from_ceps(
+            ["01310-200", "abc", "20040020", "99999999", None, "01310200"],
+            client=self.client,
+        )
+
+        self.assertEqual(results[0], {"cep": "01310-200", "uf": "SP"})
+        self.assertIsInstance(results[1], InvalidCEP)
+        self.assertEqual(results[1].cep, "abc")
+        self.assertEqual(results[2], {"cep": "20040-020", "uf": "RJ"})
+        self.assertIsInstance(results[3], CEPNotFound)
+        self.assertIsInstance(results[4], InvalidCEP)
+        self.assertEqual(results[5], results[0])
+        self.assertIsNot(results[5], results[0])
+        # Duplicates and invalid CEPs are not requested
+        self.assertEqual(self.server.request_count, 3)
+
+    def test_get_addresses_from_ceps_without_valid_ceps(self):
+        self.assertEqual(get_addresses_from_ceps([], client=self.client), [])
+        self.assertIsInstance(
+            get_addresses_from_ceps(["abc"], client=self.client)[0], InvalidCEP
+        )
+        self.assertEqual(self.server.request_count, 0)
+
+    def test_max_concurrency(self):
+        # The first requests are held until 4 of them are in flight at once
+        self.server.released.clear()
+        self.server.release_count = 4
+        ceps = [f"{cep:08d}" for cep in range(1, 41)]
+        results = get_addresses_from_ceps(
+            ceps, max_concurrency=4, client=self.client
+        )
+
+        self.assertEqual(len(results), 40)
+        self.assertTrue(
+            all(isinstance(result, CEPNotFound) for result in results)
+        )
+        self.assertEqual(self.server.request_count, 40)
+        self.assertEqual(self.server.max_active_count, 4)
+
+    def test_futures_are_bounded_by_max_concurrency(self):
+        submit = ThreadPoolExecutor.submit
+        submitted = []
+
+        def count_submit(executor, *args, **kwargs):
+            submitted.append(args)
+            return submit(executor, *args, **kwargs)
+
+        ceps = [f"{cep:08d}" for cep in range(1, 41)]
+
+        with patch.object(ThreadPoolExecutor, "submit", count_submit):
+            results = get_addresses_from_ceps(
+                ceps, max_concurrency=4, client=self.client
+            )
+
+        self.assertEqual(len(results), 40)
+        self.assertEqual(len(submitted), 4)
+        self.assertEqual(self.server.request_count, 40)
+
+    def test_max_rate(self):
+        sleeps = self.stop_clock()
+        ceps = [f"{cep:08d}" for cep in range(1, 11)]
+
+        with patch("brutils.cep._VIACEP_URL", self.base_url):
+            get_addresses_from_ceps(ceps, max_rate=100)
+
+        # The 10 requests are scheduled 10 milliseconds apart, in whichever
+        # order the threads reach the rate limiter
+        self.assertEqual(len(sleeps), 9)
+
+        for i, seconds in enumerate(sorted(sleeps), 1):
+            self.assertAlmostEqual(seconds, i / 100)
+
+        self.assertEqual(self.server.request_count, 10)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            get_addresses_from_ceps(["01310200"], max_concurrency=0)
+
+        with self.assertRaises(ValueError):
+            get_addresses_from_ceps(["01310200"], max_rate=0)
+
+        with self.assertRaises(ValueError):
+            # The rate of a given client is set on the client
+            get_addresses_from_ceps(
+                ["01310200"], max_rate=10, client=self.client
+            )
+
+
+class TestCEPCache(ViaCEPServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = ViaCEPClient(self.base_url)
+        self.cache = CEPCache(
+            maxsize=2, ttl=60, not_found_ttl=10, client=self.client
+        )
+        self.now = 1000.0
+        patcher = patch("brutils.cep.monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_hits_and_misses(self):
+        self.assertEqual(
+            self.cache.get_address_from_cep("01310-200"),
+            {"cep": "01310-200", "uf": "SP"},
+        )
+        self.assertEqual(
+            self.cache.get_address_from_cep("01310200", True),
+            {"cep": "01310-200", "uf": "SP"},
+        )
+        self.assertEqual(
+            self.cache.cache_info(),
+            CEPCacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1),
+        )
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_results_are_copies(self):
+        self.cache.get_address_from_cep("01310200")["uf"] = "XX"
+
+        self.assertEqual(
+            self.cache.get_address_from_cep("01310200")["uf"], "SP"
+        )
+
+    def test_least_recently_used_eviction(self):
+        self.cache.get_address_from_cep("01310200")
+        self.cache.get_address_from_cep("20040020")
+        self.cache.get_address_from_cep("01310200")
+        self.cache.get_address_from_cep("04538133")
+        # 20040020 was the least recently used, so it was evicted
+        self.cache.get_address_from_cep("01310200")
+        self.cache.get_address_from_cep("20040020")
+
+        self.assertEqual(
+            self.cache.cache_info(),
+            CEPCacheInfo(hits=2, misses=4, evictions=2, maxsize=2, currsize=2),
+        )
+        self.assertEqual(self.server.request_count, 4)
+
+    def test_expiration(self):
+        self.cache.get_address_from_cep("01310200")
+        self.now += 59
+        self.cache.get_address_from_cep("01310200")
+        self.now += 1
+        self.cache.get_address_from_cep("01310200")
+
+        self.assertEqual(self.cache.cache_info().hits, 1)
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_expired_entries_are_dropped(self):
+        self.cache.get_address_from_cep("01310200")
+        self.now += 60
+
+        with patch.object(ViaCEPClient, "fetch_address", side_effect=OSError):
+            self.assertIsNone(self.cache.get_address_from_cep("01310200"))
+
+        self.assertEqual(
+            self.cache.cache_info(),
+            CEPCacheInfo(hits=0, misses=2, evictions=0, maxsize=2, currsize=0),
+        )
+
+    def test_not_found_is_told_apart_from_failures(self):
+        with patch.object(
+            ViaCEPClient, "fetch_address", side_effect=CEPNotFound("x")
+        ):
+            self.assertIsNone(self.cache.get_address_from_cep("01310200"))
+
+        self.assertEqual(self.cache.cache_info().currsize, 0)
+
+        with patch.object(ViaCEPClient, "fetch_address", return_value=None):
+            self.assertIsNone(self.cache.get_address_from_cep("01310200"))
+
+        self.assertEqual(self.cache.cache_info().currsize, 1)
+
+        with patch.object(ViaCEPClient, "fetch_address") as fetch:
+            self.assertIsNone(self.cache.get_address_from_cep("01310200"))
+
+        fetch.assert_not_called()
+
+    def test_not_found_is_cached_with_its_own_ttl(self):
+        self.assertIsNone(self.cache.get_address_from_cep("99999999"))
+
+        with self.assertRaisesRegex(CEPNotFound, "999999-99"):
+            self.cache.get_address_from_cep("999999-99", True)
+
+        self.assertEqual(self.server.request_count, 1)
+
+        self.now += 10
+        self.assertIsNone(self.cache.get_address_from_cep("99999999"))
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_failed_requests_are_not_cached(self):
+        # Answered with 400 Bad Request
+        self.assertIsNone(self.cache.get_address_from_cep("11111111"))
+
+        with self.assertRaises(CEPNotFound):
+            self.cache.get_address_from_cep("11111111", True)
+
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual(self.cache.cache_info().currsize, 0)
+
+    def test_invalid_cep(self):
+        self.assertIsNone(self.cache.get_address_from_cep("abc"))
+        self.assertIsNone(self.cache.get_address_from_cep(None))
+
+        with self.assertRaises(InvalidCEP):
+            self.cache.get_address_from_cep("abc", True)
+
+        self.assertEqual(self.cache.cache_info(), CEPCacheInfo(0, 0, 0, 2, 0))
+
+    def test_cache_clear(self):
+        self.cache.get_address_from_cep("01310200")
+        self.cache.cache_clear()
+
+        self.assertEqual(self.cache.cache_info(), CEPCacheInfo(0, 0, 0, 2, 0))
+
+    def test_default_client(self):
+        cache = CEPCache()
+
+        with patch("brutils.cep._VIACEP_URL", self.base_url):
+            cache.get_address_from_cep("01310200")
+            cache.get_address_from_cep("01310200")
+
+        self.assertEqual(cache.cache_info().hits, 1)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_custom_client(self):
+        client = MagicMock()
+        client.fetch_address.return_value = None
+        cache = CEPCache(client=client)
+
+        self.assertIsNone(cache.get_address_from_cep("99999999"))
+        self.assertIsNone(cache.get_address_from_cep("99999999"))
+
+        client.fetch_address.assert_called_once_with("99999999")
+
+    def test_get_addresses_from_ceps(self):
+        cache = CEPCache(client=self.client)
+        ceps = ["01310200", "99999999", "abc"]
+
+        first = get_addresses_from_ceps(ceps, client=cache)
+        second = get_addresses_from_ceps(ceps, client=cache)
+
+        self.assertEqual(first[0], second[0])
+        self.assertIsInstance(second[1], CEPNotFound)
+        self.assertIsInstance(second[2], InvalidCEP)
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_hits_are_not_rate_limited(self):
+        sleeps = self.stop_clock()
+        cache = CEPCache(client=ViaCEPClient(self.base_url, max_rate=1))
+        ceps = ["01310200", "99999999"]
+
+        get_addresses_from_ceps(ceps, client=cache)
+        get_addresses_from_ceps(ceps * 5, client=cache)
+
+        # Only the second request of the first batch waits
+        self.assertEqual(sleeps, [1.0])
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CEPCache(maxsize=0)
+
+        with self.assertRaises(ValueError):
+            CEPCache(ttl=0)
+
+        with self.assertRaises(ValueError):
+            CEPCache(not_found_ttl=-1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,47 @@
+from unittest import TestCase, main
+
+from brutils._check_digit import ALPHANUMERIC_VALUES, Mod11
+
+
+class TestMod11(TestCase):
+    def setUp(self):
+        self.cpf = Mod11(tuple(range(10, 1, -1)), tuple(range(11, 1, -1)))
+        self.pis = Mod11((3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+
+    def test_digit(self):
+        self.assertEqual(self.cpf.digit(b"525131277", 0), 6)
+        self.assertEqual(self.cpf.digit(b"5251312776", 1), 5)
+        # Extra trailing digits are ignored
+        self.assertEqual(self.cpf.digit(b"52513127765", 0), 6)
+        # Remainders lower than 2 become 0
+        self.assertEqual(self.cpf.digit(b"000000000", 0), 0)
+        self.assertEqual(self.pis.digit(b"1234567890", 0), 0)
+
+    def test_check_digits(self):
+        self.assertEqual(self.cpf.check_digits(b"525131277"), "65")
+        self.assertEqual(self.cpf.check_digits(b"111444777"), "35")
+        self.assertEqual(self.pis.check_digits(b"1234567890"), "0")
+
+    def test_is_valid(self):
+        self.assertIs(self.cpf.is_valid(b"52513127765"), True)
+        self.assertIs(self.cpf.is_valid(b"52513127764"), False)
+        self.assertIs(self.cpf.is_valid(b"52513127755"), False)
+        self.assertIs(self.pis.is_valid(b"12345678900"), True)
+        self.assertIs(self.pis.is_valid(b"12345678909"), False)
+
+    def test_alphanumeric_values(self):
+        cnpj = Mod11(
+            (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+            (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+            values=ALPHANUMERIC_VALUES,
+        )
+
+        self.assertEqual(b"09AZ".translate(ALPHANUMERIC_VALUES), b"\0\t\x11*")
+        self.assertEqual(cnpj.check_digits(b"12ABC34501DE"), "35")
+        self.assertIs(cnpj.is_valid(b"12ABC34501DE35"), True)
+        self.assertIs(cnpj.is_valid(b"12ABC34501DE36"), False)
+        self.assertEqual(cnpj.check_digits(b"346653880001"), "61")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,30 @@
+from datetime import date
+from os import path
+from tempfile import TemporaryDirectory
 from unittest import TestCase, main
 from unittest.mock import patch
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from brutils.cnpj import (
+    _ESTABLISHMENT_COLUMNS,
+    CNPJIndex,
     _checksum,
     _hashdigit,
     display,
     format_cnpj,
     generate,
+    generate_branches,
     is_valid,
+    is_valid_int_many,
+    is_valid_many,
+    mask_cnpj,
+    mask_cnpj_many,
+    normalize_int_many,
+    parse_cnpj,
+    read_establishments,
     remove_symbols,
     sieve,
+    suggest_corrections,
     validate,
 )
 
@@ -67,6 +82,37 @@ class TestCNPJ(TestCase):
         self.assertIs(is_valid("34665388000161"), True)
         self.assertIs(is_valid("01838723000127"), True)
 
+    def test_is_valid_alphanumeric(self):
+        self.assertIs(is_valid("12ABC34501DE35"), True)
+        self.assertIs(is_valid("A0B1C2D3000179"), True)
+        self.assertIs(is_valid("12ABC34501DE36"), False)
+
+        # Letters must be uppercase
+        self.assertIs(is_valid("12abc34501de35"), False)
+
+        # Check digits must be digits
+        self.assertIs(is_valid("12ABC34501DEA5"), False)
+
+        # Other characters are not allowed
+        self.assertIs(is_valid("12ABC345_1DE35"), False)
+        self.assertIs(is_valid("12ÁBC34501DE35"), False)
+        self.assertIs(is_valid("AAAAAAAAAAAAAA"), False)
+
+    def test_format_cnpj_alphanumeric(self):
+        self.assertEqual(format_cnpj("12ABC34501DE35"), "12.ABC.345/01DE-35")
+        self.assertEqual(display("12ABC34501DE35"), "12.ABC.345/01DE-35")
+        self.assertEqual(remove_symbols("12.ABC.345/01DE-35"), "12ABC34501DE35")
+        self.assertIsNone(format_cnpj("12ABC34501DE36"))
+
+    def test_generate_alphanumeric(self):
+        for _ in range(1_000):
+            cnpj = generate(alphanumeric=True)
+
+            self.assertIs(is_valid(cnpj), True)
+            self.assertEqual(cnpj[8:12], "0001")
+
+        self.assertEqual(generate(42, alphanumeric=True)[8:12], "0042")
+
     def test_generate(self):
         for _ in range(10_000):
             self.assertIs(validate(generate()), True)
@@ -83,6 +129,559 @@ class TestCNPJ(TestCase):
         self.assertEqual(_checksum("52513127000299"), "99")
 
 
+class TestGenerateBranches(TestCase):
+    def assertGenerates(self, root, start, stop):
+        cnpjs = generate_branches(root, start, stop)
+
+        self.assertEqual(
+            [
+                cnpjs[index : index + 14].decode()
+                for index in range(0, len(cnpjs), 14)
+            ],
+            [
+                cnpj
+                for branch in range(start, stop + 1)
+                for base in (f"{root}{branch:04d}",)
+                for cnpj in (base + _checksum(base),)
+                if is_valid(cnpj)
+            ],
+        )
+
+    def test_generate_branches(self):
+        self.assertEqual(
+            generate_branches("03.560.714", 1, 3),
+            b"035607140001420356071400022303560714000304",
+        )
+
+        cnpjs = generate_branches("03560714")
+
+        self.assertEqual(len(cnpjs), 9_999 * 14)
+        self.assertEqual(cnpjs[:14], b"03560714000142")
+        self.assertEqual(is_valid_many(cnpjs, return_failures=True)[1], [])
+
+    def test_generate_branches_matches_checksum(self):
+        self.assertGenerates("03560714", 0, 9_999)
+        self.assertGenerates("12ABC345", 1, 9_999)
+        self.assertGenerates("34665388", 9, 10)
+        self.assertGenerates("34665388", 15, 27)
+        self.assertGenerates("34665388", 123, 123)
+
+    def test_generate_branches_skips_repeated_digits(self):
+        for digit in "0123456789":
+            self.assertGenerates(digit * 8, 0, 9_999)
+
+    def test_generate_branches_invalid_arguments(self):
+        for root in ("0356071", "035607140", "03560714a", "0356071é", None):
+            with self.assertRaises(ValueError):
+                generate_branches(root)
+
+        with self.assertRaises(ValueError):
+            generate_branches("03560714", -1, 10)
+
+        with self.assertRaises(ValueError):
+            generate_branches("03560714", 10, 9)
+
+        with self.assertRaises(ValueError):
+            generate_branches("03560714", 1, 10_000)
+
+    def test_suggest_corrections(self):
+        # Mistyped check digit
+        self.assertEqual(
+            suggest_corrections("03560714000143"), ["03560714000142"]
+        )
+        # Symbols are removed first
+        self.assertEqual(
+            suggest_corrections("03.560.714/0001-43"), ["03560714000142"]
+        )
+        # Swaps come before substitutions, then by position
+        self.assertEqual(
+            suggest_corrections("03560741000142"),
+            ["03560471000142", "03560714000142"],
+        )
+        # Letters are tried in alphanumeric CNPJs, lookalikes first
+        self.assertEqual(
+            suggest_corrections("12ABC345O1DE35")[:2],
+            ["I2ABC345O1DE35", "12ABC34501DE35"],
+        )
+
+    def test_suggest_corrections_finds_every_candidate(self):
+        for alphanumeric in (False, True):
+            for _ in range(50):
+                cnpj = generate(alphanumeric=alphanumeric)
+
+                for position in range(14):
+                    character = cnpj[position]
+                    replacement = "1" if character.isalpha() else "A"
+
+                    if position >= 12 or not alphanumeric:
+                        replacement = str((int(character) + 1) % 10)
+
+                    typo = cnpj[:position] + replacement + cnpj[position + 1 :]
+
+                    if alphanumeric and typo[:12].isdigit():
+                        continue
+
+                    suggestions = suggest_corrections(typo)
+                    self.assertIn(cnpj, suggestions)
+                    self.assertEqual(
+                        is_valid_many(suggestions), [True] * len(suggestions)
+                    )
+
+    def test_suggest_corrections_swapped_check_digits(self):
+        self.assertIn("34665388000161", suggest_corrections("34665388000116"))
+        self.assertIn("03560714000142", suggest_corrections("03560714000124"))
+
+    def test_suggest_corrections_skips_repeated_characters(self):
+        # 11111111111111 passes the checksum but is not a valid CNPJ
+        self.assertNotIn(
+            "11111111111111", suggest_corrections("11111111111112")
+        )
+
+    def test_suggest_corrections_with_invalid_input(self):
+        self.assertEqual(suggest_corrections("0356071400014"), [])
+        self.assertEqual(suggest_corrections("03560714000a42"), [])
+        self.assertEqual(suggest_corrections(None), [])
+
+
+class TestCNPJIndex(TestCase):
+    def setUp(self):
+        self.index = CNPJIndex(
+            [
+                "34665388000161",
+                "03.560.714/0002-23",
+                "03560714000142",
+                "12ABC34501DE35",
+                "03560714000142",
+            ]
+        )
+
+    def test_init(self):
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.nbytes, 32)
+        self.assertEqual(
+            list(self.index),
+            [
+                "03560714000142",
+                "03560714000223",
+                "12ABC34501DE35",
+                "34665388000161",
+            ],
+        )
+        self.assertEqual(len(CNPJIndex()), 0)
+
+        with self.assertRaises(ValueError):
+            CNPJIndex(["03560714000142", "03560714000143"])
+
+        for cnpj in (None, 3560714000142, b"03560714000142"):
+            with self.assertRaises(ValueError):
+                CNPJIndex([cnpj])
+
+    def test_contains(self):
+        self.assertIn("03.560.714/0002-23", self.index)
+        self.assertIn("12ABC34501DE35", self.index)
+        self.assertNotIn("03560714000304", self.index)
+        self.assertNotIn("03560714000143", self.index)
+        self.assertNotIn(3560714000142, self.index)
+        self.assertNotIn("03560714000142", CNPJIndex())
+
+    def test_branches_of(self):
+        self.assertEqual(
+            self.index.branches_of("03.560.714"),
+            ["03560714000142", "03560714000223"],
+        )
+        self.assertEqual(
+            self.index.branches_of("03560714000304"),
+            ["03560714000142", "03560714000223"],
+        )
+        self.assertEqual(self.index.branches_of("12ABC345"), ["12ABC34501DE35"])
+        self.assertEqual(self.index.branches_of("03560715"), [])
+
+        for root in ("0356071", "03560714a", "03560714000", "0356071é", None):
+            with self.assertRaises(ValueError):
+                self.index.branches_of(root)
+
+    def test_branches_of_many_roots(self):
+        roots = ["03560714", "34665388", "1A2B3C4D"]
+        index = CNPJIndex(
+            generate_branches(root, 1, 300)[start : start + 14].decode()
+            for root in roots
+            for start in range(0, 300 * 14, 14)
+        )
+
+        for root in roots:
+            cnpjs = generate_branches(root, 1, 300)
+
+            self.assertEqual("".join(index.branches_of(root)).encode(), cnpjs)
+
+    def test_headquarters_of(self):
+        self.assertEqual(
+            self.index.headquarters_of("03560714000223"), "03560714000142"
+        )
+        self.assertEqual(
+            self.index.headquarters_of("03.560.714"), "03560714000142"
+        )
+        self.assertIsNone(self.index.headquarters_of("12ABC34501DE35"))
+        self.assertIsNone(self.index.headquarters_of("11222333000181"))
+
+    def test_group_by_root(self):
+        self.assertEqual(
+            list(self.index.group_by_root()),
+            [
+                ("03560714", ["03560714000142", "03560714000223"]),
+                ("12ABC345", ["12ABC34501DE35"]),
+                ("34665388", ["34665388000161"]),
+            ],
+        )
+        self.assertEqual(list(CNPJIndex().group_by_root()), [])
+
+    def test_save_and_load(self):
+        with TemporaryDirectory() as directory:
+            file_path = path.join(directory, "index.bin")
+            self.index.save(file_path)
+
+            self.assertEqual(CNPJIndex.load(file_path), self.index)
+
+            CNPJIndex().save(file_path)
+
+            self.assertEqual(len(CNPJIndex.load(file_path)), 0)
+
+            with open(file_path, "ab") as file:
+                file.write(b"\x00")
+
+            with self.assertRaises(ValueError):
+                CNPJIndex.load(file_path)
+
+            with open(file_path, "wb") as file:
+                file.write(b"not an index")
+
+            with self.assertRaises(ValueError):
+                CNPJIndex.load(file_path)
+
+
+class TestReadEstablishments(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = path.join(self.directory.name, "Estabelecimentos0.zip")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_archive(self, *members):
+        with ZipFile(self.path, "w", ZIP_DEFLATED) as archive:
+            archive.mkdir("dados")
+
+            for name, rows in members:
+                archive.writestr(
+                    name,
+                    "".join(
+                        ";".join(f'"{value}"' for value in row) + "\n"
+                        for row in rows
+                    ).encode("latin-1"),
+                )
+
+    def row(self, cnpj, name="", **values):
+        row = [cnpj[:8], cnpj[8:12], cnpj[12:], "1", name, "02", "20000128"]
+        row += ["", "", "", "20000128", "6201501", "6202300,6204000"]
+        row += ["RUA", "São João; Centro", "100", "", "CENTRO", "01001000"]
+        row += ["SP", "7107", "11", "12345678", "", "", "", "", ""]
+        row += ["", ""]
+
+        for column, value in values.items():
+            row[_ESTABLISHMENT_COLUMNS.index(column)] = value
+
+        return row
+
+    def test_read_establishments(self):
+        self.write_archive(
+            (
+                "K3241.K03200Y0.D60913.ESTABELE",
+                [
+                    self.row("03560714000142", "Ação Ltda"),
+                    self.row(
+                        "12ABC34501DE35",
+                        identificador_matriz_filial="2",
+                        situacao_cadastral="",
+                        data_situacao_cadastral="00000000",
+                        cnae_fiscal_secundaria="",
+                        data_situacao_especial="20260230",
+                    ),
+                ],
+            )
+        )
+
+        first, second = read_establishments(self.path)
+
+        self.assertEqual(first["cnpj"], "03560714000142")
+        self.assertEqual(first["cnpj_basico"], "03560714")
+        self.assertEqual(first["cnpj_ordem"], "0001")
+        self.assertEqual(first["cnpj_dv"], "42")
+        self.assertEqual(first["identificador_matriz_filial"], 1)
+        self.assertEqual(first["nome_fantasia"], "Ação Ltda")
+        self.assertEqual(first["situacao_cadastral"], 2)
+        self.assertEqual(first["data_situacao_cadastral"], date(2000, 1, 28))
+        self.assertIsNone(first["motivo_situacao_cadastral"])
+        self.assertEqual(
+            first["cnae_fiscal_secundaria"], ["6202300", "6204000"]
+        )
+        self.assertEqual(first["logradouro"], "São João; Centro")
+        self.assertEqual(first["uf"], "SP")
+        self.assertIsNone(first["data_situacao_especial"])
+        self.assertEqual(list(first), ["cnpj", *_ESTABLISHMENT_COLUMNS])
+
+        self.assertEqual(second["cnpj"], "12ABC34501DE35")
+        self.assertEqual(second["identificador_matriz_filial"], 2)
+        self.assertIsNone(second["situacao_cadastral"])
+        self.assertIsNone(second["data_situacao_cadastral"])
+        self.assertEqual(second["cnae_fiscal_secundaria"], [])
+        self.assertIsNone(second["data_situacao_especial"])
+
+    def test_read_establishments_from_many_files(self):
+        self.write_archive(
+            ("dados/ESTABELE0", [self.row("03560714000142")]),
+            ("dados/ESTABELE1", [self.row("34665388000161")]),
+        )
+
+        self.assertEqual(
+            [record["cnpj"] for record in read_establishments(self.path)],
+            ["03560714000142", "34665388000161"],
+        )
+
+    def test_read_establishments_in_chunks(self):
+        cnpjs = [
+            "03560714000142",
+            "03560714000143",
+            "34665388000161",
+            "00000000000000",
+            "12ABC34501DE35",
+        ]
+        self.write_archive(("ESTABELE", [self.row(cnpj) for cnpj in cnpjs]))
+        chunks = []
+
+        with open(self.path, "rb") as file:
+            records = list(
+                read_establishments(
+                    file,
+                    chunk_size=2,
+                    on_chunk=lambda *args: chunks.append(args),
+                )
+            )
+
+        self.assertEqual([record["cnpj"] for record in records], cnpjs)
+        self.assertEqual(chunks, [(2, 1), (2, 1), (1, 0)])
+
+        records = read_establishments(self.path, drop_invalid=True)
+
+        self.assertEqual(
+            [record["cnpj"] for record in records],
+            ["03560714000142", "34665388000161", "12ABC34501DE35"],
+        )
+
+    def test_read_establishments_malformed_row(self):
+        self.write_archive(
+            (
+                "ESTABELE",
+                [self.row("03560714000142"), ["03560714", "0001", "42"]],
+            )
+        )
+        records = read_establishments(self.path, chunk_size=1)
+
+        self.assertEqual(next(records)["cnpj"], "03560714000142")
+
+        with self.assertRaisesRegex(ValueError, "Row 2 of 'ESTABELE'"):
+            next(records)
+
+    def test_read_establishments_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            read_establishments(self.path, chunk_size=0)
+
+
+class TestIsValidMany(TestCase):
+    def test_is_valid_many(self):
+        self.assertEqual(
+            is_valid_many(
+                [
+                    "03560714000142",
+                    "12ABC34501DE35",
+                    b"12ABC34501DE35",
+                    "03560714000143",
+                    "11111111111111",
+                    "12abc34501de35",
+                    "1",
+                    None,
+                ]
+            ),
+            [True, True, True, False, False, False, False, False],
+        )
+        self.assertEqual(is_valid_many([]), [])
+
+    def test_is_valid_many_matches_is_valid(self):
+        cnpjs = [generate(branch) for branch in range(1, 501)]
+        cnpjs += [generate(branch, True) for branch in range(1, 501)]
+        cnpjs += [cnpj[:13] + str(9 - int(cnpj[13])) for cnpj in cnpjs]
+        cnpjs += [cnpj[:4] + "-" + cnpj[5:] for cnpj in cnpjs[:100]]
+
+        self.assertEqual(
+            is_valid_many(iter(cnpjs)), [is_valid(cnpj) for cnpj in cnpjs]
+        )
+
+    def test_is_valid_many_mixed_items(self):
+        cnpjs = [
+            "03560714000142",
+            "0356071400014",
+            b"03560714000142",
+            "03.560.714/0001-42",
+            "0356O714000142",
+            "0356071400014²",
+            12,
+            "12ABC34501DE35",
+        ]
+
+        self.assertEqual(
+            is_valid_many(cnpjs),
+            [True, False, True, False, False, False, False, True],
+        )
+
+    def test_is_valid_many_return_failures(self):
+        self.assertEqual(
+            is_valid_many(
+                ["1", "03560714000142", "2", "12ABC34501DE35"],
+                return_failures=True,
+            ),
+            ([False, True, False, True], [0, 2]),
+        )
+        self.assertEqual(
+            is_valid_many(b"03560714000143", return_failures=True),
+            ([False], [0]),
+        )
+        self.assertEqual(is_valid_many([], return_failures=True), ([], []))
+
+    def test_is_valid_many_buffer(self):
+        self.assertEqual(
+            is_valid_many(bytearray(b"12ABC34501DE3503560714000143")),
+            [True, False],
+        )
+        self.assertEqual(is_valid_many(b""), [])
+
+        with self.assertRaises(ValueError):
+            is_valid_many(b"12ABC34501DE3")
+
+
+class TestIntColumns(TestCase):
+    def test_is_valid_int_many(self):
+        self.assertEqual(
+            is_valid_int_many([3560714000142, 1838723000127, 1838723000128]),
+            [True, True, False],
+        )
+
+        # Repeated digits and values out of range are invalid
+        self.assertEqual(
+            is_valid_int_many([0, 11111111111111, -1, 10**14]), [False] * 4
+        )
+
+        # Values that are not integers are invalid
+        self.assertEqual(
+            is_valid_int_many(["03560714000142", 3560714000142.0, None]),
+            [False] * 3,
+        )
+
+    def test_is_valid_int_many_matches_is_valid(self):
+        values = [int(generate(branch)) for branch in range(1, 1_001)]
+        values += [value + 1 for value in values]
+
+        self.assertEqual(
+            is_valid_int_many(iter(values)),
+            [is_valid(f"{value:014d}") for value in values],
+        )
+
+    def test_normalize_int_many(self):
+        self.assertEqual(
+            normalize_int_many([3560714000142, 1838723000127, 1838723000128]),
+            ["03560714000142", "01838723000127", None],
+        )
+        self.assertEqual(normalize_int_many([]), [])
+
+
+class TestMaskCNPJ(TestCase):
+    def test_mask_cnpj(self):
+        self.assertEqual(mask_cnpj("03560714000142"), "**.560.714/****-**")
+        self.assertEqual(
+            mask_cnpj("03560714000142", visible=(0, 1, 2, 3)),
+            "03.560.714/0001-**",
+        )
+        self.assertEqual(
+            mask_cnpj("03560714000142", visible=(3, 4), mask="X"),
+            "XX.XXX.XXX/0001-42",
+        )
+
+        # When cnpj is invalid, returns None
+        self.assertIsNone(mask_cnpj("03560714000143"))
+        self.assertIsNone(mask_cnpj("03.560.714/0001-42"))
+
+        with self.assertRaises(ValueError):
+            mask_cnpj("03560714000142", visible=(5,))
+
+    def test_mask_cnpj_many(self):
+        self.assertEqual(
+            mask_cnpj_many(["03560714000142", "1", "34665388000161"]),
+            ["**.560.714/****-**", None, "**.665.388/****-**"],
+        )
+        self.assertEqual(mask_cnpj_many([]), [])
+
+        cnpjs = [generate() for _ in range(200)] + ["00000000000000"]
+
+        for visible in ((1, 2), (0, 4), ()):
+            self.assertEqual(
+                mask_cnpj_many(cnpjs, visible=visible),
+                [mask_cnpj(cnpj, visible=visible) for cnpj in cnpjs],
+            )
+
+    def test_mask_cnpj_many_with_bytes(self):
+        self.assertEqual(
+            mask_cnpj_many([b"03560714000142", "1", "34665388000161", b"1"]),
+            ["**.560.714/****-**", None, "**.665.388/****-**", None],
+        )
+        self.assertEqual(
+            mask_cnpj_many([b"12ABC34501DE35"]), ["**.ABC.345/****-**"]
+        )
+
+
+class TestParseCNPJ(TestCase):
+    def test_parse_valid_cnpj(self):
+        parsed = parse_cnpj("03.560.714/0001-42")
+        self.assertEqual(parsed.digits, "03560714000142")
+        self.assertIs(parsed.is_valid, True)
+        self.assertEqual(parsed.formatted, "03.560.714/0001-42")
+        self.assertIsNone(parsed.error)
+
+        parsed = parse_cnpj("34665388000161")
+        self.assertEqual(parsed.formatted, "34.665.388/0001-61")
+
+    def test_parse_invalid_cnpj(self):
+        for raw, digits, error in (
+            (34665388000161, None, "invalid_type"),
+            ("03.560.714/0001-4", "0356071400014", "invalid_length"),
+            ("03.560.714/0001 42", "035607140001 42", "invalid_length"),
+            ("03.560.71a/0001-42", "0356071a000142", "invalid_characters"),
+            ("00.000.000/0000-00", "00000000000000", "repeated_digits"),
+            ("00.111.222/0001-33", "00111222000133", "invalid_check_digits"),
+        ):
+            parsed = parse_cnpj(raw)
+            self.assertEqual(parsed.digits, digits)
+            self.assertEqual(parsed.error, error)
+            self.assertIs(parsed.is_valid, False)
+            self.assertIsNone(parsed.formatted)
+
+    def test_parse_cnpj_matches_is_valid(self):
+        for _ in range(500):
+            cnpj = generate()
+            typo = cnpj[:-1] + str((int(cnpj[-1]) + 1) % 10)
+
+            for raw in (cnpj, typo):
+                parsed = parse_cnpj(raw)
+                self.assertIs(parsed.is_valid, is_valid(raw))
+                self.assertEqual(parsed.formatted, format_cnpj(raw))
+
+
 @patch("brutils.cnpj.sieve")
 class TestRemoveSymbols(TestCase):
     def test_remove_symbols(self, mock_sieve):
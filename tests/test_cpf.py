@@ -2,16 +2,32 @@ from unittest import TestCase, main
 from unittest.mock import patch
 
 from brutils.cpf import (
+    CPFArray,
     _checksum,
     _hashdigit,
+    count_by_fiscal_region,
     display,
     format_cpf,
     generate,
+    generate_many,
+    get_fiscal_region,
     is_valid,
+    is_valid_int_many,
+    is_valid_many,
+    iter_valid,
+    mask_cpf,
+    mask_cpf_many,
+    normalize_int_many,
+    parse_cpf,
+    pseudonymize,
+    pseudonymize_many,
     remove_symbols,
+    shard_bases,
     sieve,
+    suggest_corrections,
     validate,
 )
+from brutils.data.enums import UF, FiscalRegion
 
 
 class TestCPF(TestCase):
@@ -46,6 +62,9 @@ class TestCPF(TestCase):
         # When cpf does not contain only digits, returns False
         self.assertIs(is_valid("1112223334-"), False)
 
+        # When cpf contains non ASCII digits, returns False
+        self.assertIs(is_valid("١١١٤٤٤٧٧٧٣٥"), False)
+
         # When CPF has only the same digit, returns false
         self.assertIs(is_valid("11111111111"), False)
 
@@ -67,11 +86,89 @@ class TestCPF(TestCase):
         self.assertIs(is_valid("11144477735"), True)
         self.assertIs(is_valid("11111111200"), True)
 
+    def test_is_valid_many(self):
+        cases = [
+            ("11144477735", True),
+            ("11111111200", True),
+            ("11111111111", False),
+            ("11144477732", False),
+            ("1112223334-", False),
+            ("1", False),
+            ("", False),
+            (b"11144477735", True),
+            (b"11144477705", False),
+            (1, False),
+            (None, False),
+        ]
+        self.assertEqual(
+            is_valid_many([cpf for cpf, _ in cases]),
+            [expected for _, expected in cases],
+        )
+        self.assertEqual(is_valid_many([]), [])
+
+        generated = [generate() for _ in range(1_000)]
+        self.assertEqual(is_valid_many(generated), [True] * 1_000)
+
+        # Flipping a check digit must be caught like `validate` does
+        broken = [cpf[:10] + str((int(cpf[10]) + 1) % 10) for cpf in generated]
+        self.assertEqual(
+            is_valid_many(broken), [validate(cpf) for cpf in broken]
+        )
+
+    def test_is_valid_many_with_buffer(self):
+        self.assertEqual(
+            is_valid_many(b"111444777351111111111111111111200"),
+            [True, False, True],
+        )
+        self.assertEqual(is_valid_many(bytearray(b"11144477705")), [False])
+        self.assertEqual(is_valid_many(b""), [])
+
+        with self.assertRaises(ValueError):
+            is_valid_many(b"1114447773")
+
     def test_generate(self):
         for _ in range(10_000):
             self.assertIs(validate(generate()), True)
             self.assertIsNotNone(display(generate()))
 
+    def test_generate_many(self):
+        cpfs = list(generate_many(10_000))
+        self.assertEqual(len(cpfs), 10_000)
+        self.assertEqual(is_valid_many(cpfs), [True] * 10_000)
+        self.assertEqual(list(generate_many(0)), [])
+
+        # The same seed produces the same CPFs
+        self.assertEqual(
+            list(generate_many(100, seed=42)),
+            list(generate_many(100, seed=42)),
+        )
+        self.assertNotEqual(
+            list(generate_many(100, seed=42)),
+            list(generate_many(100, seed=43)),
+        )
+
+    def test_generate_many_unique(self):
+        cpfs = list(generate_many(10_000, seed=7, unique=True))
+        self.assertEqual(len(set(cpfs)), 10_000)
+        self.assertEqual(is_valid_many(cpfs), [True] * 10_000)
+        self.assertEqual(
+            cpfs[:100], list(generate_many(100, seed=7, unique=True))
+        )
+
+    def test_generate_many_formatted(self):
+        for formatted, cpf in zip(
+            generate_many(1_000, seed=1, formatted=True),
+            generate_many(1_000, seed=1),
+        ):
+            self.assertEqual(formatted, format_cpf(cpf))
+
+    def test_generate_many_raises_for_invalid_counts(self):
+        with self.assertRaises(ValueError):
+            generate_many(-1)
+
+        with self.assertRaises(ValueError):
+            generate_many(1_000_000_000, unique=True)
+
     def test__hashdigit(self):
         self.assertEqual(_hashdigit("000000000", 10), 0)
         self.assertEqual(_hashdigit("0000000000", 11), 0)
@@ -83,6 +180,430 @@ class TestCPF(TestCase):
         self.assertEqual(_checksum("525131277"), "65")
 
 
+class TestSuggestCorrections(TestCase):
+    def test_suggest_corrections(self):
+        # Mistyped check digit
+        self.assertEqual(suggest_corrections("82178537465"), ["82178537464"])
+        # Swapped check digits
+        self.assertIn("55550207753", suggest_corrections("55550207735"))
+        # Symbols are removed first
+        self.assertEqual(suggest_corrections("821.785.374-74"), ["82178537464"])
+        # Swaps come before substitutions, then by position
+        self.assertEqual(
+            suggest_corrections("11144477753"),
+            ["11144477573", "11144477735"],
+        )
+
+    def test_suggest_corrections_finds_every_candidate(self):
+        for cpf in generate_many(200, seed=3):
+            for position in range(11):
+                digit = int(cpf[position])
+                typo = (
+                    cpf[:position] + str((digit + 1) % 10) + cpf[position + 1 :]
+                )
+
+                suggestions = suggest_corrections(typo)
+                self.assertIn(cpf, suggestions)
+                self.assertEqual(
+                    is_valid_many(suggestions), [True] * len(suggestions)
+                )
+
+    def test_suggest_corrections_skips_repeated_digits(self):
+        # 11111111111 passes the checksum but is not a valid CPF
+        self.assertNotIn("11111111111", suggest_corrections("11111111112"))
+
+    def test_suggest_corrections_with_invalid_input(self):
+        self.assertEqual(suggest_corrections("1114447773"), [])
+        self.assertEqual(suggest_corrections("1114447773a"), [])
+        self.assertEqual(suggest_corrections(11144477735), [])
+
+
+class TestFiscalRegion(TestCase):
+    def test_get_fiscal_region(self):
+        self.assertIs(get_fiscal_region("82178537464"), FiscalRegion.RF04)
+        self.assertIs(get_fiscal_region("55550207753"), FiscalRegion.RF07)
+        self.assertIs(get_fiscal_region("11144477735"), FiscalRegion.RF07)
+        self.assertIs(get_fiscal_region("00000000191"), FiscalRegion.RF01)
+        self.assertIs(get_fiscal_region("00000001082"), FiscalRegion.RF10)
+        self.assertEqual(get_fiscal_region("82178537464").ufs[-1], UF.RN)
+        self.assertEqual(get_fiscal_region("55550207753").ufs, (UF.ES, UF.RJ))
+
+        # When cpf is invalid, returns None
+        self.assertIsNone(get_fiscal_region("82178537465"))
+        self.assertIsNone(get_fiscal_region("821.785.374-64"))
+        self.assertIsNone(get_fiscal_region(82178537464))
+
+    def test_every_uf_belongs_to_one_fiscal_region(self):
+        ufs = [uf for region in FiscalRegion for uf in region.ufs]
+        self.assertCountEqual(ufs, list(UF))
+
+    def test_count_by_fiscal_region(self):
+        self.assertEqual(
+            count_by_fiscal_region(
+                [
+                    "82178537464",
+                    "55550207753",
+                    b"11144477735",
+                    "00000001082",
+                    "82178537465",
+                    None,
+                ]
+            ),
+            {
+                FiscalRegion.RF04: 1,
+                FiscalRegion.RF07: 2,
+                FiscalRegion.RF10: 1,
+                None: 2,
+            },
+        )
+        self.assertEqual(count_by_fiscal_region([]), {})
+
+        cpfs = list(generate_many(1_000, seed=5))
+        counts = count_by_fiscal_region(cpfs)
+        self.assertEqual(sum(counts.values()), 1_000)
+
+        for region, count in counts.items():
+            self.assertEqual(
+                count, [get_fiscal_region(cpf) for cpf in cpfs].count(region)
+            )
+
+
+class TestMaskCPF(TestCase):
+    def test_mask_cpf(self):
+        self.assertEqual(mask_cpf("82178537464"), "***.785.374-**")
+        self.assertEqual(mask_cpf("00000000191"), "***.000.001-**")
+        self.assertEqual(
+            mask_cpf("82178537464", visible=(0, 3), mask="X"),
+            "821.XXX.XXX-64",
+        )
+        self.assertEqual(mask_cpf("82178537464", visible=()), "***.***.***-**")
+        self.assertEqual(
+            mask_cpf("82178537464", visible=range(4)), "821.785.374-64"
+        )
+
+        # When cpf is invalid, returns None
+        self.assertIsNone(mask_cpf("82178537465"))
+        self.assertIsNone(mask_cpf("821.785.374-64"))
+
+    def test_mask_cpf_with_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            mask_cpf("82178537464", visible=(4,))
+
+        with self.assertRaises(ValueError):
+            mask_cpf("82178537464", mask="**")
+
+        with self.assertRaises(ValueError):
+            mask_cpf("82178537464", mask="•")
+
+    def test_mask_cpf_many(self):
+        self.assertEqual(
+            mask_cpf_many(["82178537464", "1", b"55550207753", None]),
+            ["***.785.374-**", None, "***.502.077-**", None],
+        )
+        self.assertEqual(mask_cpf_many([]), [])
+
+        cpfs = list(generate_many(500, seed=4))
+        cpfs[::7] = ["11111111111"] * len(cpfs[::7])
+
+        for visible in ((1, 2), (0,), (3,), ()):
+            self.assertEqual(
+                mask_cpf_many(iter(cpfs), visible=visible, mask="#"),
+                [mask_cpf(cpf, visible=visible, mask="#") for cpf in cpfs],
+            )
+
+
+class TestPseudonymize(TestCase):
+    def test_pseudonymize(self):
+        self.assertEqual(pseudonymize("82178537464", "secret"), "19065387862")
+        self.assertEqual(pseudonymize("82178537464", b"secret"), "19065387862")
+        self.assertEqual(
+            pseudonymize("82178537464", "another secret"), "56069925076"
+        )
+
+        # When cpf is invalid, returns None
+        self.assertIsNone(pseudonymize("82178537465", "secret"))
+        self.assertIsNone(pseudonymize("11111111111", "secret"))
+
+    def test_pseudonymize_is_a_permutation_of_valid_cpfs(self):
+        cpfs = list(generate_many(5_000, seed=6, unique=True))
+        pseudonyms = [pseudonymize(cpf, "secret") for cpf in cpfs]
+
+        self.assertEqual(is_valid_many(pseudonyms), [True] * 5_000)
+        self.assertEqual(len(set(pseudonyms)), 5_000)
+        self.assertNotEqual(pseudonyms, cpfs)
+
+    def test_pseudonymize_many(self):
+        cpfs = list(generate_many(1_000, seed=8)) + ["1", None]
+
+        self.assertEqual(
+            pseudonymize_many(iter(cpfs), "key"),
+            [pseudonymize(cpf, "key") for cpf in cpfs[:-1]] + [None],
+        )
+        self.assertEqual(
+            pseudonymize_many([b"82178537464"], "secret"), ["19065387862"]
+        )
+        self.assertEqual(pseudonymize_many([], "secret"), [])
+
+
+class Int64:
+    """Integer type that, like NumPy's, is not a subclass of int."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __index__(self):
+        return self.value
+
+
+class TestIntColumns(TestCase):
+    def test_is_valid_int_many(self):
+        self.assertEqual(
+            is_valid_int_many(
+                [82178537464, 1234567890, Int64(1234567890), 1234567891]
+            ),
+            [True, True, True, False],
+        )
+
+        # Repeated digits and values out of range are invalid
+        self.assertEqual(
+            is_valid_int_many([0, 11111111111, 99999999999, -1, 10**11]),
+            [False] * 5,
+        )
+
+        # Values that are not integers are invalid
+        self.assertEqual(
+            is_valid_int_many(["82178537464", 82178537464.0, None]),
+            [False] * 3,
+        )
+        self.assertEqual(is_valid_int_many([]), [])
+
+    def test_is_valid_int_many_matches_is_valid(self):
+        values = [int(cpf) for cpf in generate_many(1_000, seed=9)]
+        values += [value + 1 for value in values]
+
+        self.assertEqual(
+            is_valid_int_many(iter(values)),
+            [is_valid(f"{value:011d}") for value in values],
+        )
+
+    def test_normalize_int_many(self):
+        self.assertEqual(
+            normalize_int_many(
+                [82178537464, Int64(1234567890), 1234567891, "1234567890"]
+            ),
+            ["82178537464", "01234567890", None, None],
+        )
+        self.assertEqual(normalize_int_many(iter([191])), ["00000000191"])
+
+
+class TestIterValid(TestCase):
+    def assertEnumerates(self, start_base, stop_base):
+        self.assertEqual(
+            list(iter_valid(start_base, stop_base)),
+            [
+                f"{base:09d}" + _checksum(f"{base:09d}")
+                for base in range(start_base, stop_base)
+                if base % 111_111_111
+            ],
+        )
+
+    def test_iter_valid(self):
+        self.assertEqual(
+            list(iter_valid(1, 4)),
+            ["00000000191", "00000000272", "00000000353"],
+        )
+        self.assertEqual(list(iter_valid(5, 5)), [])
+        self.assertEqual(next(iter_valid()), "00000000191")
+
+    def test_iter_valid_matches_checksum(self):
+        self.assertEnumerates(0, 3_000)
+        self.assertEnumerates(525_130_999, 525_133_001)
+        self.assertEnumerates(999_998_500, 1_000_000_000)
+
+    def test_iter_valid_skips_repeated_digits(self):
+        self.assertEnumerates(111_110_000, 111_112_000)
+        self.assertEnumerates(888_888_880, 888_888_890)
+
+        cpfs = list(iter_valid(444_444_000, 444_445_000))
+
+        self.assertEqual(len(cpfs), 999)
+        self.assertEqual(is_valid_many(cpfs), [True] * 999)
+
+    def test_iter_valid_invalid_range(self):
+        with self.assertRaises(ValueError):
+            iter_valid(-1, 10)
+
+        with self.assertRaises(ValueError):
+            iter_valid(10, 5)
+
+        with self.assertRaises(ValueError):
+            iter_valid(0, 1_000_000_001)
+
+    def test_shard_bases(self):
+        self.assertEqual(
+            shard_bases(3),
+            [
+                (0, 333_333_000),
+                (333_333_000, 666_666_000),
+                (666_666_000, 1_000_000_000),
+            ],
+        )
+        self.assertEqual(shard_bases(1, 5, 10), [(5, 10)])
+        self.assertEqual(
+            shard_bases(4, 10, 2010),
+            [(10, 510), (510, 1010), (1010, 1510), (1510, 2010)],
+        )
+
+        shards = shard_bases(7, 123_456, 987_654)
+
+        self.assertEqual(
+            [cpf for shard in shards for cpf in iter_valid(*shard)],
+            list(iter_valid(123_456, 987_654)),
+        )
+
+    def test_shard_bases_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            shard_bases(0)
+
+        with self.assertRaises(ValueError):
+            shard_bases(2, 10, 5)
+
+
+class TestParseCPF(TestCase):
+    def test_parse_valid_cpf(self):
+        parsed = parse_cpf("821.785.374-64")
+        self.assertEqual(parsed.digits, "82178537464")
+        self.assertIs(parsed.is_valid, True)
+        self.assertEqual(parsed.formatted, "821.785.374-64")
+        self.assertIsNone(parsed.error)
+
+        parsed = parse_cpf("11144477735")
+        self.assertEqual(parsed.digits, "11144477735")
+        self.assertEqual(parsed.formatted, "111.444.777-35")
+
+    def test_parse_invalid_cpf(self):
+        for raw, digits, error in (
+            (11144477735, None, "invalid_type"),
+            ("111.444.777-3", "1114447773", "invalid_length"),
+            ("111.444.777/35", "111444777/35", "invalid_length"),
+            ("111.444.77a-35", "11144477a35", "invalid_characters"),
+            ("111.111.111-11", "11111111111", "repeated_digits"),
+            ("111.444.777-36", "11144477736", "invalid_check_digits"),
+        ):
+            parsed = parse_cpf(raw)
+            self.assertEqual(parsed.digits, digits)
+            self.assertEqual(parsed.error, error)
+            self.assertIs(parsed.is_valid, False)
+            self.assertIsNone(parsed.formatted)
+
+    def test_parse_cpf_matches_is_valid(self):
+        for cpf in generate_many(500, seed=2, formatted=True):
+            typo = cpf[:-1] + str((int(cpf[-1]) + 1) % 10)
+
+            for raw in (cpf, typo):
+                parsed = parse_cpf(raw)
+                self.assertEqual(parsed.digits, remove_symbols(raw))
+                self.assertIs(parsed.is_valid, is_valid(parsed.digits))
+                self.assertEqual(parsed.formatted, format_cpf(parsed.digits))
+
+
+class TestCPFArray(TestCase):
+    def test_init(self):
+        cpfs = CPFArray(["821.785.374-64", "55550207753", "82178537464"])
+        self.assertEqual(len(cpfs), 2)
+        self.assertEqual(cpfs.nbytes, 16)
+        self.assertEqual(list(cpfs), ["555.502.077-53", "821.785.374-64"])
+        self.assertEqual(len(CPFArray()), 0)
+
+        # Leading zeros are kept
+        self.assertEqual(list(CPFArray(["00000000191"])), ["000.000.001-91"])
+
+        with self.assertRaises(ValueError):
+            CPFArray(["82178537464", "82178537465"])
+
+        for cpf in (None, 82178537464, b"82178537464"):
+            with self.assertRaises(ValueError):
+                CPFArray([cpf])
+
+    def test_contains(self):
+        cpfs = CPFArray(generate_many(1_000, seed=1))
+
+        for cpf in generate_many(1_000, seed=1, formatted=True):
+            self.assertIn(cpf, cpfs)
+
+        self.assertNotIn("11144477735", cpfs)
+        self.assertNotIn("1114447773", cpfs)
+        self.assertNotIn("abc", cpfs)
+        self.assertNotIn(11144477735, cpfs)
+        # Digits of other scripts are not CPF digits
+        self.assertNotIn(
+            "\u0668\u0662\u0661\u0667\u0668\u0665\u0663\u0667\u0664\u0666\u0664",
+            CPFArray(["82178537464"]),
+        )
+        self.assertNotIn("11144477735", CPFArray())
+
+    def test_set_operations(self):
+        first = CPFArray(["11144477735", "82178537464", "55550207753"])
+        second = CPFArray(["82178537464", "00000000191"])
+
+        self.assertEqual(
+            list(first | second),
+            [
+                "000.000.001-91",
+                "111.444.777-35",
+                "555.502.077-53",
+                "821.785.374-64",
+            ],
+        )
+        self.assertEqual(list(first & second), ["821.785.374-64"])
+        self.assertEqual(
+            list(first - second), ["111.444.777-35", "555.502.077-53"]
+        )
+        self.assertEqual(list(second - first), ["000.000.001-91"])
+        self.assertEqual(first.union(CPFArray()), first)
+        self.assertEqual(len(first.intersection(CPFArray())), 0)
+        self.assertEqual(first.difference(first), CPFArray())
+
+    def test_set_operations_with_other_types(self):
+        cpfs = CPFArray(["11144477735", "82178537464"])
+
+        for operand in (["82178537464"], {"82178537464"}, "82178537464", None):
+            with self.assertRaises(TypeError):
+                cpfs | operand
+
+            with self.assertRaises(TypeError):
+                cpfs & operand
+
+            with self.assertRaises(TypeError):
+                cpfs - operand
+
+        self.assertEqual(
+            list(cpfs.union(["555.502.077-53"])),
+            ["111.444.777-35", "555.502.077-53", "821.785.374-64"],
+        )
+        self.assertEqual(
+            list(cpfs.intersection({"82178537464"})), ["821.785.374-64"]
+        )
+        self.assertEqual(
+            list(cpfs.difference(iter(["82178537464"]))), ["111.444.777-35"]
+        )
+
+        with self.assertRaises(ValueError):
+            cpfs.union(["123"])
+
+    def test_set_operations_match_python_sets(self):
+        first = list(generate_many(2_000, seed=1))
+        second = first[:500] + list(generate_many(2_000, seed=2))
+        first_array, second_array = CPFArray(first), CPFArray(second)
+
+        for result, expected in (
+            (first_array | second_array, set(first) | set(second)),
+            (first_array & second_array, set(first) & set(second)),
+            (first_array - second_array, set(first) - set(second)),
+        ):
+            self.assertEqual(result, CPFArray(expected))
+
+
 @patch("brutils.cpf.sieve")
 class TestRemoveSymbols(TestCase):
     def test_remove_symbols(self, mock_sieve):
@@ -0,0 +1,77 @@
+from unittest import TestCase, main
+
+from brutils.cnpj import generate as generate_cnpj
+from brutils.cpf import generate_many as generate_many_cpf
+from brutils.data.enums import DocumentType
+from brutils.document import classify_document, classify_document_many
+
+
+class TestClassifyDocument(TestCase):
+    def test_classify_document(self):
+        self.assertEqual(classify_document("82178537464"), DocumentType.CPF)
+        self.assertEqual(classify_document("821.785.374-64"), DocumentType.CPF)
+        self.assertEqual(
+            classify_document(" 821 785 374 / 64 "), DocumentType.CPF
+        )
+        self.assertEqual(classify_document("03560714000142"), DocumentType.CNPJ)
+        self.assertEqual(
+            classify_document("03.560.714/0001-42"), DocumentType.CNPJ
+        )
+        self.assertEqual(
+            classify_document("12.ABC.345/01DE-35"), DocumentType.CNPJ
+        )
+
+    def test_classify_invalid_document(self):
+        for raw in [
+            "",
+            "123",
+            "82178537465",
+            "11111111111",
+            "03560714000143",
+            "00000000000000",
+            "12.abc.345/01de-35",
+            "8217853746é4",
+            "821785374\ud8004",
+            "821785374640",
+            None,
+            82178537464,
+        ]:
+            with self.subTest(raw=raw):
+                self.assertEqual(classify_document(raw), DocumentType.INVALID)
+
+    def test_classify_document_many(self):
+        self.assertEqual(
+            classify_document_many(
+                ["82178537464", "03.560.714/0001-42", "123", None]
+            ),
+            [
+                DocumentType.CPF,
+                DocumentType.CNPJ,
+                DocumentType.INVALID,
+                DocumentType.INVALID,
+            ],
+        )
+        self.assertEqual(classify_document_many([]), [])
+        self.assertEqual(
+            classify_document_many(iter(["821.785.374-64"])),
+            [DocumentType.CPF],
+        )
+
+    def test_classify_document_many_matches_classify_document(self):
+        cpfs = list(generate_many_cpf(200, seed=5))
+        raws = [
+            raw
+            for cpf in cpfs
+            for raw in [cpf, cpf[:-1] + str(9 - int(cpf[-1])), generate_cnpj()]
+        ]
+
+        self.assertEqual(
+            classify_document_many(raws), list(map(classify_document, raws))
+        )
+        self.assertEqual(
+            classify_document_many(raws).count(DocumentType.INVALID), 200
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,11 +18,13 @@ def get_public_functions(module):
 
 
 def get_imported_methods(module):
-    """Get all names in the module's namespace."""
+    """Get all names in the module's namespace, except the classes."""
     return [
         name
         for name in dir(module)
-        if not is_private_function(name) and not is_standard_function(name)
+        if not is_private_function(name)
+        and not is_standard_function(name)
+        and not inspect.isclass(getattr(module, name))
     ]
 
 
@@ -116,6 +118,20 @@ class TestImports(unittest.TestCase):
                 f"Public method(s) missing from __all__: {missing_in_all}. You need to add the new brutils features methods names to the list __all__ in the brutils/__init__.py file"
             )
 
+    def test_public_classes_in_all(self):
+        """Test that all classes exported by __init__.py are in __all__."""
+        missing_in_all = {
+            name
+            for name in dir(self.init_module)
+            if not is_private_function(name)
+            and inspect.isclass(getattr(self.init_module, name))
+        } - set(self.public_methods_in_all)
+
+        if missing_in_all:
+            self.fail(
+                f"Public class(es) missing from __all__: {missing_in_all}"
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
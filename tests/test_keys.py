@@ -0,0 +1,32 @@
+from array import array
+from random import Random
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from brutils._keys import SortedKeyBuilder
+
+
+class TestSortedKeyBuilder(TestCase):
+    def test_build(self):
+        builder = SortedKeyBuilder()
+
+        for key in (3, 1, 3, 2, 2**64 - 1, 0):
+            builder.add(key)
+
+        self.assertEqual(builder.build(), array("Q", [0, 1, 2, 3, 2**64 - 1]))
+        self.assertEqual(SortedKeyBuilder().build(), array("Q"))
+
+    def test_build_merges_chunks(self):
+        rng = Random(1)
+        keys = [rng.randrange(1_000) for _ in range(5_000)]
+        builder = SortedKeyBuilder()
+
+        with patch("brutils._keys._CHUNK_SIZE", 64):
+            for key in keys:
+                builder.add(key)
+
+            self.assertEqual(builder.build(), array("Q", sorted(set(keys))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import csv
+from io import StringIO
+from unittest import TestCase, main
+
+from brutils.stream import clean_column
+
+
+class TestCleanColumn(TestCase):
+    def setUp(self):
+        self.csv = (
+            "name,document\n"
+            "Ana,821.785.374-64\n"
+            "Bia,555.502.077-53\n"
+            "Caio,123\n"
+            "Davi,11144477735\n"
+            "Eva,111.444.777-36\n"
+        )
+
+    def test_clean_column_with_reader(self):
+        reader = csv.reader(StringIO(self.csv))
+        next(reader)
+
+        self.assertEqual(
+            [row[1] for row in clean_column(reader, 1)],
+            [
+                "82178537464",
+                "55550207753",
+                "123",
+                "11144477735",
+                "11144477736",
+            ],
+        )
+
+    def test_clean_column_with_dict_reader(self):
+        reader = csv.DictReader(StringIO(self.csv))
+
+        self.assertEqual(
+            [
+                row["document"]
+                for row in clean_column(reader, "document", formatted=True)
+            ],
+            [
+                "821.785.374-64",
+                "555.502.077-53",
+                "123",
+                "111.444.777-35",
+                "11144477736",
+            ],
+        )
+
+    def test_clean_column_drop_invalid(self):
+        reader = csv.DictReader(StringIO(self.csv))
+
+        self.assertEqual(
+            [
+                row["name"]
+                for row in clean_column(reader, "document", drop_invalid=True)
+            ],
+            ["Ana", "Bia", "Davi"],
+        )
+
+    def test_clean_column_reports_chunks(self):
+        reports = []
+        reader = csv.DictReader(StringIO(self.csv))
+        rows = clean_column(
+            reader,
+            "document",
+            chunk_size=2,
+            on_chunk=lambda rows, invalid: reports.append((rows, invalid)),
+        )
+
+        self.assertEqual(len(list(rows)), 5)
+        self.assertEqual(reports, [(2, 0), (2, 1), (1, 1)])
+
+    def test_clean_column_with_short_rows(self):
+        reports = []
+        csv_text = "name,document\nAna,821.785.374-64\nBia\nCaio,123\n"
+
+        def on_chunk(rows, invalid):
+            reports.append((rows, invalid))
+
+        reader = csv.DictReader(StringIO(csv_text))
+        self.assertEqual(
+            list(clean_column(reader, "document", on_chunk=on_chunk)),
+            [
+                {"name": "Ana", "document": "82178537464"},
+                {"name": "Bia", "document": None},
+                {"name": "Caio", "document": "123"},
+            ],
+        )
+
+        reader = csv.reader(StringIO(csv_text))
+        next(reader)
+        self.assertEqual(
+            list(clean_column(reader, 1, on_chunk=on_chunk)),
+            [["Ana", "82178537464"], ["Bia"], ["Caio", "123"]],
+        )
+
+        reader = csv.reader(StringIO(csv_text))
+        next(reader)
+        self.assertEqual(
+            list(clean_column(reader, 1, drop_invalid=True, on_chunk=on_chunk)),
+            [["Ana", "82178537464"]],
+        )
+        self.assertEqual(reports, [(3, 2)] * 3)
+
+    def test_clean_column_is_lazy(self):
+        def rows():
+            yield ["82178537464"]
+            raise AssertionError("Consumed more rows than needed")
+
+        self.assertEqual(
+            next(clean_column(rows(), 0, chunk_size=1)), ["82178537464"]
+        )
+
+    def test_clean_column_cnpj(self):
+        rows = [["03.560.714/0001-42"], ["00.111.222/0001-33"]]
+
+        self.assertEqual(
+            list(clean_column(rows, 0, kind="cnpj", formatted=True)),
+            [["03.560.714/0001-42"], ["00111222000133"]],
+        )
+
+    def test_clean_column_with_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            clean_column([], 0, kind="pis")
+
+        with self.assertRaises(ValueError):
+            clean_column([], 0, chunk_size=0)
+
+
+if __name__ == "__main__":
+    main()